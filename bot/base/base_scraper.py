@@ -1,20 +1,132 @@
+import asyncio
+import hashlib
 import logging
-from playwright.sync_api import sync_playwright
+import traceback
+import multiprocessing
+import os
+import time
+from urllib.parse import urljoin
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+
+from bot.base.browser_session import (
+    CONTEXT_OPTIONS,
+    DEFAULT_PROFILE_GROUP,
+    AsyncBrowserProfiles,
+    AsyncBrowserSession,
+    BrowserProfiles,
+    BrowserSession,
+)
+from bot.base.http_fetcher import fetch_html
+from bot.base.page_pool import AsyncPagePool, PagePool
+from bot.base.request_blocker import (
+    BLOCKED_DOMAINS,
+    BLOCKED_RESOURCE_TYPES,
+    RequestBlocker,
+)
+from bot.base.row_store import row_fingerprint
+from bot.base.scrape_stats import ScrapeStats, run_report, write_report
+from bot.base.soup import DEFAULT_BACKEND, make_soup
+from bot.base.structured_data import find_listings
+from bot.base.title_classifier import classify_title
 
 
 logger = logging.getLogger(__name__)
 
+# "record" saves each scraper's browser traffic to a HAR, "replay" serves
+# it back from the HAR without touching the network
+HAR_MODES = ("record", "replay")
+
 
 class BaseScraper:
     """
     Base class for a web scraper.
 
+    Subclasses describe how their pages load through the class attributes
+    below and implement process_page, which hands each product row to
+    process_row, and extract_product_info. Sites that paginate through links
+    override get_next_url; sites that need clicks or scrolling before the
+    listing is complete override interact and interact_async. Sites that
+    embed their listings as JSON-LD or Next.js state set structured_data,
+    and are only parsed into soup when a page has none.
+
     Attributes:
         url (str): The URL to be scraped.
+        start_url (str): The URL the scrape started from.
         results (list): A list to hold the scraped data.
         browser (object): The browser object for web scraping.
+        pages (object): The PagePool or AsyncPagePool pages are taken from.
+        parser (callable): An async callable that takes over parsing in
+            scrape_async, set by ScraperBot.run_pipelined.
+        cache (HtmlCache): The cache pages are read from and stored in,
+            or None to always fetch.
+        row_store (RowStore): Where extracted rows are remembered between
+            runs, or None to extract every row.
+        known_rows (dict): The results and drop reasons of each row
+            fingerprint remembered from the last run.
+        rows_seen (dict): The results and drop reasons of each row
+            fingerprint seen on this run, or None when rows are not
+            remembered.
+        row_drops (list): The drop reasons of the row being extracted,
+            while rows are remembered, or None.
+        har_mode (str): "record" or "replay" to run the browser on a
+            context of its own that records to or replays from har_path,
+            or None.
+        har_path (str): The HAR file of this scraper.
+        stats (ScrapeStats): The phase timings and row counts of this run.
+        fetch_mode (str): "browser" to load pages in Chromium, or "http" for
+            server-rendered sites whose HTML can be fetched directly.
+        wait_until (str): The load state page.goto waits for.
+        wait_selector (str): A selector to wait for after navigation.
+        wait_selector_timeout (int): Timeout in ms for wait_selector.
+        wait_selector_state (str): The state wait_selector must reach.
+        settle_delay (int): Extra time in ms to wait before reading the page.
+        block_requests (bool): Whether to abort the requests described by
+            blocked_resource_types and blocked_domains.
+        blocked_resource_types (frozenset): Resource types to abort. Sites
+            that need images or styles to render override this.
+        blocked_domains (tuple): Third-party domains to abort.
+        parser_backend (str): The make_soup backend pages are parsed with.
+        parse_only (list): bs4-style (name, attrs) filters for the listing
+            container and pagination elements that process_page and
+            get_next_url read. Only those subtrees are parsed. None parses
+            the whole page.
+        cache_ttl (float): How long in seconds this site's cached pages
+            are used without asking the server. None uses the cache's ttl.
+        profile_group (str): The persistent browser profile this site runs
+            on when ScraperBot is given profiles. Sites whose cookies or
+            cache should be kept apart set a group of their own.
+        website (str): The site name stored with each result.
+        excluded_title_terms (tuple): Lowercase terms whose listings are
+            skipped, by accepts_title.
+        manufacturer_name (str): A fixed manufacturer for single-brand
+            sites. Otherwise it is looked up from the title.
+        round_count_pattern (re.Pattern): Matches the round count in the
+            title as group 1, for titles none of the shared round_count
+            patterns read.
+        structured_data (bool): Whether to read the listings from the
+            schema.org Products or Next.js state the page embeds before
+            parsing its HTML.
     """
 
+    fetch_mode = "browser"
+    wait_until = "load"
+    wait_selector = None
+    wait_selector_timeout = None
+    wait_selector_state = None
+    settle_delay = 0
+    blocked_resource_types = BLOCKED_RESOURCE_TYPES
+    blocked_domains = BLOCKED_DOMAINS
+    parser_backend = DEFAULT_BACKEND
+    parse_only = None
+    cache_ttl = None
+    profile_group = DEFAULT_PROFILE_GROUP
+    website = None
+    excluded_title_terms = ()
+    manufacturer_name = None
+    round_count_pattern = None
+    structured_data = False
+
     def __init__(self, url):
         """
         Initializes the BaseScraper with a URL.
@@ -23,13 +135,632 @@ class BaseScraper:
             url (str): The URL to be scraped.
         """
         self.url = url
+        self.start_url = url
         self.results = []
         self.browser = None
+        self.pages = None
+        self.block_requests = True
+        self.parser = None
+        self.cache = None
+        self.row_store = None
+        self.known_rows = {}
+        self.rows_seen = None
+        self.row_drops = None
+        self.har_mode = None
+        self.har_path = None
+        self.stats = ScrapeStats()
+
+    def get_request_blocker(self):
+        """
+        Builds the RequestBlocker for this scraper's pages.
+
+        Returns:
+            RequestBlocker: The blocker, or None if nothing is blocked.
+        """
+        if not self.block_requests:
+            return None
+        if not self.blocked_resource_types and not self.blocked_domains:
+            return None
+        return RequestBlocker(self.blocked_resource_types, self.blocked_domains)
+
+    @contextmanager
+    def open_page(self):
+        """
+        Takes a page from self.pages for the duration of a with block, with
+        this scraper's request blocking routed on it. Without a pool, the
+        page is opened on self.browser and closed afterwards. HAR pages
+        are opened on a context of their own, in a slot of the pool.
+
+        Yields:
+            playwright.sync_api.Page: The page to scrape with.
+        """
+        if self.pages is None:
+            self.pages = PagePool(self.browser, recycle=False)
+        if self.har_mode:
+            pages = self.open_har_page()
+        else:
+            pages = self.pages.page()
+        blocker = self.get_request_blocker()
+        with pages as page:
+            if blocker:
+                page.route("**/*", blocker.handle)
+            try:
+                yield page
+            finally:
+                if blocker and not page.is_closed():
+                    page.unroute("**/*", blocker.handle)
+
+    @asynccontextmanager
+    async def open_page_async(self):
+        """
+        Async counterpart of open_page.
+
+        Yields:
+            playwright.async_api.Page: The page to scrape with.
+        """
+        if self.pages is None:
+            self.pages = AsyncPagePool(self.browser, recycle=False)
+        if self.har_mode:
+            pages = self.open_har_page_async()
+        else:
+            pages = self.pages.page()
+        blocker = self.get_request_blocker()
+        async with pages as page:
+            if blocker:
+                await page.route("**/*", blocker.handle_async)
+            try:
+                yield page
+            finally:
+                if blocker and not page.is_closed():
+                    await page.unroute("**/*", blocker.handle_async)
+
+    def har_context_options(self):
+        """
+        Builds the options of the context a HAR is recorded or replayed on.
+
+        Returns:
+            dict: Keyword arguments for browser.new_context.
+        """
+        options = dict(CONTEXT_OPTIONS)
+        if self.har_mode == "record":
+            os.makedirs(os.path.dirname(self.har_path) or ".", exist_ok=True)
+            options["record_har_path"] = self.har_path
+        return options
+
+    @contextmanager
+    def open_har_page(self):
+        """
+        Opens a page on a context of its own, which records its traffic to
+        self.har_path or replays it from there. Requests missing from a
+        replayed HAR are aborted. A recorded HAR is written when the
+        context closes. The page holds a slot of self.pages while open.
+
+        Yields:
+            playwright.sync_api.Page: The page to scrape with.
+        """
+        with self.pages.reserved():
+            context = self.browser.browser.new_context(
+                **self.har_context_options()
+            )
+            try:
+                if self.har_mode == "replay":
+                    context.route_from_har(self.har_path, not_found="abort")
+                yield context.new_page()
+            finally:
+                context.close()
+
+    @asynccontextmanager
+    async def open_har_page_async(self):
+        """
+        Async counterpart of open_har_page.
+
+        Yields:
+            playwright.async_api.Page: The page to scrape with.
+        """
+        async with self.pages.reserved():
+            options = self.har_context_options()
+            context = await self.browser.browser.new_context(**options)
+            try:
+                if self.har_mode == "replay":
+                    await context.route_from_har(self.har_path, not_found="abort")
+                yield await context.new_page()
+            finally:
+                await context.close()
+
+    def wait_selector_options(self):
+        """
+        Builds the keyword arguments passed to page.wait_for_selector.
+
+        Returns:
+            dict: The timeout and state options that were set.
+        """
+        options = {}
+        if self.wait_selector_timeout is not None:
+            options["timeout"] = self.wait_selector_timeout
+        if self.wait_selector_state is not None:
+            options["state"] = self.wait_selector_state
+        return options
 
     def scrape(self):
         """
-        Abstract method to be implemented by subclasses to define
-        the scraping behavior.
+        Navigates to the URL, waits for the page to load, then processes
+        the page content to extract data. Follows get_next_url until it
+        returns None. Pages still fresh in self.cache are processed
+        without navigating.
+        """
+        if self.fetch_mode == "http":
+            if self.scrape_http() or self.browser is None:
+                return
+        if self.scrape_cached():
+            return
+        stats = self.stats
+        with self.open_page() as page:
+            while True:
+                stats.start_step(self.url, "browser")
+                try:
+                    with stats.phase("goto"):
+                        page.goto(self.url, wait_until=self.wait_until)
+                    if self.wait_selector:
+                        with stats.phase("wait_selector"):
+                            page.wait_for_selector(
+                                self.wait_selector, **self.wait_selector_options()
+                            )
+                except Exception as e:
+                    print(f"Unexpected error: {e} - {self.url} during page.goto")
+                    traceback.print_exc()
+                    stats.error("goto")
+                    stats.end_step()
+                    return
+                with stats.phase("interact"):
+                    self.interact(page)
+                if self.settle_delay:
+                    with stats.phase("settle"):
+                        page.wait_for_timeout(self.settle_delay)
+                with stats.phase("content"):
+                    html = page.content()
+                stats.read_html(html)
+                with stats.phase("store"):
+                    self.store_html(html)
+                url = self.process_html(html)
+                stats.end_step()
+                if not url:
+                    break
+                self.url = url
+
+    async def scrape_async(self):
+        """
+        Async counterpart of scrape, used when self.browser is a
+        playwright.async_api browser context.
+        """
+        if self.fetch_mode == "http":
+            if await self.scrape_http_async() or self.browser is None:
+                return
+        if await self.scrape_cached_async():
+            return
+        stats = self.stats
+        async with self.open_page_async() as page:
+            while True:
+                stats.start_step(self.url, "browser")
+                try:
+                    with stats.phase("goto"):
+                        await page.goto(self.url, wait_until=self.wait_until)
+                    if self.wait_selector:
+                        with stats.phase("wait_selector"):
+                            await page.wait_for_selector(
+                                self.wait_selector, **self.wait_selector_options()
+                            )
+                except Exception as e:
+                    print(f"Unexpected error: {e} - {self.url} during page.goto")
+                    traceback.print_exc()
+                    stats.error("goto")
+                    stats.end_step()
+                    return
+                with stats.phase("interact"):
+                    await self.interact_async(page)
+                if self.settle_delay:
+                    with stats.phase("settle"):
+                        await page.wait_for_timeout(self.settle_delay)
+                with stats.phase("content"):
+                    html = await page.content()
+                stats.read_html(html)
+                if self.cache is not None:
+                    with stats.phase("store"):
+                        await asyncio.to_thread(self.store_html, html)
+                url = await self.process_html_async(html)
+                stats.end_step()
+                if not url:
+                    break
+                self.url = url
+
+    def scrape_http(self):
+        """
+        Fetches the pages over a pooled requests.Session instead of the
+        browser and processes them the same way.
+
+        Returns:
+            bool: False if the first page could not be fetched, so the
+                browser should be tried instead.
+        """
+        stats = self.stats
+        first_page = True
+        while True:
+            stats.start_step(self.url, "http")
+            try:
+                with stats.phase("fetch"):
+                    html = fetch_html(self.url, cache=self.cache, ttl=self.cache_ttl)
+            except Exception as e:
+                print(f"Unexpected error: {e} - {self.url} during fetch_html")
+                traceback.print_exc()
+                stats.error("fetch")
+                stats.end_step()
+                return not first_page
+            first_page = False
+            stats.read_html(html)
+            url = self.process_html(html)
+            stats.end_step()
+            if not url:
+                return True
+            self.url = url
+
+    async def scrape_http_async(self):
+        """
+        Async counterpart of scrape_http. Requests run in a worker thread.
+
+        Returns:
+            bool: False if the first page could not be fetched, so the
+                browser should be tried instead.
+        """
+        stats = self.stats
+        first_page = True
+        while True:
+            stats.start_step(self.url, "http")
+            try:
+                with stats.phase("fetch"):
+                    html = await asyncio.to_thread(
+                        fetch_html, self.url, cache=self.cache, ttl=self.cache_ttl
+                    )
+            except Exception as e:
+                print(f"Unexpected error: {e} - {self.url} during fetch_html")
+                traceback.print_exc()
+                stats.error("fetch")
+                stats.end_step()
+                return not first_page
+            first_page = False
+            stats.read_html(html)
+            url = await self.process_html_async(html)
+            stats.end_step()
+            if not url:
+                return True
+            self.url = url
+
+    def scrape_cached(self):
+        """
+        Processes pages from self.cache, without opening a page, for as
+        long as they are fresh.
+
+        Returns:
+            bool: True if every page came from the cache.
+        """
+        if self.cache is None:
+            return False
+        while True:
+            with self.stats.phase("cache"):
+                html = self.cached_html()
+            if html is None:
+                return False
+            self.stats.start_step(self.url, "cache")
+            self.stats.read_html(html)
+            url = self.process_html(html)
+            self.stats.end_step()
+            if not url:
+                return True
+            self.url = url
+
+    async def scrape_cached_async(self):
+        """
+        Async counterpart of scrape_cached. Cache reads run in a worker
+        thread.
+
+        Returns:
+            bool: True if every page came from the cache.
+        """
+        if self.cache is None:
+            return False
+        while True:
+            with self.stats.phase("cache"):
+                html = await asyncio.to_thread(self.cached_html)
+            if html is None:
+                return False
+            self.stats.start_step(self.url, "cache")
+            self.stats.read_html(html)
+            url = await self.process_html_async(html)
+            self.stats.end_step()
+            if not url:
+                return True
+            self.url = url
+
+    def cached_html(self):
+        """
+        Looks up the rendered page for self.url in self.cache. Rendered
+        pages are only used while fresh: the validators of their document
+        response belong to the HTML shell, which stays the same when the
+        listings it renders change.
+
+        Returns:
+            str: The cached HTML, or None if the page must be loaded.
+        """
+        entry = self.cache.load(self.url, "browser")
+        if entry is None or not entry.is_fresh(self.cache_ttl or self.cache.ttl):
+            return None
+        return entry.body
+
+    def store_html(self, html):
+        """
+        Stores a rendered page in self.cache.
+
+        Args:
+            html (str): The page's HTML.
+        """
+        if self.cache is None:
+            return
+        self.cache.store(self.url, "browser", html)
+
+    def process_html(self, html):
+        """
+        Parses a page's HTML and extracts its product listings.
+
+        Args:
+            html (str): The page's HTML.
+
+        Returns:
+            str: The URL of the next page, or None on the last page.
+        """
+        stats = self.stats
+        kept = len(self.results)
+        try:
+            if self.structured_data:
+                with stats.phase("structured_data"):
+                    found = self.process_structured_data(html)
+                if found:
+                    # Single-page sites need no soup at all
+                    if type(self).get_next_url is BaseScraper.get_next_url:
+                        return None
+                    with stats.phase("parse"):
+                        soup = self.make_soup(html)
+                    with stats.phase("next_url"):
+                        return self.get_next_url(soup)
+            with stats.phase("parse"):
+                soup = self.make_soup(html)
+            with stats.phase("extract"):
+                self.process_page(soup)
+            with stats.phase("next_url"):
+                return self.get_next_url(soup)
+        finally:
+            stats.kept_rows(len(self.results) - kept)
+
+    def process_structured_data(self, html):
+        """
+        Extracts the product listings from the structured data a page
+        embeds, without parsing the page.
+
+        Args:
+            html (str): The page's HTML.
+
+        Returns:
+            bool: True if the page embeds listings, False if it has to be
+                parsed instead.
+        """
+        listings = find_listings(html)
+        if not listings:
+            return False
+        self.stats.found_rows(len(listings))
+        for listing in listings:
+            try:
+                self.extract_listing_info(listing)
+            except Exception as e:
+                print(
+                    f"Unexpected error: {e} - {self.url} during process_structured_data"
+                )
+                traceback.print_exc()
+                self.stats.error("structured_data")
+        return True
+
+    def extract_listing_info(self, listing):
+        """
+        Turns a structured data listing into a result and appends it to
+        self.results when it has a manufacturer and a round count. The
+        listing goes through the same accepts_title, manufacturer_name and
+        round_count_pattern as the site's product rows.
+
+        Args:
+            listing (dict): A listing record from find_listings.
+        """
+        if not self.accepts_title(listing["title"]):
+            return
+        title_class = classify_title(listing["title"], self.round_count_pattern)
+        manufacturer = self.manufacturer_name or title_class.manufacturer
+        if not manufacturer and listing["brand"]:
+            manufacturer = classify_title(listing["brand"]).manufacturer
+        if not manufacturer:
+            self.drop("manufacturer")
+            return
+        if not title_class.round_count:
+            self.drop("round_count")
+            return
+        result = {}
+        result["title"] = listing["title"]
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = manufacturer
+        result["link"] = listing["link"] and urljoin(self.url, listing["link"])
+        result["image"] = listing["image"] and urljoin(self.url, listing["image"])
+        result["website"] = self.website
+        result["original_price"] = f"{listing['price']:.2f}"
+        cpr = listing["price"] / title_class.round_count
+        result["cpr"] = f"{cpr:.2f}"
+        self.results.append(result)
+
+    def make_soup(self, html):
+        """
+        Parses HTML with this scraper's parser_backend, keeping only the
+        elements matched by parse_only.
+
+        Args:
+            html (str): The HTML to parse.
+
+        Returns:
+            object: The parsed document, with the BeautifulSoup find API.
+        """
+        return make_soup(html, self.parser_backend, self.parse_only)
+
+    async def process_html_async(self, html):
+        """
+        Hands a page's HTML to self.parser when one is set, or parses it
+        in place.
+
+        Args:
+            html (str): The page's HTML.
+
+        Returns:
+            str: The URL of the next page, or None on the last page.
+        """
+        if self.parser is None:
+            return self.process_html(html)
+        return await self.parser(self, html)
+
+    def interact(self, page):
+        """
+        Hook for clicking, scrolling or selecting on a loaded page before
+        its content is read. Does nothing by default.
+
+        Args:
+            page (playwright.sync_api.Page): The loaded page.
+        """
+
+    async def interact_async(self, page):
+        """
+        Async counterpart of interact.
+
+        Args:
+            page (playwright.async_api.Page): The loaded page.
+        """
+
+    def get_next_url(self, soup):
+        """
+        Finds the URL of the next results page. Single-page scrapers
+        keep the default.
+
+        Args:
+            soup (BeautifulSoup object): The parsed HTML of the page.
+
+        Returns:
+            str: The URL of the next page, or None on the last page.
+        """
+        return None
+
+    def load_rows(self):
+        """
+        Loads the rows remembered from the last run from self.row_store,
+        and starts recording the rows seen on this one.
+        """
+        if self.row_store is None:
+            return
+        self.known_rows = self.row_store.load(type(self), self.url, self.parser_backend)
+        self.rows_seen = {}
+
+    def save_rows(self):
+        """
+        Replaces the remembered rows with the rows seen on this run.
+        """
+        if self.row_store is None or self.rows_seen is None:
+            return
+        self.row_store.save(
+            type(self), self.start_url, self.parser_backend, self.rows_seen
+        )
+
+    def process_row(self, row):
+        """
+        Processes a single product listing to extract product info. When
+        rows are remembered, a row whose HTML has not changed since the
+        last run reuses its results instead of being extracted again, and
+        counts the drops it had then again.
+
+        Args:
+            row (bs4.element.Tag): The HTML element representing a product listing.
+        """
+        self.stats.found_rows(1)
+        fingerprint = None
+        if self.rows_seen is not None:
+            fingerprint = row_fingerprint(row)
+            known = self.known_rows.get(fingerprint)
+            if known is not None:
+                self.results.extend(dict(result) for result in known["results"])
+                for reason in known["drops"]:
+                    self.stats.dropped(reason)
+                self.rows_seen[fingerprint] = known
+                return
+            self.row_drops = []
+        start = len(self.results)
+        try:
+            self.extract_product_info(row)
+        except Exception as e:
+            print(f"Unexpected error: {e} - {self.url} during process_row")
+            traceback.print_exc()
+            self.stats.error("extract")
+            return
+        finally:
+            drops, self.row_drops = self.row_drops, None
+        if fingerprint is not None:
+            self.rows_seen[fingerprint] = {
+                "results": self.results[start:],
+                "drops": drops,
+            }
+
+    def accepts_title(self, title):
+        """
+        Decides whether a listing is kept, by its title.
+
+        Args:
+            title (str): The listing title.
+
+        Returns:
+            bool: False if the title contains an excluded term.
+        """
+        title = title.lower()
+        return not any(term in title for term in self.excluded_title_terms)
+
+    def drop(self, reason):
+        """
+        Records that a listing was left out of the results because it
+        lacked something a result needs.
+
+        Args:
+            reason (str): What it lacked, "manufacturer" or "round_count".
+        """
+        self.stats.dropped(reason)
+        if self.row_drops is not None:
+            self.row_drops.append(reason)
+
+    def extract_product_info(self, row):
+        """
+        Abstract method to be implemented by subclasses to extract one
+        product row and append its result to self.results.
+
+        Args:
+            row (bs4.element.Tag): The HTML element representing a product listing.
+
+        Raises:
+            NotImplementedError: If not overridden by a subclass.
+        """
+        raise NotImplementedError
+
+    def process_page(self, soup):
+        """
+        Abstract method to be implemented by subclasses to extract the
+        product listings from a parsed page.
+
+        Args:
+            soup (BeautifulSoup object): The parsed HTML of the page.
 
         Raises:
             NotImplementedError: If not overridden by a subclass.
@@ -37,22 +768,238 @@ class BaseScraper:
         raise NotImplementedError
 
 
+def parse_html(scraper_class, url, html, parser_backend=None, known_rows=None):
+    """
+    Parses a page on a fresh scraper. This is the job each parse worker
+    process runs for ScraperBot.run_pipelined.
+
+    Args:
+        scraper_class (type): The class of the scraper that fetched the page.
+        url (str): The URL the page was fetched from.
+        html (str): The page's HTML.
+        parser_backend (str, optional): The make_soup backend to parse with.
+        known_rows (dict, optional): The fetching scraper's remembered rows,
+            when it remembers rows.
+
+    Returns:
+        tuple: The extracted results, the URL of the next page, the rows
+            seen, or None when rows are not remembered, and the parse's
+            ScrapeStats.
+    """
+    scraper = scraper_class(url)
+    if parser_backend:
+        scraper.parser_backend = parser_backend
+    if known_rows is not None:
+        scraper.known_rows = known_rows
+        scraper.rows_seen = {}
+    next_url = scraper.process_html(html)
+    return scraper.results, next_url, scraper.rows_seen, scraper.stats
+
+
+def scraper_file_name(scraper, extension):
+    """
+    Names a file of a scraper's, like its HAR or profile, after its class
+    and start URL.
+
+    Args:
+        scraper (BaseScraper): The scraper.
+        extension (str): The file extension, e.g. "har".
+
+    Returns:
+        str: The file name.
+    """
+    url_hash = hashlib.sha256(scraper.start_url.encode("utf-8")).hexdigest()[:16]
+    return f"{type(scraper).__name__}-{url_hash}.{extension}"
+
+
+def run_shard(scrapers, use_async=False, concurrency=8, profile_dir=None):
+    """
+    Runs a shard of scrapers on a browser of its own. This is the entry
+    point of each worker process started by ScraperBot.run_sharded.
+
+    Args:
+        scrapers (list): The scraper objects in this shard.
+        use_async (bool, optional): Whether to drive the shard with run_async.
+        concurrency (int, optional): The concurrency limit for run_async.
+        profile_dir (str, optional): The shard's own directory of browser
+            profiles. None runs on a fresh context.
+
+    Returns:
+        list: The results list and ScrapeStats of each scraper, in shard
+            order.
+    """
+    if use_async:
+
+        async def run_async():
+            profiles = AsyncBrowserProfiles(profile_dir) if profile_dir else None
+            bot = ScraperBot(
+                scrapers=scrapers, concurrency=concurrency, profiles=profiles
+            )
+            try:
+                await bot.run_async()
+            finally:
+                if profiles:
+                    await profiles.close()
+
+        asyncio.run(run_async())
+    else:
+        profiles = BrowserProfiles(profile_dir) if profile_dir else None
+        bot = ScraperBot(scrapers=scrapers, concurrency=concurrency, profiles=profiles)
+        try:
+            bot.run()
+        finally:
+            if profiles:
+                profiles.close()
+    return [(scraper.results, scraper.stats) for scraper in scrapers]
+
+
 class ScraperBot:
     """
     Orchestrates the execution of multiple scrapers.
 
     Attributes:
         scrapers (list): A list of scraper objects.
+        concurrency (int): The maximum number of scrapers run_async drives
+            at once.
+        session (object): A started BrowserSession, or AsyncBrowserSession
+            for run_async, shared with other bots. When None, each run
+            launches and closes a browser of its own.
+        max_pages (int): The maximum number of pages run_async has open
+            at once, across every profile group. Defaults to concurrency.
+        profiles (object): BrowserProfiles, or AsyncBrowserProfiles for
+            run_async, to run each scraper on the persistent profile of its
+            profile_group. Takes the place of session.
+        report_path (str): Where each run writes its JSON report of the
+            time every scraper spent in each phase, or None.
+        metrics (Metrics): Where each finished scrape is counted, or None.
+        profiler (ScrapeProfiler): Profiles each scraper run writes to, or
+            None. Only run profiles its scrapers, since they run one after
+            another there.
     """
 
-    def __init__(self, scrapers=[]):
+    def __init__(
+        self,
+        scrapers=[],
+        concurrency=8,
+        session=None,
+        max_pages=None,
+        block_requests=None,
+        parser_backend=None,
+        cache=None,
+        row_store=None,
+        profiles=None,
+        har_dir=None,
+        har_mode=None,
+        report_path=None,
+        metrics=None,
+        profiler=None,
+    ):
         """
         Initializes the ScraperBot with a list of scraper objects.
 
         Args:
             scrapers (list, optional): A list of scraper objects.
+            concurrency (int, optional): The maximum number of scrapers
+                run_async drives at once.
+            session (object, optional): A started browser session to run on.
+            max_pages (int, optional): The maximum number of pages run_async
+                has open at once.
+            block_requests (bool, optional): Turns request blocking on or
+                off for every scraper. None leaves each scraper's setting.
+            parser_backend (str, optional): The make_soup backend for every
+                scraper. None leaves each scraper's setting.
+            cache (HtmlCache, optional): The page cache for every scraper.
+            row_store (RowStore, optional): Where every scraper remembers
+                its extracted rows.
+            profiles (object, optional): Persistent browser profiles to run
+                on, one per profile group.
+            har_dir (str, optional): The directory of each scraper's HAR.
+            har_mode (str, optional): "record" to save every scraper's
+                traffic to har_dir, or "replay" to serve it from there
+                without touching the network. Either way every scraper
+                loads its pages in the browser and skips the cache, so
+                the whole browser path is exercised.
+            report_path (str, optional): Where each run writes its JSON
+                report.
+            metrics (Metrics, optional): Where each finished scrape is
+                counted.
+            profiler (ScrapeProfiler, optional): Profiles each scrape of
+                run.
+
+        Raises:
+            ValueError: If har_mode is not one of HAR_MODES, is given
+                without har_dir, or with profiles, whose persistent contexts
+                cannot open the contexts HARs are recorded on.
         """
+        if har_mode is not None and (har_mode not in HAR_MODES or not har_dir):
+            raise ValueError(f"har_mode must be one of {HAR_MODES}, with a har_dir")
+        if har_mode is not None and profiles is not None:
+            raise ValueError("har_mode needs a browser without persistent profiles")
         self.scrapers = scrapers
+        self.concurrency = concurrency
+        self.session = session
+        self.profiles = profiles
+        self.max_pages = max_pages or concurrency
+        self.report_path = report_path
+        self.metrics = metrics
+        self.profiler = profiler
+        self.run_mode = None
+        for scraper in scrapers:
+            if block_requests is not None:
+                scraper.block_requests = block_requests
+            if parser_backend is not None:
+                scraper.parser_backend = parser_backend
+            if cache is not None:
+                scraper.cache = cache
+            if row_store is not None:
+                scraper.row_store = row_store
+            if har_mode is not None:
+                scraper.har_mode = har_mode
+                scraper.har_path = os.path.join(
+                    har_dir, scraper_file_name(scraper, "har")
+                )
+                scraper.fetch_mode = "browser"
+                scraper.cache = None
+
+    def profile_groups(self):
+        """
+        Groups the scrapers by profile_group, in scraper order.
+
+        Returns:
+            dict: The scrapers of each profile group.
+        """
+        groups = {}
+        for scraper in self.scrapers:
+            groups.setdefault(scraper.profile_group, []).append(scraper)
+        return groups
+
+    @contextmanager
+    def reporting(self, mode):
+        """
+        Times a run and writes its report to self.report_path when the with
+        block ends, even if a scraper failed. A run going through another
+        run method, like run_pipelined through run_async, is reported once.
+
+        Args:
+            mode (str): The method the run goes through.
+        """
+        if self.run_mode is not None:
+            yield
+            return
+        self.run_mode = mode
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.run_mode = None
+            if self.metrics is not None:
+                self.metrics.finish_run()
+            if self.report_path:
+                elapsed = time.perf_counter() - start
+                report = run_report(self.scrapers, mode, started_at, elapsed)
+                write_report(self.report_path, report)
+                print(f"Wrote run report to {self.report_path}")
 
     def run(self):
         """
@@ -63,25 +1010,264 @@ class ScraperBot:
         """
         all_results = []
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                extra_http_headers={
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    # "Upgrade-Insecure-Requests": "1",
-                    "Connection": "keep-alive",
-                },
-                viewport={"width": 1920, "height": 1080},
-            )
+        with self.reporting("run"):
+            if self.profiles is None:
+                self.run_on(self.session, self.scrapers)
+            else:
+                for group, scrapers in self.profile_groups().items():
+                    self.run_on(self.profiles.session(group), scrapers)
 
-            for scraper in self.scrapers:
+        for scraper in self.scrapers:
+            all_results.extend(scraper.results)
+
+        return all_results
+
+    def run_on(self, session, scrapers):
+        """
+        Executes scrapers one after another on a browser session.
+
+        Args:
+            session (BrowserSession): A started session, or None to launch
+                and close a browser of its own.
+            scrapers (list): The scraper objects to run.
+        """
+        owned = session is None
+        if owned:
+            session = BrowserSession().start()
+        pages = PagePool(session.context)
+        try:
+            for scraper in scrapers:
+                scraper.browser = session.context
+                scraper.pages = pages
+                start = time.perf_counter()
+                with scraper.stats.phase("load_rows"):
+                    scraper.load_rows()
+                if self.profiler is not None:
+                    self.profiler.run(scraper, scraper_file_name(scraper, "prof"))
+                else:
+                    scraper.scrape()
+                with scraper.stats.phase("save_rows"):
+                    scraper.save_rows()
+                scraper.stats.elapsed += time.perf_counter() - start
+                if self.metrics is not None:
+                    self.metrics.record(scraper)
+        finally:
+            pages.close()
+            if owned:
+                session.close()
+
+    async def run_async(self):
+        """
+        Executes the scrapers concurrently on a single async browser
+        context, at most self.concurrency at a time, and aggregates the
+        results in scraper order.
+
+        Returns:
+            list: A list of dictionaries containing the scraped data.
+        """
+        all_results = []
+
+        with self.reporting("run_async"):
+            await self.run_groups()
+
+        for scraper in self.scrapers:
+            all_results.extend(scraper.results)
+
+        return all_results
+
+    async def run_groups(self):
+        """
+        Runs the scrapers of run_async on self.session, or on the session
+        of each profile group.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        # One cap on open pages for the whole run, whatever the groups
+        page_semaphore = asyncio.Semaphore(self.max_pages)
+        page_pools = []
+
+        async def run_scraper(scraper, context, pages):
+            async with semaphore:
                 scraper.browser = context
-                scraper.scrape()
-                all_results.extend(scraper.results)
+                scraper.pages = pages
+                stats = scraper.stats
+                start = time.perf_counter()
+                try:
+                    with stats.phase("load_rows"):
+                        await asyncio.to_thread(scraper.load_rows)
+                    await scraper.scrape_async()
+                    with stats.phase("save_rows"):
+                        await asyncio.to_thread(scraper.save_rows)
+                except Exception as e:
+                    print(f"Unexpected error: {e} - {scraper.url} during scrape")
+                    traceback.print_exc()
+                    stats.error("scrape")
+                finally:
+                    stats.elapsed += time.perf_counter() - start
+                    if self.metrics is not None:
+                        self.metrics.record(scraper)
+
+        async def run_group(session, scrapers):
+            owned = session is None
+            if owned:
+                session = await AsyncBrowserSession().start()
+            pages = AsyncPagePool(
+                session.context,
+                max_pages=self.max_pages,
+                semaphore=page_semaphore,
+                pools=page_pools,
+            )
+            try:
+                await asyncio.gather(
+                    *(
+                        run_scraper(scraper, session.context, pages)
+                        for scraper in scrapers
+                    )
+                )
+            finally:
+                await pages.close()
+                if owned:
+                    await session.close()
+
+        if self.profiles is None:
+            await run_group(self.session, self.scrapers)
+        else:
+            groups = [
+                (await self.profiles.session(group), scrapers)
+                for group, scrapers in self.profile_groups().items()
+            ]
+            await asyncio.gather(
+                *(run_group(session, scrapers) for session, scrapers in groups)
+            )
+
+    def run_sharded(self, workers, use_async=False, profile_dir=None):
+        """
+        Splits the scrapers round-robin across worker processes, each of
+        which launches its own Chromium, and merges their results back in
+        scraper order. self.session and self.profiles are not shared with
+        the workers, since a profile can only be open in one browser.
+
+        Args:
+            workers (int): The number of worker processes.
+            use_async (bool, optional): Whether each worker drives its shard
+                with run_async.
+            profile_dir (str, optional): A directory of persistent browser
+                profiles. Each shard keeps its own under it, which stays
+                warm as long as the scrapers and workers do not change.
+
+        Returns:
+            list: A list of dictionaries containing the scraped data.
+
+        Raises:
+            ValueError: If profile_dir is given for scrapers in HAR mode.
+        """
+        if profile_dir and any(scraper.har_mode for scraper in self.scrapers):
+            raise ValueError("har_mode needs a browser without persistent profiles")
+        all_results = []
+        shards = [self.scrapers[i::workers] for i in range(workers)]
+        shards = [shard for shard in shards if shard]
 
-            browser.close()
+        with self.reporting("run_sharded"), ProcessPoolExecutor(
+            max_workers=len(shards) or 1,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    run_shard,
+                    shard,
+                    use_async,
+                    self.concurrency,
+                    os.path.join(profile_dir, f"shard-{i}") if profile_dir else None,
+                )
+                for i, shard in enumerate(shards)
+            ]
+            for shard, future in zip(shards, futures):
+                try:
+                    shard_results = future.result()
+                except Exception as e:
+                    print(f"Unexpected error: {e} - {len(shard)} scrapers in shard")
+                    traceback.print_exc()
+                    continue
+                for scraper, (results, stats) in zip(shard, shard_results):
+                    scraper.results = results
+                    scraper.stats = stats
+                    if self.metrics is not None:
+                        self.metrics.record(scraper)
+
+        for scraper in self.scrapers:
+            all_results.extend(scraper.results)
 
         return all_results
+
+    async def run_pipelined(self, parse_workers=None, queue_size=16):
+        """
+        Runs the scrapers like run_async, but moves parsing to a pool of
+        worker processes. The fetch stage puts raw HTML on a bounded
+        queue, so fetching pauses when parsing falls behind. Each scraper
+        waits only for its own page to be parsed before following the
+        next page link.
+
+        Args:
+            parse_workers (int, optional): The number of parse processes.
+                Defaults to the number of CPUs.
+            queue_size (int, optional): The number of fetched pages that
+                may wait for a parse worker.
+
+        Returns:
+            list: A list of dictionaries containing the scraped data.
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=queue_size)
+        parse_workers = parse_workers or multiprocessing.cpu_count()
+
+        async def parse_stage(executor):
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                scraper, url, html, next_url = item
+                remembers_rows = scraper.rows_seen is not None
+                try:
+                    results, url, rows_seen, stats = await loop.run_in_executor(
+                        executor,
+                        parse_html,
+                        type(scraper),
+                        url,
+                        html,
+                        scraper.parser_backend,
+                        scraper.known_rows if remembers_rows else None,
+                    )
+                    scraper.results.extend(results)
+                    scraper.stats.merge(stats)
+                    scraper.stats.kept_rows(len(results))
+                    if remembers_rows:
+                        scraper.rows_seen.update(rows_seen)
+                    next_url.set_result(url)
+                except Exception as e:
+                    print(f"Unexpected error: {e} - {url} during parse_html")
+                    traceback.print_exc()
+                    scraper.stats.error("parse")
+                    next_url.set_result(None)
+
+        async def enqueue(scraper, html):
+            next_url = loop.create_future()
+            await queue.put((scraper, scraper.url, html, next_url))
+            return await next_url
+
+        with self.reporting("run_pipelined"), ProcessPoolExecutor(
+            max_workers=parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            stages = [
+                asyncio.create_task(parse_stage(executor))
+                for _ in range(parse_workers)
+            ]
+            for scraper in self.scrapers:
+                scraper.parser = enqueue
+            try:
+                return await self.run_async()
+            finally:
+                for scraper in self.scrapers:
+                    scraper.parser = None
+                for _ in stages:
+                    await queue.put(None)
+                await asyncio.gather(*stages)
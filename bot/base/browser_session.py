@@ -0,0 +1,351 @@
+import asyncio
+import logging
+import os
+from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+CONTEXT_OPTIONS = {
+    "user_agent": USER_AGENT,
+    "extra_http_headers": {
+        "Accept": (
+            "text/html,application/xhtml+xml,application/xml;q=0.9,"
+            "image/webp,*/*;q=0.8"
+        ),
+        "Accept-Encoding": "gzip, deflate, br",
+        "Accept-Language": "en-US,en;q=0.5",
+        # "Upgrade-Insecure-Requests": "1",
+        "Connection": "keep-alive",
+    },
+    "viewport": {"width": 1920, "height": 1080},
+}
+
+# Chromium keeps its HTTP cache in the profile; bound it per profile
+PROFILE_ARGS = ["--disk-cache-size=268435456"]
+
+DEFAULT_PROFILE_GROUP = "default"
+
+
+class BrowserSession:
+    """
+    A Chromium browser and context that outlive a single ScraperBot run,
+    so several bots can share one browser start-up.
+
+    Use it as a context manager, or call start and close explicitly.
+
+    With a user_data_dir, the context is a persistent one on that Chromium
+    profile, so cookies, consent choices and the disk cache carry over to
+    the next run. Playwright bypasses the HTTP cache on pages with routes,
+    so cached scripts are only reused by scrapers with block_requests off.
+
+    Attributes:
+        headless (bool): Whether to launch Chromium headless.
+        context_options (dict): Keyword arguments for browser.new_context.
+        user_data_dir (str): The profile directory, or None for a fresh
+            context.
+        playwright (object): The running Playwright instance.
+        owns_playwright (bool): Whether the session started Playwright
+            itself, and so stops it on close.
+        browser (object): The launched Chromium browser. None on a
+            persistent context, which owns its browser.
+        context (object): The browser context handed to scrapers.
+    """
+
+    def __init__(
+        self, headless=True, context_options=None, user_data_dir=None, playwright=None
+    ):
+        """
+        Initializes the BrowserSession without launching anything.
+
+        Args:
+            headless (bool, optional): Whether to launch Chromium headless.
+            context_options (dict, optional): Keyword arguments for
+                browser.new_context. Defaults to CONTEXT_OPTIONS.
+            user_data_dir (str, optional): A profile directory to keep
+                between runs.
+            playwright (object, optional): A running Playwright instance
+                to launch on, which is left running on close.
+        """
+        self.headless = headless
+        self.context_options = context_options or CONTEXT_OPTIONS
+        self.user_data_dir = user_data_dir
+        self.playwright = playwright
+        self.owns_playwright = playwright is None
+        self.browser = None
+        self.context = None
+
+    def start(self):
+        """
+        Launches Chromium and opens the shared context.
+
+        Returns:
+            BrowserSession: The started session.
+        """
+        if self.owns_playwright:
+            self.playwright = sync_playwright().start()
+        if self.user_data_dir:
+            os.makedirs(self.user_data_dir, exist_ok=True)
+            self.context = self.playwright.chromium.launch_persistent_context(
+                self.user_data_dir,
+                headless=self.headless,
+                args=PROFILE_ARGS,
+                **self.context_options,
+            )
+            return self
+        self.browser = self.playwright.chromium.launch(headless=self.headless)
+        self.context = self.browser.new_context(**self.context_options)
+        return self
+
+    def close(self):
+        """
+        Closes the browser and stops Playwright.
+        """
+        if self.user_data_dir and self.context:
+            self.context.close()
+        if self.browser:
+            self.browser.close()
+        if self.playwright and self.owns_playwright:
+            self.playwright.stop()
+            self.playwright = None
+        self.browser = None
+        self.context = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+
+class AsyncBrowserSession:
+    """
+    Async counterpart of BrowserSession, built on playwright.async_api.
+
+    It must be started and closed on the event loop that runs the bots.
+
+    Attributes:
+        headless (bool): Whether to launch Chromium headless.
+        context_options (dict): Keyword arguments for browser.new_context.
+        user_data_dir (str): The profile directory, or None for a fresh
+            context.
+        playwright (object): The running Playwright instance.
+        owns_playwright (bool): Whether the session started Playwright
+            itself, and so stops it on close.
+        browser (object): The launched Chromium browser. None on a
+            persistent context, which owns its browser.
+        context (object): The browser context handed to scrapers.
+    """
+
+    def __init__(
+        self, headless=True, context_options=None, user_data_dir=None, playwright=None
+    ):
+        """
+        Initializes the AsyncBrowserSession without launching anything.
+
+        Args:
+            headless (bool, optional): Whether to launch Chromium headless.
+            context_options (dict, optional): Keyword arguments for
+                browser.new_context. Defaults to CONTEXT_OPTIONS.
+            user_data_dir (str, optional): A profile directory to keep
+                between runs.
+            playwright (object, optional): A running Playwright instance
+                to launch on, which is left running on close.
+        """
+        self.headless = headless
+        self.context_options = context_options or CONTEXT_OPTIONS
+        self.user_data_dir = user_data_dir
+        self.playwright = playwright
+        self.owns_playwright = playwright is None
+        self.browser = None
+        self.context = None
+
+    async def start(self):
+        """
+        Launches Chromium and opens the shared context.
+
+        Returns:
+            AsyncBrowserSession: The started session.
+        """
+        if self.owns_playwright:
+            self.playwright = await async_playwright().start()
+        if self.user_data_dir:
+            os.makedirs(self.user_data_dir, exist_ok=True)
+            self.context = await self.playwright.chromium.launch_persistent_context(
+                self.user_data_dir,
+                headless=self.headless,
+                args=PROFILE_ARGS,
+                **self.context_options,
+            )
+            return self
+        self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        self.context = await self.browser.new_context(**self.context_options)
+        return self
+
+    async def close(self):
+        """
+        Closes the browser and stops Playwright.
+        """
+        if self.user_data_dir and self.context:
+            await self.context.close()
+        if self.browser:
+            await self.browser.close()
+        if self.playwright and self.owns_playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        self.browser = None
+        self.context = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        await self.close()
+
+
+class BrowserProfiles:
+    """
+    Persistent BrowserSessions, one per profile group, each on its own
+    profile directory. A group's session is started the first time a
+    scraper of the group needs it and kept until close. Playwright is
+    started once for all of them, since the sync API cannot be started
+    twice in one thread.
+
+    Attributes:
+        directory (str): The directory holding one profile per group.
+        headless (bool): Whether to launch Chromium headless.
+        context_options (dict): Keyword arguments for the contexts.
+        playwright (object): The Playwright instance the sessions launch
+            on, or None before the first one.
+        sessions (dict): The started session of each group.
+    """
+
+    def __init__(self, directory, headless=True, context_options=None):
+        """
+        Initializes the BrowserProfiles without launching anything.
+
+        Args:
+            directory (str): The directory holding one profile per group.
+            headless (bool, optional): Whether to launch Chromium headless.
+            context_options (dict, optional): Keyword arguments for the
+                contexts. Defaults to CONTEXT_OPTIONS.
+        """
+        self.directory = directory
+        self.headless = headless
+        self.context_options = context_options
+        self.playwright = None
+        self.sessions = {}
+
+    def session(self, group=DEFAULT_PROFILE_GROUP):
+        """
+        Returns the session of a profile group, starting it if needed.
+
+        Args:
+            group (str, optional): The profile group.
+
+        Returns:
+            BrowserSession: The started session.
+        """
+        if group not in self.sessions:
+            if self.playwright is None:
+                self.playwright = sync_playwright().start()
+            self.sessions[group] = BrowserSession(
+                headless=self.headless,
+                context_options=self.context_options,
+                user_data_dir=os.path.join(self.directory, group),
+                playwright=self.playwright,
+            ).start()
+        return self.sessions[group]
+
+    def close(self):
+        """
+        Closes every started session, then stops Playwright.
+        """
+        for session in self.sessions.values():
+            session.close()
+        self.sessions = {}
+        if self.playwright:
+            self.playwright.stop()
+            self.playwright = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+
+class AsyncBrowserProfiles:
+    """
+    Async counterpart of BrowserProfiles, holding AsyncBrowserSessions.
+
+    Attributes:
+        directory (str): The directory holding one profile per group.
+        headless (bool): Whether to launch Chromium headless.
+        context_options (dict): Keyword arguments for the contexts.
+        playwright (object): The Playwright instance the sessions launch
+            on, or None before the first one.
+        sessions (dict): The started session of each group.
+    """
+
+    def __init__(self, directory, headless=True, context_options=None):
+        """
+        Initializes the AsyncBrowserProfiles without launching anything.
+
+        Args:
+            directory (str): The directory holding one profile per group.
+            headless (bool, optional): Whether to launch Chromium headless.
+            context_options (dict, optional): Keyword arguments for the
+                contexts. Defaults to CONTEXT_OPTIONS.
+        """
+        self.directory = directory
+        self.headless = headless
+        self.context_options = context_options
+        self.playwright = None
+        self.sessions = {}
+        self.lock = asyncio.Lock()
+
+    async def session(self, group=DEFAULT_PROFILE_GROUP):
+        """
+        Returns the session of a profile group, starting it if needed.
+
+        Args:
+            group (str, optional): The profile group.
+
+        Returns:
+            AsyncBrowserSession: The started session.
+        """
+        async with self.lock:
+            if group not in self.sessions:
+                if self.playwright is None:
+                    self.playwright = await async_playwright().start()
+                self.sessions[group] = await AsyncBrowserSession(
+                    headless=self.headless,
+                    context_options=self.context_options,
+                    user_data_dir=os.path.join(self.directory, group),
+                    playwright=self.playwright,
+                ).start()
+        return self.sessions[group]
+
+    async def close(self):
+        """
+        Closes every started session, then stops Playwright.
+        """
+        for session in self.sessions.values():
+            await session.close()
+        self.sessions = {}
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        await self.close()
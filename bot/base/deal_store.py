@@ -0,0 +1,276 @@
+import logging
+import sqlite3
+import time
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    link TEXT PRIMARY KEY,
+    title TEXT,
+    manufacturer TEXT,
+    website TEXT,
+    image TEXT,
+    steel_casing INTEGER,
+    remanufactured INTEGER,
+    original_price REAL,
+    cpr REAL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    last_changed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS listings_manufacturer ON listings (manufacturer);
+CREATE INDEX IF NOT EXISTS listings_website ON listings (website);
+CREATE INDEX IF NOT EXISTS listings_cpr ON listings (cpr);
+CREATE TABLE IF NOT EXISTS listing_calibers (
+    link TEXT NOT NULL,
+    caliber TEXT NOT NULL,
+    PRIMARY KEY (link, caliber)
+);
+CREATE INDEX IF NOT EXISTS listing_calibers_caliber ON listing_calibers (caliber);
+CREATE TABLE IF NOT EXISTS observations (
+    link TEXT NOT NULL,
+    observed_at REAL NOT NULL,
+    original_price REAL,
+    cpr REAL
+);
+CREATE INDEX IF NOT EXISTS observations_link ON observations (link, observed_at);
+"""
+
+# Databases from before a listing could belong to several calibers kept
+# its one caliber on the listing
+MIGRATE_CALIBERS = """
+BEGIN;
+INSERT OR IGNORE INTO listing_calibers (link, caliber)
+SELECT link, caliber FROM listings;
+DROP INDEX IF EXISTS listings_caliber;
+ALTER TABLE listings DROP COLUMN caliber;
+COMMIT;
+"""
+
+UPSERT = """
+INSERT INTO listings (
+    link, title, manufacturer, website, image, steel_casing, remanufactured,
+    original_price, cpr, first_seen, last_seen, last_changed
+)
+VALUES (
+    :link, :title, :manufacturer, :website, :image, :steel_casing,
+    :remanufactured, :original_price, :cpr, :observed_at, :observed_at,
+    :observed_at
+)
+ON CONFLICT (link) DO UPDATE SET
+    title = excluded.title,
+    manufacturer = excluded.manufacturer,
+    website = excluded.website,
+    image = excluded.image,
+    steel_casing = excluded.steel_casing,
+    remanufactured = excluded.remanufactured,
+    last_changed = CASE
+        WHEN listings.original_price IS excluded.original_price
+            AND listings.cpr IS excluded.cpr
+        THEN listings.last_changed
+        ELSE excluded.last_seen
+    END,
+    original_price = excluded.original_price,
+    cpr = excluded.cpr,
+    last_seen = excluded.last_seen
+"""
+
+# A listing routed to several calibers is linked to each of them
+LINK_CALIBER = """
+INSERT INTO listing_calibers (link, caliber) VALUES (:link, :caliber)
+ON CONFLICT DO NOTHING
+"""
+
+# Observations are recorded only for new listings and price or cpr changes.
+# Prices are per listing, so saving it again for another caliber with the
+# same price records nothing
+OBSERVE = """
+INSERT INTO observations (link, observed_at, original_price, cpr)
+SELECT :link, :observed_at, :original_price, :cpr
+WHERE NOT EXISTS (
+    SELECT 1 FROM listings
+    WHERE link = :link
+        AND original_price IS :original_price
+        AND cpr IS :cpr
+)
+"""
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class DealStore:
+    """
+    Keeps scraped deals in SQLite, one row per listing link, with the
+    calibers it was scraped for and the history of its price and cpr.
+
+    The database runs in WAL mode, so readers can query the latest deals
+    while a scrape writes. Results are written in batched transactions.
+
+    Attributes:
+        path (str): The database file.
+        batch_size (int): The number of listings written per transaction.
+        connection (sqlite3.Connection): The open connection.
+    """
+
+    def __init__(self, path, batch_size=500):
+        """
+        Opens the database, creating its tables if needed.
+
+        Args:
+            path (str): The database file.
+            batch_size (int, optional): Listings written per transaction.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        columns = self.connection.execute("PRAGMA table_info(listings)")
+        if "caliber" in {column["name"] for column in columns}:
+            self.connection.executescript(MIGRATE_CALIBERS)
+
+    def save(self, caliber, results, observed_at=None):
+        """
+        Upserts scraped results by link, links them to the caliber, and
+        records an observation for every new listing and every price or cpr
+        change. Saving the same link for several calibers keeps it under
+        each of them.
+
+        Args:
+            caliber (str): The caliber the results were scraped for.
+            results (list): The result dictionaries the scrapers produced.
+            observed_at (float, optional): The Unix timestamp of the scrape.
+                Defaults to now.
+
+        Returns:
+            int: The number of observations recorded.
+        """
+        observed_at = time.time() if observed_at is None else observed_at
+        # The same link can be listed on several pages; the last one wins
+        rows = {
+            result["link"]: {
+                "link": result["link"],
+                "caliber": caliber,
+                "title": result.get("title"),
+                "manufacturer": result.get("manufacturer"),
+                "website": result.get("website"),
+                "image": result.get("image"),
+                "steel_casing": int(bool(result.get("steel_casing"))),
+                "remanufactured": int(bool(result.get("remanufactured"))),
+                "original_price": to_float(result.get("original_price")),
+                "cpr": to_float(result.get("cpr")),
+                "observed_at": observed_at,
+            }
+            for result in results
+            if result.get("link")
+        }
+        rows = list(rows.values())
+        observed = 0
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            with self.connection:
+                before = self.connection.total_changes
+                self.connection.executemany(OBSERVE, batch)
+                observed += self.connection.total_changes - before
+                self.connection.executemany(UPSERT, batch)
+                self.connection.executemany(LINK_CALIBER, batch)
+        return observed
+
+    def latest(
+        self, caliber=None, manufacturer=None, website=None, since=None, limit=50
+    ):
+        """
+        Queries the cheapest current deals.
+
+        Args:
+            caliber (str, optional): Only listings of this caliber.
+            manufacturer (str, optional): Only listings of this manufacturer.
+            website (str, optional): Only listings of this website.
+            since (float, optional): Only listings seen at or after this
+                Unix timestamp.
+            limit (int, optional): The maximum number of listings.
+
+        Returns:
+            list: Listing dictionaries ordered by cpr, cheapest first.
+        """
+        clauses = ["cpr IS NOT NULL"]
+        params = []
+        if caliber is not None:
+            clauses.append(
+                "link IN (SELECT link FROM listing_calibers WHERE caliber = ?)"
+            )
+            params.append(caliber)
+        for column, value in (
+            ("manufacturer", manufacturer),
+            ("website", website),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("last_seen >= ?")
+            params.append(since)
+        query = (
+            f"SELECT * FROM listings WHERE {' AND '.join(clauses)} "
+            "ORDER BY cpr LIMIT ?"
+        )
+        rows = self.connection.execute(query, params + [limit])
+        return [dict(row) for row in rows]
+
+    def history(self, link):
+        """
+        Lists the price and cpr observations of a listing.
+
+        Args:
+            link (str): The listing's link.
+
+        Returns:
+            list: Observation dictionaries, oldest first.
+        """
+        rows = self.connection.execute(
+            "SELECT observed_at, original_price, cpr FROM observations "
+            "WHERE link = ? ORDER BY observed_at",
+            (link,),
+        )
+        return [dict(row) for row in rows]
+
+    def changes_by_website(self, since=None):
+        """
+        Counts the observations recorded per website, to see how often
+        each site's listings change.
+
+        Args:
+            since (float, optional): Only observations at or after this Unix
+                timestamp.
+
+        Returns:
+            dict: The number of observations of each website.
+        """
+        rows = self.connection.execute(
+            "SELECT listings.website, COUNT(*) FROM observations "
+            "JOIN listings ON listings.link = observations.link "
+            "WHERE observations.observed_at >= ? GROUP BY listings.website",
+            (since or 0,),
+        )
+        return {website: count for website, count in rows}
+
+    def close(self):
+        """
+        Closes the connection.
+        """
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
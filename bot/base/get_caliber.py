@@ -0,0 +1,48 @@
+import functools
+import re
+
+
+# The ways titles spell each caliber main.py scrapes, as regular expressions
+# on the lowercased title
+CALIBERS = {
+    "9mm Luger": [
+        r"9\s?mm(?!\s?(?:makarov|mak|major|kurz|short|browning))",
+        r"9\s?x\s?19",
+        r"9\s?luger",
+    ],
+    "5.56x45 NATO": [r"5\.56", r"223(?!\s?wssm)"],
+    "22 LR": [r"22\s?lr", r"22\s?long\s?rifle"],
+    "380 Auto": [r"380"],
+    "45 ACP": [r"45\s?acp", r"45\s?auto"],
+    "38 Special": [r"38\s?(?:special|spl|spcl|spec|sp\b)"],
+    "7.62x39mm": [r"7\.62\s?x\s?39"],
+}
+
+# One named group per caliber. Aliases must start a word and may not run on
+# into another number, so "9mm" does not match "19mm" nor "223" "2230".
+CALIBER_PATTERN = re.compile(
+    "|".join(
+        r"(?P<c%d>(?<!\w)(?:%s)(?!\d))" % (i, "|".join(aliases))
+        for i, aliases in enumerate(CALIBERS.values())
+    )
+)
+
+GROUP_CALIBERS = {f"c{i}": caliber for i, caliber in enumerate(CALIBERS)}
+
+
+@functools.lru_cache(maxsize=20000)
+def get_calibers(title):
+    """
+    Finds every caliber a product title names.
+
+    Args:
+        title (str): The product title.
+
+    Returns:
+        frozenset: The CALIBERS keys named in the title. Empty if it names
+            none of them.
+    """
+    return frozenset(
+        GROUP_CALIBERS[match.lastgroup]
+        for match in CALIBER_PATTERN.finditer(title.lower())
+    )
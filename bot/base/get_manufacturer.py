@@ -114,15 +114,50 @@ MANUFACTURERS = {
 }
 
 
+# The manufacturer of each alias. An alias listed under two manufacturers
+# belongs to the first, as the linear scan this replaced returned.
+ALIASES = {}
+for manufacturer, variations in MANUFACTURERS.items():
+    for variation in variations:
+        ALIASES.setdefault(variation, manufacturer)
+
+# Aliases must start a word, so "cia" does not match "special" and "arms"
+# does not match "firearms". They may end mid-word: "fed" is how most
+# titles spell Federal, "horn" Hornady and "win" Winchester.
+MANUFACTURER_PATTERN = re.compile(
+    r"(?<![a-z0-9])(?:%s)" % "|".join(re.escape(alias) for alias in ALIASES)
+)
+
+
 def get_manufacturer(title):
-    pattern = "|".join(
-        re.escape(variation)
-        for manufacturer, variations in MANUFACTURERS.items()
-        for variation in variations
-    )
-    match = re.search(pattern, title.lower(), re.IGNORECASE)
+    """
+    Finds the manufacturer named first in a product title.
+
+    Args:
+        title (str): The product title.
+
+    Returns:
+        str: The manufacturer, or None if the title names none.
+    """
+    match = MANUFACTURER_PATTERN.search(title.lower())
     if match:
-        for manufacturer, variations in MANUFACTURERS.items():
-            if match.group() in variations:
-                return manufacturer
+        return ALIASES[match.group()]
     return None
+
+
+def get_manufacturers(titles):
+    """
+    Finds the manufacturer of every title in a list.
+
+    Args:
+        titles (list): Product titles.
+
+    Returns:
+        list: The manufacturer of each title, or None where it names none.
+    """
+    search = MANUFACTURER_PATTERN.search
+    manufacturers = []
+    for title in titles:
+        match = search(title.lower())
+        manufacturers.append(ALIASES[match.group()] if match else None)
+    return manufacturers
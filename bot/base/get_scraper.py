@@ -1,89 +1,173 @@
-from bot.scrapers.sportsmansoutdoorsuperstore_scraper import (
-    SportsmansoutdoorsuperstoreScraper,
-)
-from bot.scrapers.palmetto_scraper import PalmettoScraper
-from bot.scrapers.targetsports_scraper import TargetsportsScraper
-from bot.scrapers.luckygunner_scraper import LuckygunnerScraper
-from bot.scrapers.warehouse2a_scraper import Warehouse2aScraper
-from bot.scrapers.nytactical_scraper import NytacticalScraper
-from bot.scrapers.miwallcorp_scraper import MiwallcorporationScraper
-from bot.scrapers.tundramichigan_scraper import TundramichiganScraper
-from bot.scrapers.finleyammo_scraper import FinleyammoScraper
-from bot.scrapers.cheapestammo_scraper import CheapestammoScraper
-from bot.scrapers.southernmunitions_scraper import SouthernmunitionsScraper
-from bot.scrapers.laxammo_scraper import LaxammoScraper
-from bot.scrapers.mackspw_scraper import MackspwScraper
-from bot.scrapers.lohmanarms_scraper import LohmanarmsScraper
-from bot.scrapers.sgammo_scraper import SgammoScraper
-from bot.scrapers.cheapammo_scraper import CheapammoScraper
-from bot.scrapers.aeammo_scraper import AeammoScraper
-from bot.scrapers.meadammo_scraper import MeadammoScraper
-from bot.scrapers.tacticalshit_scraper import TacticalshitScraper
-from bot.scrapers.lastshotaz_scraper import LastshotazScraper
-from bot.scrapers.tulammozone_scraper import TulammozoneScraper
-from bot.scrapers.outdoorlimited_scraper import OutdoorlimitedScraper
-from bot.scrapers.flipammo_scraper import FlipammoScraper
-from bot.scrapers.canoeclubusa_scraper import CanoeclubusaScraper
-from bot.scrapers.cabelas_scraper import CabelasScraper
-from bot.scrapers.ammunitiontogo_scraper import AmmunitiontogoScraper
-from bot.scrapers.ammoman_scraper import AmmomanScraper
-from bot.scrapers.bulkammo_scraper import BulkammoScraper
-from bot.scrapers.cheaperthandirt_scraper import CheaperthandirtScraper
-from bot.scrapers.ammodotcom_scraper import AmmodotcomScraper
-from bot.scrapers.topgunammo_scraper import TopgunammoScraper
-from bot.scrapers.agbammo_scraper import AgbammoScraper
-from bot.scrapers.gunprime_scraper import GunprimeScraper
-from bot.scrapers.gunbuyer_scraper import GunbuyerScraper
-from bot.scrapers.ables_scraper import AblesScraper
-from bot.scrapers.bulkmunitions_scraper import BulkmunitionsScraper
-from bot.scrapers.freedommunitions_scraper import FreedommunitionsScraper
-from bot.scrapers.gunmagwarehouse_scraper import GunmagwarehouseScraper
-from bot.scrapers.globalordnance_scraper import GlobalordnanceScraper
-from bot.scrapers.huntshootfish_scraper import HuntshootfishScraper
-from bot.scrapers.blackoutclub300_scraper import Blackoutclub300Scraper
-from bot.scrapers.floridagunexchange_scraper import FloridagunexchangeScraper
-from bot.scrapers.americanmarksman_scraper import AmericanmarksmanScraper
-from bot.scrapers.buckinghorseoutpost_scraper import BuckinghorseoutpostScraper
-from bot.scrapers.caliberarmory_scraper import CaliberarmoryScraper
-from bot.scrapers.venturamunitions_scraper import VenturamunitionsScraper
-from bot.scrapers.jgsales_scraper import JgsalesScraper
-from bot.scrapers.greentop_scraper import GreentopScraper
-from bot.scrapers.natchez_scraper import NatchezScraper
-from bot.scrapers.alamoammo_scraper import AlamoammoScraper
-from bot.scrapers.grabagun_scraper import GrabagunScraper
-from bot.scrapers.opticsplanet_scraper import OpticsplanetScraper
-from bot.scrapers.rivertownmunitions_scrapr import RivertownmunitionsScraper
-from bot.scrapers.surplusammo_scraper import SurplusammoScraper
-from bot.scrapers.kirammo_scraper import KirammoScraper
-from bot.scrapers.midsouthshooters_scraper import MidsouthshootersScraper
-from bot.scrapers.sportsmanfulfillment_scraper import SportsmanfulfillmentScraper
-from bot.scrapers.gunrunusa_scraper import GunrunusaScraper
-from bot.scrapers.sportsmansfinest_scraper import SportsmansfinestScraper
-from bot.scrapers.stunomma_scraper import StunommasportsScraper
-from bot.scrapers.gunnersoutlet_scraper import GunnersoutletScraper
-from bot.scrapers.thearmory_scraper import ThearmoryScraper
-from bot.scrapers.basspro_scraper import BassproScraper
-from bot.scrapers.ammomart_scraper import AmmomartScraper
-from bot.scrapers.getloadedpa_scraper import GetloadedpaScraper
-from bot.scrapers.botach_scraper import BotachScraper
-from bot.scrapers.abguns_scraper import AbgunsScraper
-from bot.scrapers.ammo4patriots_scraper import Ammo4patriotsScraper
-from bot.scrapers.ammobros_scraper import AmmobrosScraper
-from bot.scrapers.ammocitysupply_scraper import AmmocitysupplyScraper
-from bot.scrapers.ammofast_scraper import AmmofastScraper
-from bot.scrapers.ammojoy_scraper import AmmojoyScraper
-from bot.scrapers.astrasports_scraper import AstrasportsScraper
-from bot.scrapers.ammunitionplanet_scraper import AmmunitionplanetScraper
-from bot.scrapers.bulldogguns_scraper import BulldoggunsScraper
-from bot.scrapers.conkeysfirearms_scraper import ConkeysfirearmsScraper
-from bot.scrapers.collectorrifleandammo_scraper import CollectorrifleandammoScraper
-from bot.scrapers.clarkarmory_scraper import ClarkarmoryScraper
-from bot.scrapers.ammosupplywarehouse_scraper import AmmosupplywarehouseScraper
-from bot.scrapers.ammo2_scraper import Ammo2Scraper
-from bot.scrapers.ammunitiondepot_scraper import AmmunitiondepotScraper
+import functools
+import importlib
+import logging
 
-# Won't load items. Gives no results.
-# from bot.scrapers.gordyandsons_scraper import GordyandsonsScraper
+logger = logging.getLogger(__name__)
+
+# Maps each site key to the module and class of its scraper. Modules are only
+# imported when their site is first requested, so startup does not grow with
+# the number of supported sites.
+SCRAPERS = {
+    "sportsmansoutdoorsuperstore": (
+        "bot.scrapers.sportsmansoutdoorsuperstore_scraper",
+        "SportsmansoutdoorsuperstoreScraper",
+    ),
+    "palmetto": ("bot.scrapers.palmetto_scraper", "PalmettoScraper"),
+    "targetsports": ("bot.scrapers.targetsports_scraper", "TargetsportsScraper"),
+    "luckygunner": ("bot.scrapers.luckygunner_scraper", "LuckygunnerScraper"),
+    "warehouse2a": ("bot.scrapers.warehouse2a_scraper", "Warehouse2aScraper"),
+    "nytactical": ("bot.scrapers.nytactical_scraper", "NytacticalScraper"),
+    "miwallcorporation": (
+        "bot.scrapers.miwallcorp_scraper",
+        "MiwallcorporationScraper",
+    ),
+    "tundramichigan": ("bot.scrapers.tundramichigan_scraper", "TundramichiganScraper"),
+    "finleyammo": ("bot.scrapers.finleyammo_scraper", "FinleyammoScraper"),
+    "cheapestammo": ("bot.scrapers.cheapestammo_scraper", "CheapestammoScraper"),
+    "southernmunitions": (
+        "bot.scrapers.southernmunitions_scraper",
+        "SouthernmunitionsScraper",
+    ),
+    "laxammo": ("bot.scrapers.laxammo_scraper", "LaxammoScraper"),
+    "mackspw": ("bot.scrapers.mackspw_scraper", "MackspwScraper"),
+    "lohmanarms": ("bot.scrapers.lohmanarms_scraper", "LohmanarmsScraper"),
+    "sgammo": ("bot.scrapers.sgammo_scraper", "SgammoScraper"),
+    "cheapammo": ("bot.scrapers.cheapammo_scraper", "CheapammoScraper"),
+    "aeammo": ("bot.scrapers.aeammo_scraper", "AeammoScraper"),
+    "meadammo": ("bot.scrapers.meadammo_scraper", "MeadammoScraper"),
+    "tacticalshit": ("bot.scrapers.tacticalshit_scraper", "TacticalshitScraper"),
+    "lastshotaz": ("bot.scrapers.lastshotaz_scraper", "LastshotazScraper"),
+    "tulammozone": ("bot.scrapers.tulammozone_scraper", "TulammozoneScraper"),
+    "outdoorlimited": ("bot.scrapers.outdoorlimited_scraper", "OutdoorlimitedScraper"),
+    "flipammo": ("bot.scrapers.flipammo_scraper", "FlipammoScraper"),
+    "canoeclubusa": ("bot.scrapers.canoeclubusa_scraper", "CanoeclubusaScraper"),
+    "cabelas": ("bot.scrapers.cabelas_scraper", "CabelasScraper"),
+    "ammunitiontogo": ("bot.scrapers.ammunitiontogo_scraper", "AmmunitiontogoScraper"),
+    "ammoman": ("bot.scrapers.ammoman_scraper", "AmmomanScraper"),
+    "bulkammo": ("bot.scrapers.bulkammo_scraper", "BulkammoScraper"),
+    "cheaperthandirt": (
+        "bot.scrapers.cheaperthandirt_scraper",
+        "CheaperthandirtScraper",
+    ),
+    "ammodotcom": ("bot.scrapers.ammodotcom_scraper", "AmmodotcomScraper"),
+    "topgunammo": ("bot.scrapers.topgunammo_scraper", "TopgunammoScraper"),
+    "agbammo": ("bot.scrapers.agbammo_scraper", "AgbammoScraper"),
+    "gunprime": ("bot.scrapers.gunprime_scraper", "GunprimeScraper"),
+    "gunbuyer": ("bot.scrapers.gunbuyer_scraper", "GunbuyerScraper"),
+    "ables": ("bot.scrapers.ables_scraper", "AblesScraper"),
+    "bulkmunitions": ("bot.scrapers.bulkmunitions_scraper", "BulkmunitionsScraper"),
+    "freedommunitions": (
+        "bot.scrapers.freedommunitions_scraper",
+        "FreedommunitionsScraper",
+    ),
+    "gunmagwarehouse": (
+        "bot.scrapers.gunmagwarehouse_scraper",
+        "GunmagwarehouseScraper",
+    ),
+    "globalordnance": ("bot.scrapers.globalordnance_scraper", "GlobalordnanceScraper"),
+    "huntshootfish": ("bot.scrapers.huntshootfish_scraper", "HuntshootfishScraper"),
+    "blackoutclub300": (
+        "bot.scrapers.blackoutclub300_scraper",
+        "Blackoutclub300Scraper",
+    ),
+    "floridagunexchange": (
+        "bot.scrapers.floridagunexchange_scraper",
+        "FloridagunexchangeScraper",
+    ),
+    "americanmarksman": (
+        "bot.scrapers.americanmarksman_scraper",
+        "AmericanmarksmanScraper",
+    ),
+    "buckinghorseoutpost": (
+        "bot.scrapers.buckinghorseoutpost_scraper",
+        "BuckinghorseoutpostScraper",
+    ),
+    "caliberarmory": ("bot.scrapers.caliberarmory_scraper", "CaliberarmoryScraper"),
+    "venturamunitions": (
+        "bot.scrapers.venturamunitions_scraper",
+        "VenturamunitionsScraper",
+    ),
+    "jgsales": ("bot.scrapers.jgsales_scraper", "JgsalesScraper"),
+    "greentop": ("bot.scrapers.greentop_scraper", "GreentopScraper"),
+    "natchez": ("bot.scrapers.natchez_scraper", "NatchezScraper"),
+    "alamoammo": ("bot.scrapers.alamoammo_scraper", "AlamoammoScraper"),
+    "grabagun": ("bot.scrapers.grabagun_scraper", "GrabagunScraper"),
+    "opticsplanet": ("bot.scrapers.opticsplanet_scraper", "OpticsplanetScraper"),
+    "rivertownmunitions": (
+        "bot.scrapers.rivertownmunitions_scrapr",
+        "RivertownmunitionsScraper",
+    ),
+    "surplusammo": ("bot.scrapers.surplusammo_scraper", "SurplusammoScraper"),
+    "kirammo": ("bot.scrapers.kirammo_scraper", "KirammoScraper"),
+    "midsouthshooters": (
+        "bot.scrapers.midsouthshooters_scraper",
+        "MidsouthshootersScraper",
+    ),
+    "sportsmanfulfillment": (
+        "bot.scrapers.sportsmanfulfillment_scraper",
+        "SportsmanfulfillmentScraper",
+    ),
+    "gunrunusa": ("bot.scrapers.gunrunusa_scraper", "GunrunusaScraper"),
+    "sportsmansfinest": (
+        "bot.scrapers.sportsmansfinest_scraper",
+        "SportsmansfinestScraper",
+    ),
+    "stunommasports": ("bot.scrapers.stunomma_scraper", "StunommasportsScraper"),
+    "gunnersoutlet": ("bot.scrapers.gunnersoutlet_scraper", "GunnersoutletScraper"),
+    "thearmory": ("bot.scrapers.thearmory_scraper", "ThearmoryScraper"),
+    "basspro": ("bot.scrapers.basspro_scraper", "BassproScraper"),
+    "ammomart": ("bot.scrapers.ammomart_scraper", "AmmomartScraper"),
+    "getloadedpa": ("bot.scrapers.getloadedpa_scraper", "GetloadedpaScraper"),
+    "botach": ("bot.scrapers.botach_scraper", "BotachScraper"),
+    "abguns": ("bot.scrapers.abguns_scraper", "AbgunsScraper"),
+    "ammo4patriots": ("bot.scrapers.ammo4patriots_scraper", "Ammo4patriotsScraper"),
+    "ammobros": ("bot.scrapers.ammobros_scraper", "AmmobrosScraper"),
+    "ammocitysupply": ("bot.scrapers.ammocitysupply_scraper", "AmmocitysupplyScraper"),
+    "ammofast": ("bot.scrapers.ammofast_scraper", "AmmofastScraper"),
+    "ammojoy": ("bot.scrapers.ammojoy_scraper", "AmmojoyScraper"),
+    "astrasports": ("bot.scrapers.astrasports_scraper", "AstrasportsScraper"),
+    "ammunitionplanet": (
+        "bot.scrapers.ammunitionplanet_scraper",
+        "AmmunitionplanetScraper",
+    ),
+    "bulldogguns": ("bot.scrapers.bulldogguns_scraper", "BulldoggunsScraper"),
+    "conkeysfirearms": (
+        "bot.scrapers.conkeysfirearms_scraper",
+        "ConkeysfirearmsScraper",
+    ),
+    "collectorrifleandammo": (
+        "bot.scrapers.collectorrifleandammo_scraper",
+        "CollectorrifleandammoScraper",
+    ),
+    "clarkarmory": ("bot.scrapers.clarkarmory_scraper", "ClarkarmoryScraper"),
+    "ammosupplywarehouse": (
+        "bot.scrapers.ammosupplywarehouse_scraper",
+        "AmmosupplywarehouseScraper",
+    ),
+    "ammo2": ("bot.scrapers.ammo2_scraper", "Ammo2Scraper"),
+    "ammunitiondepot": (
+        "bot.scrapers.ammunitiondepot_scraper",
+        "AmmunitiondepotScraper",
+    ),
+    # Won't load items. Gives no results.
+    # "gordyandsons": ("bot.scrapers.gordyandsons_scraper", "GordyandsonsScraper"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_scraper_class(website_name):
+    """
+    Returns the scraper class of a website, importing its module on first use.
+
+    :param website_name: The site key, matched case-insensitively.
+    :return: The scraper class.
+    :raises ValueError: If no scraper is registered for the website name.
+    """
+    try:
+        module_name, class_name = SCRAPERS[website_name.lower()]
+    except KeyError:
+        raise ValueError(f"no scraper registered for {website_name}") from None
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def get_scraper(website_name, url):
@@ -93,10 +177,9 @@ def get_scraper(website_name, url):
     :param website_name: The name of the website for which to create a scraper.
     :param url: The URL at which to scrape data.
     :return: An instance of the appropriate scraper class.
-    :raises ValueError: If no scraper class is found for the given website name.
     """
     try:
-        scraper_class = globals().get(f"{website_name.capitalize()}Scraper")
+        scraper_class = get_scraper_class(website_name)
         return scraper_class(url)
     except Exception as e:
         print(f"Unexpected error: {e} - {url} during get_scraper")
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from bot.base.http_fetcher import HEADERS
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600
+
+# Request headers the sites may vary their pages on
+VARY_HEADERS = ("User-Agent", "Accept-Language")
+
+
+class CacheEntry:
+    """
+    A cached page and the validators its server sent with it.
+
+    Attributes:
+        key (str): The cache key the entry is stored under.
+        url (str): The URL the page was fetched from.
+        body (str): The page's HTML.
+        etag (str): The ETag response header, or None.
+        last_modified (str): The Last-Modified response header, or None.
+        fetched_at (float): When the page was fetched or last revalidated,
+            as a Unix timestamp.
+    """
+
+    def __init__(self, key, url, body, etag=None, last_modified=None, fetched_at=None):
+        """
+        Initializes the CacheEntry.
+
+        Args:
+            key (str): The cache key.
+            url (str): The URL the page was fetched from.
+            body (str): The page's HTML.
+            etag (str, optional): The ETag response header.
+            last_modified (str, optional): The Last-Modified response header.
+            fetched_at (float, optional): The fetch time. Defaults to now.
+        """
+        self.key = key
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+    def is_fresh(self, ttl):
+        """
+        Checks whether the entry can be used without asking the server.
+
+        Args:
+            ttl (float): The maximum age in seconds.
+
+        Returns:
+            bool: True if the entry is younger than ttl.
+        """
+        return time.time() - self.fetched_at < ttl
+
+    def validators(self):
+        """
+        Builds the conditional request headers for revalidating the entry.
+
+        Returns:
+            dict: If-None-Match and If-Modified-Since, for the validators
+                the server sent. Empty if it sent none.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HtmlCache:
+    """
+    Stores fetched pages on disk so repeated runs within a site's TTL do
+    not download them again. Stale pages are kept, so pages fetched over
+    HTTP whose server sent an ETag or Last-Modified header can be
+    revalidated instead of refetched. Rendered pages are stored without
+    validators and only used while fresh.
+
+    Each entry is a .html file with the body and a .json file with its
+    metadata, written atomically so sharded workers can share a directory.
+
+    Attributes:
+        directory (str): The directory entries are stored in.
+        ttl (float): The default maximum age of an entry in seconds.
+        vary (tuple): The values of VARY_HEADERS we send, which are part
+            of every key, since the same URL can render differently for them.
+    """
+
+    def __init__(self, directory, ttl=DEFAULT_TTL):
+        """
+        Initializes the HtmlCache, creating the directory if needed.
+
+        Args:
+            directory (str): The directory entries are stored in.
+            ttl (float, optional): The default maximum age in seconds.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.vary = tuple(HEADERS[header] for header in VARY_HEADERS)
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, url, variant):
+        """
+        Builds the cache key for a URL.
+
+        Args:
+            url (str): The page URL.
+            variant (str): How the page was fetched, e.g. "http" or
+                "browser", since a rendered page differs from the raw HTML.
+
+        Returns:
+            str: A hex digest naming the entry's files.
+        """
+        parts = "\n".join((variant, url) + self.vary)
+        return hashlib.sha256(parts.encode("utf-8")).hexdigest()
+
+    def path(self, key, suffix):
+        return os.path.join(self.directory, f"{key}{suffix}")
+
+    def load(self, url, variant):
+        """
+        Reads the entry for a URL, fresh or not.
+
+        Args:
+            url (str): The page URL.
+            variant (str): How the page was fetched.
+
+        Returns:
+            CacheEntry: The entry, or None if there is none or it is
+                unreadable.
+        """
+        key = self.key(url, variant)
+        try:
+            with open(self.path(key, ".json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(self.path(key, ".html"), encoding="utf-8") as f:
+                body = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read cache entry for {url}: {e}")
+            return None
+        return CacheEntry(
+            key,
+            url,
+            body,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            fetched_at=meta.get("fetched_at"),
+        )
+
+    def store(self, url, variant, body, etag=None, last_modified=None):
+        """
+        Writes a freshly fetched page.
+
+        Args:
+            url (str): The page URL.
+            variant (str): How the page was fetched.
+            body (str): The page's HTML.
+            etag (str, optional): The ETag response header.
+            last_modified (str, optional): The Last-Modified response header.
+
+        Returns:
+            CacheEntry: The stored entry.
+        """
+        entry = CacheEntry(self.key(url, variant), url, body, etag, last_modified)
+        try:
+            self.write(self.path(entry.key, ".html"), body)
+            self.write_meta(entry)
+        except OSError as e:
+            logger.debug(f"Could not write cache entry for {url}: {e}")
+        return entry
+
+    def touch(self, entry):
+        """
+        Marks an entry the server confirmed unchanged as fresh again.
+
+        Args:
+            entry (CacheEntry): The revalidated entry.
+        """
+        entry.fetched_at = time.time()
+        try:
+            self.write_meta(entry)
+        except OSError as e:
+            logger.debug(f"Could not update cache entry for {entry.url}: {e}")
+
+    def write_meta(self, entry):
+        meta = {
+            "url": entry.url,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "fetched_at": entry.fetched_at,
+        }
+        self.write(self.path(entry.key, ".json"), json.dumps(meta))
+
+    def write(self, path, text):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,112 @@
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from bot.base.browser_session import USER_AGENT
+
+
+logger = logging.getLogger(__name__)
+
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,"
+        "image/webp,*/*;q=0.8"
+    ),
+    # requests decodes gzip and deflate without extra packages
+    "Accept-Encoding": "gzip, deflate",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive",
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Returns the process-wide requests.Session, creating it on first use.
+    The session keeps connections alive per host and retries transient
+    failures.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=2,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+            )
+            adapter = HTTPAdapter(
+                pool_connections=32, pool_maxsize=32, max_retries=retry
+            )
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+def response_html(response):
+    """
+    Decodes a response body. requests falls back to ISO-8859-1 for text
+    responses that name no charset, which garbles UTF-8 titles, so the
+    encoding is detected from the body instead.
+
+    Args:
+        response (requests.Response): The response.
+
+    Returns:
+        str: The decoded body.
+    """
+    if "charset" not in response.headers.get("Content-Type", "").lower():
+        response.encoding = response.apparent_encoding
+    return response.text
+
+
+def fetch_html(url, timeout=30, cache=None, ttl=None):
+    """
+    Fetches a page with a plain HTTP GET.
+
+    With a cache, a fresh entry is returned without a request, and a
+    stale one is revalidated with its ETag or Last-Modified validators.
+
+    Args:
+        url (str): The URL to fetch.
+        timeout (int, optional): The timeout in seconds.
+        cache (HtmlCache, optional): The cache to read and store pages in.
+        ttl (float, optional): The maximum age of a cached page in seconds.
+            Defaults to the cache's ttl.
+
+    Returns:
+        str: The decoded response body.
+
+    Raises:
+        requests.RequestException: If the request fails or the response
+            status is an error.
+    """
+    entry = cache.load(url, "http") if cache else None
+    if entry and entry.is_fresh(ttl or cache.ttl):
+        return entry.body
+    headers = entry.validators() if entry else None
+    response = get_session().get(url, timeout=timeout, headers=headers)
+    if entry and response.status_code == 304:
+        cache.touch(entry)
+        return entry.body
+    response.raise_for_status()
+    html = response_html(response)
+    if cache:
+        cache.store(
+            url,
+            "http",
+            html,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+    return html
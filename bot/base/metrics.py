@@ -0,0 +1,299 @@
+import bisect
+import logging
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "ammoscraper"
+
+# Upper bounds in seconds of the latency histograms' buckets
+LOAD_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+PARSE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+SCRAPE_BUCKETS = (1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600)
+
+# The phases of a step that make up its page load, by source, and the ones
+# that make up its parse
+LOAD_PHASES = {
+    "browser": ("goto", "wait_selector", "interact", "settle", "content"),
+    "http": ("fetch",),
+    "cache": (),
+}
+PARSE_PHASES = ("structured_data", "parse", "extract", "next_url")
+
+HELP = {
+    "page_load_seconds": "Time to load a page, by where it came from.",
+    "parse_seconds": "Time to parse a page and extract its listings.",
+    "scrape_seconds": "Time a scraper ran for.",
+    "pages_total": "Pages read, by where they came from.",
+    "html_bytes_total": "Bytes of HTML read.",
+    "listings_found_total": "Product rows and listings handed to extraction.",
+    "listings_extracted_total": "Listings kept as results.",
+    "listings_dropped_total": "Listings dropped for lacking what a result needs.",
+    "errors_total": "Errors, by the phase they happened in.",
+    "runs_total": "Runs of the scrapers.",
+}
+
+
+def format_labels(labels):
+    """
+    Formats a metric's labels for the text exposition format.
+
+    Args:
+        labels (tuple): (name, value) pairs.
+
+    Returns:
+        str: The labels in braces, or "" if there are none.
+    """
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels
+    )
+    return f"{{{pairs}}}"
+
+
+class Histogram:
+    """
+    Counts observations into cumulative buckets, Prometheus style.
+
+    Attributes:
+        buckets (tuple): The upper bound of each bucket.
+        counts (list): The observations in each bucket, and a last one for
+            those above every bound.
+        sum (float): The sum of the observations.
+    """
+
+    def __init__(self, buckets):
+        """
+        Initializes an empty Histogram.
+
+        Args:
+            buckets (tuple): The upper bound of each bucket, ascending.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        """
+        Counts an observation into its bucket.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def lines(self, name, labels):
+        """
+        Renders the histogram's samples.
+
+        Args:
+            name (str): The metric name.
+            labels (tuple): The metric's (name, value) label pairs.
+
+        Returns:
+            list: The sample lines.
+        """
+        lines = []
+        total = 0
+        for bound, count in zip(self.buckets + ("+Inf",), self.counts):
+            total += count
+            bucket_labels = format_labels(labels + (("le", bound),))
+            lines.append(f"{name}_bucket{bucket_labels} {total}")
+        lines.append(f"{name}_sum{format_labels(labels)} {self.sum}")
+        lines.append(f"{name}_count{format_labels(labels)} {total}")
+        return lines
+
+
+class Metrics:
+    """
+    Collects counters and histograms per scraper from the ScrapeStats of
+    each finished scrape, and exposes them in the Prometheus text format,
+    as a file, over HTTP or both.
+
+    Counters only grow for as long as the process runs, so a scheduler
+    that runs the bot in one long-lived process gets rates and trends
+    from them.
+
+    Attributes:
+        path (str): The file the metrics are written to after each run, or
+            None. Point node_exporter's textfile collector at its directory.
+        counters (dict): The value of each (name, labels) counter.
+        histograms (dict): The Histogram of each (name, labels).
+        lock (threading.Lock): Guards the metrics against the HTTP server.
+        server (ThreadingHTTPServer): The server started by serve, or None.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initializes empty Metrics.
+
+        Args:
+            path (str, optional): The file to write the metrics to.
+        """
+        self.path = path
+        self.counters = {}
+        self.histograms = {}
+        self.lock = threading.Lock()
+        self.server = None
+
+    def inc(self, name, labels, value=1):
+        """
+        Adds to a counter. Callers hold self.lock.
+
+        Args:
+            name (str): The metric name, without PREFIX.
+            labels (tuple): The counter's (name, value) label pairs.
+            value (int, optional): The amount to add.
+        """
+        key = (name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, labels, value, buckets):
+        """
+        Adds an observation to a histogram, creating it on first use.
+        Callers hold self.lock.
+
+        Args:
+            name (str): The metric name, without PREFIX.
+            labels (tuple): The histogram's (name, value) label pairs.
+            value (float): The observed value.
+            buckets (tuple): The histogram's bucket bounds.
+        """
+        key = (name, labels)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(buckets)
+        histogram.observe(value)
+
+    def record(self, scraper):
+        """
+        Adds a finished scrape to the metrics.
+
+        Args:
+            scraper (BaseScraper): The scraper, after it ran.
+        """
+        stats = scraper.stats
+        site = (("scraper", type(scraper).__name__),)
+        with self.lock:
+            self.observe("scrape_seconds", site, stats.elapsed, SCRAPE_BUCKETS)
+            for step in stats.steps:
+                source = site + (("source", step["source"]),)
+                self.inc("pages_total", source)
+                load = sum(step.get(name, 0.0) for name in LOAD_PHASES[step["source"]])
+                if load:
+                    self.observe("page_load_seconds", source, load, LOAD_BUCKETS)
+                parse = sum(step.get(name, 0.0) for name in PARSE_PHASES)
+                self.observe("parse_seconds", site, parse, PARSE_BUCKETS)
+            self.inc("html_bytes_total", site, stats.html_bytes)
+            self.inc("listings_found_total", site, stats.rows_found)
+            self.inc("listings_extracted_total", site, len(scraper.results))
+            for reason, count in stats.drops.items():
+                self.inc("listings_dropped_total", site + (("reason", reason),), count)
+            for phase, count in stats.errors.items():
+                self.inc("errors_total", site + (("phase", phase),), count)
+
+    def finish_run(self):
+        """
+        Counts a finished run and writes the metrics to self.path.
+        """
+        with self.lock:
+            self.inc("runs_total", ())
+        if self.path:
+            self.write(self.path)
+
+    def render(self):
+        """
+        Renders the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition, one family after another.
+        """
+        families = {}
+        with self.lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                families.setdefault(name, ("counter", []))[1].append(
+                    f"{PREFIX}_{name}{format_labels(labels)} {value}"
+                )
+            for (name, labels), histogram in sorted(
+                self.histograms.items(), key=lambda item: item[0]
+            ):
+                families.setdefault(name, ("histogram", []))[1].extend(
+                    histogram.lines(f"{PREFIX}_{name}", labels)
+                )
+        lines = []
+        for name, (kind, samples) in families.items():
+            lines.append(f"# HELP {PREFIX}_{name} {HELP[name]}")
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """
+        Writes the metrics to a file, replacing it in one step so a
+        collector never reads half of it.
+
+        Args:
+            path (str): The file to write.
+        """
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write metrics {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def serve(self, port, host="127.0.0.1"):
+        """
+        Serves the metrics at /metrics from a daemon thread.
+
+        Args:
+            port (int): The port to listen on.
+            host (str, optional): The address to listen on.
+
+        Returns:
+            Metrics: self, for chaining.
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def close(self):
+        """
+        Stops the HTTP server, if one was started.
+        """
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
@@ -0,0 +1,260 @@
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager, contextmanager
+
+
+logger = logging.getLogger(__name__)
+
+
+class PagePool:
+    """
+    Hands out pages from a browser context and takes them back when a
+    scraper is done, so tabs never outlive the scrape that opened them.
+
+    Returned pages are either reset to about:blank and kept for the next
+    scraper, or closed. At most max_pages pages are in use at once; asking
+    for another blocks until one is returned.
+
+    Attributes:
+        context (object): The browser context pages are opened in.
+        max_pages (int): The maximum number of pages in use at once.
+        recycle (bool): Whether returned pages are reused or closed.
+        idle (list): Open pages waiting to be reused.
+        open_pages (int): The number of pages currently open.
+        semaphore (threading.Semaphore): Held by each page in use.
+    """
+
+    def __init__(self, context, max_pages=1, recycle=True):
+        """
+        Initializes the PagePool for a browser context.
+
+        Args:
+            context (object): The browser context pages are opened in.
+            max_pages (int, optional): The maximum number of pages in use at
+                once.
+            recycle (bool, optional): Whether returned pages are reused.
+        """
+        self.context = context
+        self.max_pages = max_pages
+        self.recycle = recycle
+        self.idle = []
+        self.open_pages = 0
+        self.semaphore = threading.Semaphore(max_pages)
+
+    @contextmanager
+    def page(self):
+        """
+        Yields a page once one is free and returns it to the pool
+        afterwards, also when the scrape raised.
+        """
+        with self.semaphore:
+            page = self.acquire()
+            try:
+                yield page
+            finally:
+                self.release(page)
+
+    @contextmanager
+    def reserved(self):
+        """
+        Holds a slot for a page opened outside the pool, like one on a HAR
+        context of its own, for the duration of a with block.
+        """
+        with self.semaphore:
+            self.open_pages += 1
+            try:
+                yield
+            finally:
+                self.open_pages -= 1
+
+    def acquire(self):
+        """
+        Takes an idle page, or opens one. Callers hold the semaphore.
+
+        Returns:
+            playwright.sync_api.Page: A blank page.
+        """
+        if self.idle:
+            return self.idle.pop()
+        page = self.context.new_page()
+        self.open_pages += 1
+        return page
+
+    def release(self, page):
+        """
+        Resets a page for reuse, or closes it.
+
+        Args:
+            page (playwright.sync_api.Page): The page to give back.
+        """
+        if self.recycle and not page.is_closed():
+            try:
+                page.goto("about:blank")
+                self.idle.append(page)
+                return
+            except Exception as e:
+                logger.debug(f"Could not recycle page: {e}")
+        self.discard(page)
+
+    def discard(self, page):
+        """
+        Closes a page and frees its slot.
+
+        Args:
+            page (playwright.sync_api.Page): The page to close.
+        """
+        self.open_pages -= 1
+        try:
+            if not page.is_closed():
+                page.close()
+        except Exception as e:
+            logger.debug(f"Could not close page: {e}")
+
+    def close(self):
+        """
+        Closes every idle page.
+        """
+        while self.idle:
+            self.discard(self.idle.pop())
+
+
+class AsyncPagePool:
+    """
+    Async counterpart of PagePool. Scrapers that ask for a page while
+    max_pages pages are in use wait until one is returned. Pools on
+    different contexts can share one semaphore and one list of pools, so
+    the cap holds across all of them: before a pool opens a page past
+    max_pages open ones, it closes idle pages of the other pools.
+
+    Attributes:
+        context (object): The browser context pages are opened in.
+        max_pages (int): The maximum number of pages open at once.
+        recycle (bool): Whether returned pages are reused or closed.
+        idle (list): Open pages waiting to be reused.
+        open_pages (int): The number of pages currently open.
+        semaphore (asyncio.Semaphore): Held by each page in use.
+        pools (list): Every pool sharing the cap, this one included.
+    """
+
+    def __init__(
+        self, context, max_pages=8, recycle=True, semaphore=None, pools=None
+    ):
+        """
+        Initializes the AsyncPagePool for a browser context.
+
+        Args:
+            context (object): The browser context pages are opened in.
+            max_pages (int, optional): The maximum number of pages open at
+                once.
+            recycle (bool, optional): Whether returned pages are reused.
+            semaphore (asyncio.Semaphore, optional): A semaphore shared
+                with other pools, which then caps the pages in use across
+                them instead of max_pages.
+            pools (list, optional): The list of the pools sharing
+                semaphore, which this pool adds itself to.
+        """
+        self.context = context
+        self.max_pages = max_pages
+        self.recycle = recycle
+        self.idle = []
+        self.open_pages = 0
+        self.semaphore = semaphore or asyncio.Semaphore(max_pages)
+        self.pools = pools if pools is not None else []
+        self.pools.append(self)
+
+    @asynccontextmanager
+    async def page(self):
+        """
+        Yields a page once one is free and returns it to the pool
+        afterwards, also when the scrape raised.
+        """
+        async with self.semaphore:
+            page = await self.acquire()
+            try:
+                yield page
+            finally:
+                await self.release(page)
+
+    @asynccontextmanager
+    async def reserved(self):
+        """
+        Holds a slot for a page opened outside the pool, like one on a HAR
+        context of its own, for the duration of a with block.
+        """
+        async with self.semaphore:
+            await self.make_room()
+            self.open_pages += 1
+            try:
+                yield
+            finally:
+                self.open_pages -= 1
+
+    async def acquire(self):
+        """
+        Takes an idle page, or opens one. Callers hold the semaphore.
+
+        Returns:
+            playwright.async_api.Page: A blank page.
+        """
+        if self.idle:
+            return self.idle.pop()
+        await self.make_room()
+        page = await self.context.new_page()
+        self.open_pages += 1
+        return page
+
+    async def make_room(self):
+        """
+        Closes idle pages of self.pools until another page can be opened
+        without going past max_pages. Callers hold the semaphore.
+        """
+        # Pages in use are capped by the semaphore, so any pages open past
+        # the cap are idle
+        for pool in self.pools:
+            while pool.idle and self.total_open_pages() >= self.max_pages:
+                await pool.discard(pool.idle.pop())
+
+    def total_open_pages(self):
+        """
+        Returns:
+            int: The number of pages open across self.pools.
+        """
+        return sum(pool.open_pages for pool in self.pools)
+
+    async def release(self, page):
+        """
+        Resets a page for reuse, or closes it.
+
+        Args:
+            page (playwright.async_api.Page): The page to give back.
+        """
+        if self.recycle and not page.is_closed():
+            try:
+                await page.goto("about:blank")
+                self.idle.append(page)
+                return
+            except Exception as e:
+                logger.debug(f"Could not recycle page: {e}")
+        await self.discard(page)
+
+    async def discard(self, page):
+        """
+        Closes a page and frees its slot.
+
+        Args:
+            page (playwright.async_api.Page): The page to close.
+        """
+        self.open_pages -= 1
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.debug(f"Could not close page: {e}")
+
+    async def close(self):
+        """
+        Closes every idle page.
+        """
+        while self.idle:
+            await self.discard(self.idle.pop())
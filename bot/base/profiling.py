@@ -0,0 +1,129 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP = 30
+
+# What a function's time counts towards, by the first pattern its file or,
+# for builtins, its name contains. The sync playwright API waits on the
+# driver in greenlet switches.
+CATEGORIES = (
+    ("playwright", ("/playwright/", "greenlet")),
+    ("bs4", ("/bs4/", "/soupsieve/")),
+    ("html parser", ("/html/parser.py", "/lxml/", "/html5lib/", "/selectolax/")),
+    ("regex", ("/re/", "/sre_", "re.Pattern", "re.Match")),
+    ("scrapers", ("/bot/",)),
+    ("network", ("/requests/", "/urllib3/", "/ssl.py", "socket")),
+)
+
+
+def category(key):
+    """
+    Tells what a profiled function's time counts towards.
+
+    Args:
+        key (tuple): The function's (file, line, name) key in pstats.
+
+    Returns:
+        str: One of the CATEGORIES names, or "other".
+    """
+    filename, _, name = key
+    where = name if filename == "~" else filename.replace(os.sep, "/")
+    for label, patterns in CATEGORIES:
+        if any(pattern in where for pattern in patterns):
+            return label
+    return "other"
+
+
+class ScrapeProfiler:
+    """
+    Profiles scrapes with cProfile, writing one .prof file per scraper,
+    and sums them up into a top functions summary.
+
+    Profiles are only meaningful for scrapers run one after another, since
+    cProfile profiles the whole thread.
+
+    Attributes:
+        directory (str): The directory the profiles are written to.
+        paths (list): The profile files written so far.
+    """
+
+    def __init__(self, directory):
+        """
+        Initializes the ScrapeProfiler, creating the directory if needed.
+
+        Args:
+            directory (str): The directory the profiles are written to.
+        """
+        self.directory = directory
+        self.paths = []
+        os.makedirs(directory, exist_ok=True)
+
+    def run(self, scraper, file_name):
+        """
+        Runs scraper.scrape under cProfile and writes its profile.
+
+        Args:
+            scraper (BaseScraper): The scraper to run.
+            file_name (str): The profile's file name.
+        """
+        profile = cProfile.Profile()
+        try:
+            profile.runcall(scraper.scrape)
+        finally:
+            path = os.path.join(self.directory, file_name)
+            profile.dump_stats(path)
+            self.paths.append(path)
+
+    def summary(self, top=DEFAULT_TOP):
+        """
+        Sums up the profiles written so far.
+
+        Args:
+            top (int, optional): The number of functions to list.
+
+        Returns:
+            str: The share of time spent in each category, and the top
+                functions by own time and by cumulative time.
+        """
+        if not self.paths:
+            return "No profiles"
+        stats = pstats.Stats(*self.paths, stream=io.StringIO())
+
+        totals = {}
+        for key, (_, _, own_time, _, _) in stats.stats.items():
+            label = category(key)
+            totals[label] = totals.get(label, 0.0) + own_time
+        total = sum(totals.values()) or 1.0
+        lines = [f"{len(self.paths)} profiles, {stats.total_tt:.2f}s", ""]
+        for label, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+            lines.append(f"{label:<12} {seconds:>9.2f}s {seconds / total:>6.1%}")
+
+        for sort in ("tottime", "cumulative"):
+            stream = io.StringIO()
+            stats.stream = stream
+            stats.sort_stats(sort).print_stats(top)
+            lines += ["", f"Top {top} functions by {sort}:", stream.getvalue()]
+        return "\n".join(lines)
+
+    def write_summary(self, top=DEFAULT_TOP):
+        """
+        Writes the summary to summary.txt in self.directory.
+
+        Args:
+            top (int, optional): The number of functions to list.
+
+        Returns:
+            str: The summary.
+        """
+        summary = self.summary(top)
+        with open(
+            os.path.join(self.directory, "summary.txt"), "w", encoding="utf-8"
+        ) as f:
+            f.write(summary)
+        return summary
@@ -0,0 +1,110 @@
+import logging
+from urllib.parse import urlsplit
+
+
+logger = logging.getLogger(__name__)
+
+# The scrapers only read HTML; image URLs come from src attributes.
+BLOCKED_RESOURCE_TYPES = frozenset(
+    ["image", "media", "font", "stylesheet", "texttrack", "eventsource", "manifest"]
+)
+
+BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "facebook.com",
+    "connect.facebook.net",
+    "bing.com",
+    "hotjar.com",
+    "clarity.ms",
+    "criteo.com",
+    "criteo.net",
+    "pinterest.com",
+    "tiktok.com",
+    "snapchat.com",
+    "twitter.com",
+    "ads-twitter.com",
+    "adroll.com",
+    "taboola.com",
+    "outbrain.com",
+    "quantserve.com",
+    "scorecardresearch.com",
+    "newrelic.com",
+    "nr-data.net",
+    "klaviyo.com",
+    "attentivemobile.com",
+    "zendesk.com",
+    "livechatinc.com",
+    "tawk.to",
+    "trustpilot.com",
+    "yotpo.com",
+)
+
+
+class RequestBlocker:
+    """
+    Aborts browser requests the scrapers never look at, by resource type
+    and by domain, to cut page load time and bandwidth. Other requests
+    fall back to the next route, such as a HAR being replayed.
+
+    Attributes:
+        resource_types (frozenset): Playwright resource types to abort.
+        domains (tuple): Domains whose requests, subdomains included, are
+            aborted.
+    """
+
+    def __init__(self, resource_types=BLOCKED_RESOURCE_TYPES, domains=BLOCKED_DOMAINS):
+        """
+        Initializes the RequestBlocker.
+
+        Args:
+            resource_types (iterable, optional): Resource types to abort.
+            domains (iterable, optional): Domains to abort.
+        """
+        self.resource_types = frozenset(resource_types)
+        self.domains = tuple(domains)
+
+    def should_block(self, request):
+        """
+        Decides whether a request is aborted.
+
+        Args:
+            request (playwright Request): The intercepted request.
+
+        Returns:
+            bool: True if the request should be aborted.
+        """
+        if request.resource_type in self.resource_types:
+            return True
+        host = urlsplit(request.url).hostname or ""
+        return any(
+            host == domain or host.endswith(f".{domain}") for domain in self.domains
+        )
+
+    def handle(self, route):
+        """
+        Route handler for playwright.sync_api pages.
+
+        Args:
+            route (playwright.sync_api.Route): The intercepted route.
+        """
+        if self.should_block(route.request):
+            route.abort()
+        else:
+            route.fallback()
+
+    async def handle_async(self, route):
+        """
+        Route handler for playwright.async_api pages.
+
+        Args:
+            route (playwright.async_api.Route): The intercepted route.
+        """
+        if self.should_block(route.request):
+            await route.abort()
+        else:
+            await route.fallback()
@@ -0,0 +1,120 @@
+import logging
+import re
+
+
+logger = logging.getLogger(__name__)
+
+# A whole number, with or without thousands separators, that is not part of
+# a decimal like the 56 in 5.56. The lookbehind comes after the first digit
+# so the pattern starts with a digit, which lets re skip ahead to digits.
+NUMBER = r"(\d(?<![\d.,]\d)(?:\d{0,2}(?:,\d{3})+|\d*))"
+
+ROUNDS = r"(?:rounds?|rds?|rnds?|cartridges?|count|ct|shells?)\b"
+BOXES = r"(?:boxes|bxs|packs|pks|cartons)\b"
+BOX = r"(?:box|bx|pack|pk|case|cs)"
+
+# What may follow a number to make it a count, tried in order, so the forms
+# that multiply boxes by their count come before the plain counts they start
+# with. The numbers of a form are multiplied together.
+COUNT_FORMS = (
+    # 50 rd box x 20, 50 rounds x 20 boxes
+    rf"\s*-?\s*{ROUNDS}\s*(?:{BOX}\b)?\s*x\s*{NUMBER}",
+    # 20 boxes of 50, 10 packs x 20
+    rf"\s*{BOXES}\s*(?:of|x|@)\s*{NUMBER}",
+    # 20 x 50 rounds, 10x20rd
+    rf"\s*x\s*{NUMBER}\s*-?\s*{ROUNDS}",
+    # 1,000 rounds, 50rd, 20-round, 100 count, 50 ct
+    rf"\s*-?\s*{ROUNDS}",
+    # 50/bx, 20 / box, 50 per box, 25/ct
+    rf"\s*(?:/|per)\s*(?:{BOX}|ct|rd)\b",
+    # 50pk, 20-pack, 50 box
+    rf"\s*-?\s*{BOX}\b",
+    # 50/ at the end of a count, but not 223/5.56
+    r"\s*/(?!\s*\d)",
+)
+
+COUNT_PATTERN = re.compile(
+    NUMBER + "(?:" + "|".join(f"({form})" for form in COUNT_FORMS) + ")",
+    re.IGNORECASE,
+)
+
+# Counts given after the container, for titles with none of COUNT_FORMS
+CONTAINER_PATTERN = re.compile(
+    # box of 50, case 1000, bucket of 500, x 50
+    rf"(?:\b(?:box|case|bucket|can|brick|pack)\s*(?:of\s*)?|(?<![\w.])x\s*){NUMBER}"
+    rf"(?![\d.]|\s*(?:{BOXES}|mm|gr|x))",
+    re.IGNORECASE,
+)
+
+
+def count_groups():
+    """
+    Maps the group of each COUNT_FORMS alternative to the groups of the
+    numbers it contains besides the leading one.
+
+    Returns:
+        dict: The number group indexes of each alternative's group index.
+    """
+    groups = {}
+    index = 2
+    for form in COUNT_FORMS:
+        inner = re.compile(form).groups
+        groups[index] = tuple(range(index + 1, index + 1 + inner))
+        index += 1 + inner
+    return groups
+
+
+# A matched alternative's group is the last to close, so match.lastindex
+# names it
+COUNT_GROUPS = count_groups()
+
+
+def to_int(number):
+    return int(number.replace(",", ""))
+
+
+def get_round_count(title, fallback=None):
+    """
+    Reads the number of rounds a listing is priced for from its title.
+
+    The title is scanned once for every form of count; the first count in
+    the title wins. Counts of boxes, like "20 boxes of 50" or "50 rd x 20",
+    are multiplied out. Titles without one are scanned for counts given
+    after their container, like "box of 50". classify_title memoizes the
+    results, since the same titles recur across pages and scrapes.
+
+    Args:
+        title (str): The product title.
+        fallback (re.Pattern, optional): A site pattern tried when none of
+            the shared ones match, with the round count as group 1.
+
+    Returns:
+        int: The round count, or None if the title has none.
+    """
+    match = COUNT_PATTERN.search(title)
+    if match:
+        count = to_int(match.group(1))
+        for group in COUNT_GROUPS[match.lastindex]:
+            count *= to_int(match.group(group))
+        return count or None
+    match = CONTAINER_PATTERN.search(title)
+    if match is None and fallback is not None:
+        match = fallback.search(title)
+    if match:
+        return to_int(match.group(1)) or None
+    return None
+
+
+def get_round_counts(titles, fallback=None):
+    """
+    Reads the round counts of several titles.
+
+    Args:
+        titles (iterable): The product titles.
+        fallback (re.Pattern, optional): A site pattern tried when none of
+            the shared ones match.
+
+    Returns:
+        list: The round count of each title, or None where there is none.
+    """
+    return [get_round_count(title, fallback) for title in titles]
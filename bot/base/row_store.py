@@ -0,0 +1,151 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+
+
+logger = logging.getLogger(__name__)
+
+# Modules whose code decides what a row extracts to, besides the scraper's own
+EXTRACTION_MODULES = (
+    "bot.base.get_manufacturer",
+    "bot.base.round_count",
+    "bot.base.structured_data",
+    "bot.base.title_classifier",
+)
+
+
+def row_fingerprint(row):
+    """
+    Hashes a product row's HTML.
+
+    Args:
+        row (object): A bs4 Tag or SelectolaxNode.
+
+    Returns:
+        str: A hex digest that changes whenever the row's markup does.
+    """
+    return hashlib.blake2b(str(row).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def source_version(names):
+    """
+    Hashes the source of modules, so what was computed with them can be
+    dropped when their code changes.
+
+    Args:
+        names (iterable): The module names. Modules not imported are
+            skipped.
+
+    Returns:
+        str: A hex digest of the modules' source files.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(names):
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if not path:
+            continue
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(name.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def extraction_version(scraper_class):
+    """
+    Hashes the source of every module that decides what a scraper's rows
+    extract to, so remembered rows are dropped when the code changes.
+
+    Args:
+        scraper_class (type): The scraper class.
+
+    Returns:
+        str: A hex digest of the modules' source files.
+    """
+    names = {cls.__module__ for cls in scraper_class.__mro__ if cls is not object}
+    return source_version(names.union(EXTRACTION_MODULES))
+
+
+class RowStore:
+    """
+    Remembers what each product row extracted to, keyed on the row's
+    fingerprint, so unchanged rows are not extracted again on the next run.
+
+    Each scraper class and start URL gets a JSON file holding the rows seen
+    on its last run. Rows that disappeared from the site are dropped when
+    the file is rewritten.
+
+    Attributes:
+        directory (str): The directory the files are stored in.
+    """
+
+    def __init__(self, directory):
+        """
+        Initializes the RowStore, creating the directory if needed.
+
+        Args:
+            directory (str): The directory the files are stored in.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, scraper_class, url):
+        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{scraper_class.__name__}-{url_hash}.json")
+
+    def version(self, scraper_class, parser_backend):
+        return f"{extraction_version(scraper_class)}-{parser_backend}"
+
+    def load(self, scraper_class, url, parser_backend):
+        """
+        Reads the rows remembered for a scraper.
+
+        Args:
+            scraper_class (type): The scraper class.
+            url (str): The URL the scraper starts from.
+            parser_backend (str): The make_soup backend rows are parsed with.
+
+        Returns:
+            dict: The extracted results and drop reasons of each row
+                fingerprint. Empty if there is no file or the extraction
+                code changed since.
+        """
+        try:
+            with open(self.path(scraper_class, url), encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read rows of {scraper_class.__name__}: {e}")
+            return {}
+        if data.get("version") != self.version(scraper_class, parser_backend):
+            return {}
+        return data.get("rows", {})
+
+    def save(self, scraper_class, url, parser_backend, rows):
+        """
+        Replaces the rows remembered for a scraper.
+
+        Args:
+            scraper_class (type): The scraper class.
+            url (str): The URL the scraper starts from.
+            parser_backend (str): The make_soup backend rows are parsed with.
+            rows (dict): The extracted results and drop reasons of each row
+                fingerprint.
+        """
+        data = {"version": self.version(scraper_class, parser_backend), "rows": rows}
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path(scraper_class, url))
+        except OSError as e:
+            logger.debug(f"Could not write rows of {scraper_class.__name__}: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
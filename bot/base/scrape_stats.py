@@ -0,0 +1,251 @@
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeStats:
+    """
+    Times the phases of a scraper's run and counts what it read and kept.
+
+    Phases are timed by wall clock, so in async runs they include the time
+    spent waiting on other scrapers. Each page of a paginated scrape gets a
+    step of its own besides the scraper's totals.
+
+    Attributes:
+        elapsed (float): The seconds the scraper ran for.
+        phases (dict): The seconds spent in each phase.
+        steps (list): One dict per page read, with its URL, where it came
+            from, its size, its rows and the seconds of each phase.
+        html_bytes (int): The bytes of HTML read.
+        rows_found (int): The product rows and structured data listings
+            handed to extraction.
+        drops (dict): The number of listings dropped for each reason, like
+            "manufacturer" or "round_count" for a missing one.
+        errors (dict): The number of errors in each phase.
+        step (dict): The step phases are currently added to, or None
+            between pages.
+    """
+
+    def __init__(self):
+        """
+        Initializes empty ScrapeStats.
+        """
+        self.elapsed = 0.0
+        self.phases = {}
+        self.steps = []
+        self.html_bytes = 0
+        self.rows_found = 0
+        self.drops = {}
+        self.errors = {}
+        self.step = None
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Times the body of a with block as a phase. Works around awaits too.
+
+        Args:
+            name (str): The phase name, e.g. "goto" or "parse".
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds):
+        """
+        Adds time to a phase, and to the current step's.
+
+        Args:
+            name (str): The phase name.
+            seconds (float): The time spent.
+        """
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        if self.step is not None:
+            self.step[name] = self.step.get(name, 0.0) + seconds
+
+    def start_step(self, url, source):
+        """
+        Starts the step of a page, which the phases timed until end_step
+        are added to.
+
+        Args:
+            url (str): The page's URL.
+            source (str): "browser", "http" or "cache".
+        """
+        self.step = {
+            "url": url,
+            "source": source,
+            "html_bytes": 0,
+            "rows_found": 0,
+            "rows_kept": 0,
+        }
+        self.steps.append(self.step)
+
+    def end_step(self):
+        """
+        Ends the current step.
+        """
+        self.step = None
+
+    def read_html(self, html):
+        """
+        Counts the bytes of a page's HTML.
+
+        Args:
+            html (str): The page's HTML.
+        """
+        size = len(html.encode("utf-8"))
+        self.html_bytes += size
+        if self.step is not None:
+            self.step["html_bytes"] += size
+
+    def found_rows(self, count):
+        """
+        Counts rows handed to extraction.
+
+        Args:
+            count (int): The number of rows.
+        """
+        self.rows_found += count
+        if self.step is not None:
+            self.step["rows_found"] += count
+
+    def kept_rows(self, count):
+        """
+        Counts the results kept from the current step's page.
+
+        Args:
+            count (int): The number of results.
+        """
+        if self.step is not None:
+            self.step["rows_kept"] += count
+
+    def dropped(self, reason):
+        """
+        Counts a listing dropped for lacking what a result needs.
+
+        Args:
+            reason (str): What it lacked, e.g. "manufacturer".
+        """
+        self.drops[reason] = self.drops.get(reason, 0) + 1
+
+    def error(self, phase):
+        """
+        Counts an error.
+
+        Args:
+            phase (str): The phase it happened in, e.g. "goto".
+        """
+        self.errors[phase] = self.errors.get(phase, 0) + 1
+
+    def merge(self, other):
+        """
+        Adds the phases, rows, drops and errors of another ScrapeStats,
+        like a parse worker's, to this one and its current step.
+
+        Args:
+            other (ScrapeStats): The stats to add.
+        """
+        for name, seconds in other.phases.items():
+            self.add(name, seconds)
+        self.found_rows(other.rows_found)
+        for reason, count in other.drops.items():
+            self.drops[reason] = self.drops.get(reason, 0) + count
+        for phase, count in other.errors.items():
+            self.errors[phase] = self.errors.get(phase, 0) + count
+
+    def report(self, scraper):
+        """
+        Summarizes the stats of a scraper's run.
+
+        Args:
+            scraper (BaseScraper): The scraper these stats belong to.
+
+        Returns:
+            dict: The scraper's totals, phases and steps.
+        """
+        return {
+            "scraper": type(scraper).__name__,
+            "website": scraper.website,
+            "url": scraper.start_url,
+            "elapsed": self.elapsed,
+            "pages": len(self.steps),
+            "html_bytes": self.html_bytes,
+            "rows_found": self.rows_found,
+            "rows_kept": len(scraper.results),
+            "drops": dict(self.drops),
+            "errors": dict(self.errors),
+            "phases": dict(self.phases),
+            "steps": self.steps,
+        }
+
+
+def run_report(scrapers, mode, started_at, elapsed):
+    """
+    Builds the report of a run, slowest scraper first.
+
+    Args:
+        scrapers (list): The scrapers that ran.
+        mode (str): The ScraperBot method the run went through.
+        started_at (float): The run's start, as a Unix timestamp.
+        elapsed (float): The seconds the run took.
+
+    Returns:
+        dict: The run's totals and the report of each scraper.
+    """
+    sites = sorted(
+        (scraper.stats.report(scraper) for scraper in scrapers),
+        key=lambda site: site["elapsed"],
+        reverse=True,
+    )
+    phases, drops, errors = {}, {}, {}
+    for site in sites:
+        for name, seconds in site["phases"].items():
+            phases[name] = phases.get(name, 0.0) + seconds
+        for reason, count in site["drops"].items():
+            drops[reason] = drops.get(reason, 0) + count
+        for phase, count in site["errors"].items():
+            errors[phase] = errors.get(phase, 0) + count
+    return {
+        "started_at": started_at,
+        "mode": mode,
+        "elapsed": elapsed,
+        "scrapers": len(sites),
+        "pages": sum(site["pages"] for site in sites),
+        "html_bytes": sum(site["html_bytes"] for site in sites),
+        "rows_found": sum(site["rows_found"] for site in sites),
+        "rows_kept": sum(site["rows_kept"] for site in sites),
+        "drops": drops,
+        "errors": errors,
+        "phases": phases,
+        "sites": sites,
+    }
+
+
+def write_report(path, report):
+    """
+    Writes a run report as JSON, replacing the file in one step.
+
+    Args:
+        path (str): The file to write.
+        report (dict): A report from run_report.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not write run report {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
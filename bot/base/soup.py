@@ -0,0 +1,238 @@
+import logging
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = "html.parser"
+
+# Backends BeautifulSoup builds trees with; lxml and html5lib are optional
+BS4_BACKENDS = ("html.parser", "lxml", "html5lib")
+
+# A lexbor-based parser behind the SelectolaxNode adapter; optional
+SELECTOLAX_BACKEND = "selectolax"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+def make_soup(html, backend=DEFAULT_BACKEND, parse_only=None):
+    """
+    Parses HTML with the given backend. Backends whose package is not
+    installed fall back to html.parser.
+
+    Args:
+        html (str): The HTML to parse.
+        backend (str, optional): One of BS4_BACKENDS or SELECTOLAX_BACKEND.
+        parse_only (list, optional): (name, attrs) filters, as passed to
+            find, for the elements to build the tree from. Everything
+            outside them is skipped while parsing. html5lib and selectolax
+            ignore it.
+
+    Returns:
+        object: A BeautifulSoup object, or a SelectolaxNode exposing the
+            same find, find_all, select_one, get and text subset.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend == SELECTOLAX_BACKEND:
+        if LexborHTMLParser is not None:
+            return SelectolaxNode(LexborHTMLParser(html))
+        logger.warning("selectolax is not installed, using html.parser")
+        backend = DEFAULT_BACKEND
+    if backend not in BS4_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    strainer = None
+    # html5lib builds the whole tree regardless, and warns about parse_only
+    if parse_only and backend != "html5lib":
+        strainer = SoupStrainer(ElementFilter(parse_only))
+    try:
+        return BeautifulSoup(html, backend, parse_only=strainer)
+    except FeatureNotFound:
+        logger.warning(f"{backend} is not installed, using html.parser")
+        return BeautifulSoup(html, DEFAULT_BACKEND, parse_only=strainer)
+
+
+class ElementFilter:
+    """
+    Matches tags against a list of bs4-style (name, attrs) filters while
+    the parser reads them, for use as a SoupStrainer name.
+
+    A class filter matches a single class, or the whole class attribute
+    when it lists several, like find does.
+
+    Attributes:
+        filters (list): (name, attrs) filters with class whitespace normalized.
+    """
+
+    def __init__(self, filters):
+        """
+        Initializes the ElementFilter.
+
+        Args:
+            filters (list): (name, attrs) filters, as passed to find.
+        """
+        self.filters = []
+        for name, attrs in filters:
+            attrs = dict(attrs or {})
+            if "class" in attrs:
+                attrs["class"] = " ".join(attrs["class"].split())
+            self.filters.append((name, attrs))
+
+    def __call__(self, name, attrs):
+        for filter_name, filter_attrs in self.filters:
+            if filter_name and filter_name != name:
+                continue
+            if all(
+                self.attr_matches(attr, attrs.get(attr), value)
+                for attr, value in filter_attrs.items()
+            ):
+                return True
+        return False
+
+    @staticmethod
+    def attr_matches(attr, actual, expected):
+        if actual is None:
+            return False
+        if attr != "class":
+            return actual == expected
+        classes = actual if isinstance(actual, list) else actual.split()
+        if " " in expected:
+            return " ".join(classes) == expected
+        return expected in classes
+
+
+def css_string(value):
+    """
+    Quotes a value for use in a CSS attribute selector.
+
+    Args:
+        value (str): The attribute value.
+
+    Returns:
+        str: The quoted value.
+    """
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def build_selector(name, attrs):
+    """
+    Translates a bs4 find filter into a CSS selector plus the checks CSS
+    cannot express.
+
+    bs4 matches a class filter either against a single class or against
+    the whole class attribute; the selector requires every listed class
+    and the returned check compares the whole attribute.
+
+    Args:
+        name (str): The tag name, or None for any tag.
+        attrs (dict): Attribute filters, or None.
+
+    Returns:
+        tuple: The CSS selector and the whole class value to compare, or
+            None.
+    """
+    selector = name or "*"
+    whole_class = None
+    for attr, value in (attrs or {}).items():
+        if attr == "class":
+            classes = value.split()
+            if len(classes) > 1:
+                whole_class = " ".join(classes)
+            selector += "".join(f"[class~={css_string(c)}]" for c in classes)
+        else:
+            selector += f"[{attr}={css_string(value)}]"
+    return selector, whole_class
+
+
+class SelectolaxNode:
+    """
+    Wraps a selectolax lexbor node, or the parsed document, in the part of
+    the BeautifulSoup Tag API the scrapers use.
+
+    Attributes:
+        node (object): The wrapped selectolax node or parser.
+    """
+
+    __slots__ = ("node",)
+
+    def __init__(self, node):
+        """
+        Initializes the SelectolaxNode.
+
+        Args:
+            node (object): A selectolax node or LexborHTMLParser.
+        """
+        self.node = node
+
+    def _iter_matches(self, name, attrs):
+        selector, whole_class = build_selector(name, attrs)
+        own_id = getattr(self.node, "mem_id", None)
+        for node in self.node.css(selector):
+            # Lexbor includes the node itself; bs4 searches descendants only
+            if own_id is not None and node.mem_id == own_id:
+                continue
+            if whole_class is not None:
+                value = node.attributes.get("class") or ""
+                if " ".join(value.split()) != whole_class:
+                    continue
+            yield SelectolaxNode(node)
+
+    def find(self, name=None, attrs=None):
+        """
+        Returns the first descendant matching a bs4-style filter, or None.
+        """
+        return next(self._iter_matches(name, attrs), None)
+
+    def find_all(self, name=None, attrs=None):
+        """
+        Returns every descendant matching a bs4-style filter.
+        """
+        return list(self._iter_matches(name, attrs))
+
+    def select_one(self, selector):
+        """
+        Returns the first descendant matching a CSS selector, or None.
+        """
+        node = self.node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def select(self, selector):
+        """
+        Returns every descendant matching a CSS selector.
+        """
+        return [SelectolaxNode(node) for node in self.node.css(selector)]
+
+    def get(self, attr, default=None):
+        """
+        Returns an attribute's value, or default if it is missing.
+        """
+        attributes = self.node.attributes
+        if attr not in attributes:
+            return default
+        value = attributes[attr]
+        return "" if value is None else value
+
+    def __str__(self):
+        return self.node.html
+
+    def __getitem__(self, attr):
+        value = self.get(attr)
+        if value is None:
+            raise KeyError(attr)
+        return value
+
+    @property
+    def name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        return self.node.text(deep=True)
+
+    def get_text(self, separator="", strip=False):
+        return self.node.text(deep=True, separator=separator, strip=strip)
@@ -0,0 +1,298 @@
+import logging
+from bs4 import SoupStrainer
+
+from bot.base.base_scraper import BaseScraper
+from bot.base.get_manufacturer import get_manufacturer
+from bot.base.soup import SelectolaxNode
+from bot.base.title_classifier import classify_title
+
+
+logger = logging.getLogger(__name__)
+
+
+class Step:
+    """
+    One bs4-style (name, attrs) filter, compiled into a SoupStrainer so
+    find does not rebuild it for every row.
+
+    Attributes:
+        name (str): The tag name, or None for any tag.
+        attrs (dict): Attribute filters.
+        strainer (SoupStrainer): The compiled filter used on bs4 trees.
+    """
+
+    __slots__ = ("name", "attrs", "strainer")
+
+    def __init__(self, name, attrs=None):
+        """
+        Initializes the Step.
+
+        Args:
+            name (str): The tag name, or None for any tag.
+            attrs (dict, optional): Attribute filters, as passed to find.
+        """
+        self.name = name
+        self.attrs = attrs or {}
+        self.strainer = SoupStrainer(name, self.attrs)
+
+    def find(self, node):
+        """
+        Returns the first descendant of node matching the filter, or None.
+        """
+        if isinstance(node, SelectolaxNode):
+            return node.find(self.name, self.attrs)
+        return node.find(self.strainer)
+
+    def find_all(self, node):
+        """
+        Returns every descendant of node matching the filter.
+        """
+        if isinstance(node, SelectolaxNode):
+            return node.find_all(self.name, self.attrs)
+        return node.find_all(self.strainer)
+
+
+class Chain:
+    """
+    A sequence of Steps followed like soup.find(...).find(...).
+
+    Attributes:
+        steps (tuple): The compiled steps, outermost first.
+    """
+
+    __slots__ = ("steps",)
+
+    def __init__(self, spec):
+        """
+        Initializes the Chain from a spec.
+
+        Args:
+            spec (tuple | list): A single (name, attrs) filter, or a list
+                of them from the outermost element inwards.
+        """
+        if isinstance(spec[0], str) or spec[0] is None:
+            spec = [spec]
+        self.steps = tuple(Step(*step) for step in spec)
+
+    def find(self, node):
+        """
+        Follows every step from node.
+
+        Returns:
+            object: The innermost element, or None if a step found nothing.
+        """
+        for step in self.steps:
+            node = step.find(node)
+            if node is None:
+                return None
+        return node
+
+    def find_all(self, node):
+        """
+        Follows every step but the last with find, then returns all the
+        matches of the last step.
+
+        Returns:
+            list: The matching elements, or an empty list.
+        """
+        for step in self.steps[:-1]:
+            node = step.find(node)
+            if node is None:
+                return []
+        return self.steps[-1].find_all(node)
+
+
+def compile_spec(spec):
+    """
+    Compiles an optional selector spec.
+
+    Args:
+        spec (tuple | list): A (name, attrs) filter or a list of them, or None.
+
+    Returns:
+        Chain: The compiled chain, or None.
+    """
+    return Chain(spec) if spec else None
+
+
+class SpecScraper(BaseScraper):
+    """
+    A scraper described by selector specs instead of code.
+
+    Sites whose listings follow the usual title, link, image and price
+    layout subclass this and only declare where those live. A spec is a
+    bs4-style (name, attrs) filter, or a list of them followed from the
+    outermost element inwards. The specs are compiled once per class, and
+    every row of every spec site goes through extract_product_info below.
+    Sites with bespoke rules override accepts_title or the extraction
+    methods, or keep subclassing BaseScraper.
+
+    Attributes:
+        listing (tuple | list): The element holding the product rows.
+        rows (tuple): The filter for the rows inside listing.
+        sold_out (tuple | list): An element marking a row as out of stock.
+        sold_out_text (str): When set, sold_out only marks a row whose
+            element text contains it, ignoring case.
+        title (tuple | list): The element whose text is the title.
+        brand (tuple | list): An element whose text names the manufacturer,
+            for sites that list it apart from the title.
+        link (tuple | list): The element holding the product link.
+        link_attr (str): The attribute holding the link.
+        link_prefix (str): Prepended to relative links.
+        image (tuple | list): The element holding the product image.
+        image_attr (str): The attribute holding the image URL.
+        image_prefix (str): Prepended to relative image URLs.
+        placeholder_image (str): Rows whose image URL contains it are
+            skipped, as the site only shows placeholders for dead listings.
+        price (list): Specs of the price element, tried in order, so a
+            sale price can come before the regular one.
+        next_link (tuple | list): The link to the next results page.
+        next_link_prefix (str): Prepended to relative next page links.
+    """
+
+    listing = None
+    rows = None
+    sold_out = None
+    sold_out_text = None
+    title = None
+    brand = None
+    link = ("a", None)
+    link_attr = "href"
+    link_prefix = ""
+    image = ("img", None)
+    image_attr = "src"
+    image_prefix = ""
+    placeholder_image = None
+    price = ()
+    next_link = None
+    next_link_prefix = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.compiled = {
+            "listing": compile_spec(cls.listing),
+            "rows": compile_spec(cls.rows),
+            "sold_out": compile_spec(cls.sold_out),
+            "title": compile_spec(cls.title),
+            "brand": compile_spec(cls.brand),
+            "link": compile_spec(cls.link),
+            "image": compile_spec(cls.image),
+            "price": tuple(compile_spec(spec) for spec in cls.price),
+            "next_link": compile_spec(cls.next_link),
+        }
+
+    def process_page(self, soup):
+        """
+        Processes the page content to extract product listings.
+
+        Args:
+            soup (BeautifulSoup object): The parsed HTML of the page.
+        """
+        listing = self.compiled["listing"].find(soup)
+        if listing is None:
+            logger.warning("No listing found on %s", self.url)
+            return
+
+        for row in self.compiled["rows"].find_all(listing):
+            self.process_row(row)
+
+    def extract_product_info(self, row):
+        """
+        Extracts product info from a product listing and appends it to
+        self.results when it has a manufacturer and a round count.
+
+        Args:
+            row (bs4.element.Tag): The HTML element representing a product listing.
+        """
+        compiled = self.compiled
+        result = {}
+        if self.is_sold_out(row):
+            return
+        result["title"] = compiled["title"].find(row).text.strip()
+        if not self.accepts_title(result["title"]):
+            return
+        title_class = classify_title(result["title"], self.round_count_pattern)
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        if compiled["brand"]:
+            brand = compiled["brand"].find(row).text.strip()
+            result["manufacturer"] = get_manufacturer(brand)
+        else:
+            result["manufacturer"] = self.manufacturer_name or title_class.manufacturer
+        if not result["manufacturer"]:
+            self.drop("manufacturer")
+            return
+        result["link"] = compiled["link"].find(row).get(self.link_attr)
+        if self.link_prefix:
+            result["link"] = f"{self.link_prefix}{result['link']}"
+        result["image"] = compiled["image"].find(row).get(self.image_attr)
+        if self.image_prefix:
+            result["image"] = f"{self.image_prefix}{result['image']}"
+        if self.placeholder_image and self.placeholder_image in result["image"]:
+            return
+        result["website"] = self.website
+
+        original_price = self.extract_price(row)
+        result["original_price"] = f"{original_price:.2f}"
+
+        if not title_class.round_count:
+            self.drop("round_count")
+            return
+        cpr = original_price / title_class.round_count
+        result["cpr"] = f"{cpr:.2f}"
+        self.results.append(result)
+
+    def is_sold_out(self, row):
+        """
+        Checks the row against sold_out and sold_out_text.
+
+        Args:
+            row (bs4.element.Tag): The HTML element representing a product listing.
+
+        Returns:
+            bool: Whether the row is out of stock.
+        """
+        if self.compiled["sold_out"] is None:
+            return False
+        element = self.compiled["sold_out"].find(row)
+        if element is None:
+            return False
+        if self.sold_out_text is None:
+            return True
+        return self.sold_out_text.lower() in element.text.lower()
+
+    def extract_price(self, row):
+        """
+        Reads the price from the first price spec found in the row.
+
+        Args:
+            row (bs4.element.Tag): The HTML element representing a product listing.
+
+        Returns:
+            float: The price.
+
+        Raises:
+            ValueError: If no price spec matches.
+        """
+        for chain in self.compiled["price"]:
+            element = chain.find(row)
+            if element is not None:
+                return float(element.text.strip().strip("$").replace(",", ""))
+        raise ValueError("no price found")
+
+    def get_next_url(self, soup):
+        """
+        Finds the URL of the next results page through next_link.
+
+        Args:
+            soup (BeautifulSoup object): The parsed HTML of the page.
+
+        Returns:
+            str: The URL of the next page, or None on the last page.
+        """
+        if self.compiled["next_link"] is None:
+            return None
+        element = self.compiled["next_link"].find(soup)
+        if element is None or not element.get("href"):
+            return None
+        return f"{self.next_link_prefix}{element.get('href')}"
@@ -0,0 +1,355 @@
+import json
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+JSON_LD_MARKER = "application/ld+json"
+NEXT_DATA_MARKER = 'id="__NEXT_DATA__"'
+
+OUT_OF_STOCK = ("OutOfStock", "SoldOut", "Discontinued")
+
+# The keys the product objects in Next.js page state keep each field under,
+# most specific first, so a sale price is read before the list price
+STATE_FIELDS = {
+    "title": ("name", "title", "productName", "displayName"),
+    "link": ("url", "href", "pdpUrl", "productUrl", "seoUrl", "canonicalUrl"),
+    "image": (
+        "image",
+        "imageUrl",
+        "thumbnail",
+        "thumbnailUrl",
+        "thumbnailImage",
+        "images",
+    ),
+    "brand": ("brand", "brandName", "manufacturer"),
+    "price": ("salePrice", "offerPrice", "price", "listPrice", "priceRange", "prices"),
+}
+# The keys of a price object that hold its amount
+PRICE_KEYS = ("sale", "offer", "current", "value", "amount", "min", "price")
+# Flags that mark a product in Next.js page state as out of stock when false
+STOCK_FLAGS = ("inStock", "isInStock", "available", "isAvailable")
+# Status fields that mark it out of stock when they end in OUT_OF_STOCK or
+# say so
+STOCK_STATUSES = ("availability", "inventoryStatus", "stockStatus")
+
+
+def script_bodies(html, marker):
+    """
+    Finds the bodies of the script elements whose opening tag contains a
+    marker, by scanning the HTML as a string instead of parsing it.
+
+    Args:
+        html (str): The page's HTML.
+        marker (str): Text inside the opening tag, e.g. its type or id.
+
+    Returns:
+        list: The text of each matching script element.
+    """
+    bodies = []
+    start = html.find(marker)
+    while start != -1:
+        tag_start = html.rfind("<", 0, start)
+        body_start = html.find(">", start) + 1
+        body_end = html.find("</script>", body_start)
+        if body_start == 0 or body_end == -1:
+            break
+        # The marker may also turn up in text or another tag
+        if html.startswith("<script", tag_start):
+            bodies.append(html[body_start:body_end])
+        start = html.find(marker, body_end)
+    return bodies
+
+
+def load_json(bodies):
+    """
+    Decodes script bodies, skipping any that are not valid JSON.
+
+    Args:
+        bodies (list): The script bodies.
+
+    Returns:
+        list: The decoded payloads.
+    """
+    payloads = []
+    for body in bodies:
+        body = body.strip()
+        if body.startswith("<!--"):
+            body = body[4:].rsplit("-->", 1)[0]
+        try:
+            payloads.append(json.loads(body))
+        except ValueError as e:
+            logger.debug(f"Skipping invalid embedded JSON: {e}")
+    return payloads
+
+
+def is_product(node):
+    types = node.get("@type")
+    if isinstance(types, list):
+        return "Product" in types
+    return types == "Product"
+
+
+def iter_products(payload):
+    """
+    Walks a payload for schema.org Product objects, in document order.
+    This covers bare Products, @graph lists, ItemList elements and
+    Products nested anywhere in embedded state.
+
+    Args:
+        payload (object): A decoded JSON payload.
+
+    Yields:
+        dict: Each Product object.
+    """
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            if is_product(node):
+                yield node
+            else:
+                stack.extend(reversed(list(node.values())))
+
+
+def first(value):
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def text_of(value):
+    """
+    Reads a schema.org value that may be a string, a list or an object
+    with a name or url.
+
+    Returns:
+        str: The text, or None.
+    """
+    value = first(value)
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("url")
+    if value is None:
+        return None
+    return str(value).strip() or None
+
+
+def offer_price(offers):
+    """
+    Reads the price of a Product's offers, skipping offers out of stock.
+
+    Args:
+        offers (object): An Offer, AggregateOffer or a list of them.
+
+    Returns:
+        float: The lowest in-stock price, or None if there is none.
+    """
+    if not isinstance(offers, list):
+        offers = [offers]
+    prices = []
+    for offer in offers:
+        if not isinstance(offer, dict):
+            continue
+        availability = str(offer.get("availability") or "")
+        if availability.endswith(OUT_OF_STOCK):
+            continue
+        price = offer.get("price", offer.get("lowPrice"))
+        if price is None and isinstance(offer.get("priceSpecification"), dict):
+            price = offer["priceSpecification"].get("price")
+        try:
+            prices.append(float(str(price).strip().strip("$").replace(",", "")))
+        except ValueError:
+            continue
+    return min(prices) if prices else None
+
+
+def product_listing(product):
+    """
+    Maps a schema.org Product to a listing record.
+
+    Args:
+        product (dict): The Product object.
+
+    Returns:
+        dict: The title, link, image, brand and price, or None if the
+            product has no name or no in-stock price.
+    """
+    title = text_of(product.get("name"))
+    price = offer_price(product.get("offers"))
+    if not title or price is None:
+        return None
+    offers = first(product.get("offers"))
+    link = product.get("url")
+    if not link and isinstance(offers, dict):
+        link = offers.get("url")
+    return {
+        "title": title,
+        "link": text_of(link),
+        "image": text_of(product.get("image")),
+        "brand": text_of(product.get("brand")),
+        "price": price,
+    }
+
+
+def state_value(node, field):
+    """
+    Reads a field of a product in Next.js page state, from the first of
+    its STATE_FIELDS keys the product has.
+
+    Args:
+        node (dict): The product object.
+        field (str): A STATE_FIELDS name.
+
+    Returns:
+        object: The value, or None.
+    """
+    for key in STATE_FIELDS[field]:
+        value = node.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def price_of(value):
+    """
+    Reads a price that may be a number, a string like "$1,299.99", a list
+    of prices or an object holding one under a PRICE_KEYS key.
+
+    Returns:
+        float: The price, or None.
+    """
+    value = first(value)
+    if isinstance(value, dict):
+        for key in PRICE_KEYS:
+            if key in value:
+                price = price_of(value[key])
+                if price is not None:
+                    return price
+        return None
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        price = float(str(value).strip().strip("$").replace(",", ""))
+    except ValueError:
+        return None
+    return price if price > 0 else None
+
+
+def in_stock(node):
+    """
+    Tells whether a product in Next.js page state is in stock. Products
+    that say nothing about their stock are taken to be.
+
+    Args:
+        node (dict): The product object.
+
+    Returns:
+        bool: False if a stock flag or status says it is out of stock.
+    """
+    for key in STOCK_FLAGS:
+        if node.get(key) is False:
+            return False
+    for key in STOCK_STATUSES:
+        status = node.get(key)
+        if isinstance(status, str) and (
+            status.endswith(OUT_OF_STOCK) or "out of stock" in status.lower()
+        ):
+            return False
+    return True
+
+
+def state_listing(node):
+    """
+    Maps a product object from Next.js page state to a listing record.
+    Storefront APIs name their fields differently, so each field is read
+    from the first of its STATE_FIELDS keys the object has.
+
+    Args:
+        node (dict): An object from the page state.
+
+    Returns:
+        dict: The title, link, image, brand and price, or None if the
+            object is not a product with a name, a link and a price, or is
+            out of stock.
+    """
+    title = state_value(node, "title")
+    link = state_value(node, "link")
+    if not isinstance(title, str) or not isinstance(link, str):
+        return None
+    price = price_of(state_value(node, "price"))
+    if price is None or not in_stock(node):
+        return None
+    return {
+        "title": title.strip(),
+        "link": link.strip(),
+        "image": text_of(state_value(node, "image")),
+        "brand": text_of(state_value(node, "brand")),
+        "price": price,
+    }
+
+
+def iter_state_listings(payload):
+    """
+    Walks the Next.js __NEXT_DATA__ state for products, in document order.
+    Embedded schema.org Products are mapped like JSON-LD ones, and any
+    other object state_listing reads as a product is mapped by its keys.
+    Products, and objects out of stock, are not searched any further, so
+    their variants are skipped.
+
+    Args:
+        payload (object): The decoded __NEXT_DATA__ payload.
+
+    Yields:
+        dict: Each listing record.
+    """
+    stack = [payload.get("props", payload) if isinstance(payload, dict) else payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            if is_product(node):
+                listing = product_listing(node)
+                if listing:
+                    yield listing
+                continue
+            listing = state_listing(node)
+            if listing:
+                yield listing
+            elif in_stock(node):
+                stack.extend(reversed(list(node.values())))
+
+
+def find_listings(html):
+    """
+    Extracts listing records from the structured data a page embeds: the
+    schema.org Products of its JSON-LD blocks, or if it has none, the
+    products of its Next.js __NEXT_DATA__ state. A product the page lists
+    twice is only kept once.
+
+    Args:
+        html (str): The page's HTML.
+
+    Returns:
+        list: The listing record of each in-stock product, in page order.
+    """
+    listings = []
+    for payload in load_json(script_bodies(html, JSON_LD_MARKER)):
+        for product in iter_products(payload):
+            listing = product_listing(product)
+            if listing:
+                listings.append(listing)
+    if not listings:
+        for payload in load_json(script_bodies(html, NEXT_DATA_MARKER)):
+            listings.extend(iter_state_listings(payload))
+
+    seen = set()
+    unique = []
+    for listing in listings:
+        key = (listing["title"], listing["link"])
+        if key not in seen:
+            seen.add(key)
+            unique.append(listing)
+    return unique
@@ -0,0 +1,174 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+
+from bot.base.get_manufacturer import get_manufacturer
+from bot.base.round_count import get_round_count
+from bot.base.row_store import source_version
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAXSIZE = 20000
+
+# Modules whose code decides how a title is classified
+CLASSIFICATION_MODULES = (
+    "bot.base.get_manufacturer",
+    "bot.base.round_count",
+    "bot.base.title_classifier",
+)
+
+TitleClass = namedtuple(
+    "TitleClass", ["manufacturer", "steel_casing", "remanufactured", "round_count"]
+)
+
+
+class TitleClassifier:
+    """
+    Classifies product titles, remembering the latest results in a
+    size-bounded LRU since the same titles recur across pages and runs.
+
+    Attributes:
+        maxsize (int): The maximum number of titles remembered.
+        entries (OrderedDict): Cached TitleClass values, least recently
+            used first.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that classified the title.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        """
+        Initializes an empty TitleClassifier.
+
+        Args:
+            maxsize (int, optional): The maximum number of titles remembered.
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def classify(self, title, round_count_pattern=None):
+        """
+        Classifies a title, from the cache when it was seen before.
+
+        Args:
+            title (str): The product title.
+            round_count_pattern (re.Pattern, optional): The site's round
+                count pattern, tried when the shared ones find no count.
+
+        Returns:
+            TitleClass: The manufacturer, steel casing and remanufactured
+                flags, and round count.
+        """
+        pattern = round_count_pattern.pattern if round_count_pattern else ""
+        flags = round_count_pattern.flags if round_count_pattern else 0
+        key = (title, pattern, flags)
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        lowered = title.lower()
+        value = TitleClass(
+            get_manufacturer(title),
+            "steel" in lowered,
+            "reman" in lowered,
+            get_round_count(title, round_count_pattern),
+        )
+        with self.lock:
+            self.entries[key] = value
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return value
+
+    def stats(self):
+        """
+        Reports how well the cache is sized.
+
+        Returns:
+            dict: hits, misses, hit_rate, size and maxsize.
+        """
+        with self.lock:
+            hits, misses, size = self.hits, self.misses, len(self.entries)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "size": size,
+            "maxsize": self.maxsize,
+        }
+
+    def load(self, path):
+        """
+        Fills the cache from a file written by save. A missing or
+        unreadable file, or one written before the classification code
+        changed, leaves it empty.
+
+        Args:
+            path (str): The file to read.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read title cache {path}: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != source_version(
+            CLASSIFICATION_MODULES
+        ):
+            logger.debug(f"Discarding outdated title cache {path}")
+            return
+        with self.lock:
+            for title, pattern, flags, value in data["entries"][-self.maxsize:]:
+                self.entries[(title, pattern, flags)] = TitleClass(*value)
+
+    def save(self, path):
+        """
+        Writes the cache to a file, least recently used first, with the
+        version of the classification code it was computed with.
+
+        Args:
+            path (str): The file to write.
+        """
+        with self.lock:
+            entries = [list(key) + [list(value)] for key, value in self.entries.items()]
+        data = {"version": source_version(CLASSIFICATION_MODULES), "entries": entries}
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write title cache {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+classifier = TitleClassifier()
+
+
+def classify_title(title, round_count_pattern=None):
+    """
+    Classifies a title with the process-wide TitleClassifier.
+
+    Args:
+        title (str): The product title.
+        round_count_pattern (re.Pattern, optional): The site's round count
+            pattern, tried when the shared ones find no count.
+
+    Returns:
+        TitleClass: The manufacturer, steel casing and remanufactured
+            flags, and round count.
+    """
+    return classifier.classify(title, round_count_pattern)
@@ -0,0 +1,364 @@
+import argparse
+import contextlib
+import glob
+import hashlib
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from bot.base.get_caliber import get_calibers
+from bot.base.get_scraper import SCRAPERS, get_scraper_class
+from bot.base.html_cache import HtmlCache
+from bot.base.title_classifier import classifier
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURE_DIR = "fixtures"
+DEFAULT_ITERATIONS = 20
+
+
+def find_fixtures(directory, site):
+    """
+    Lists the captured pages of a site: either <directory>/<site>.html or
+    every .html file in <directory>/<site>/.
+
+    Args:
+        directory (str): The fixture directory.
+        site (str): The site key, as in get_scraper.SCRAPERS.
+
+    Returns:
+        list: The fixture paths, sorted.
+    """
+    single = os.path.join(directory, f"{site}.html")
+    paths = glob.glob(os.path.join(directory, site, "*.html"))
+    if os.path.isfile(single):
+        paths.append(single)
+    return sorted(paths)
+
+
+def site_key(scraper_class):
+    """
+    Looks up the site key of a scraper class.
+
+    Args:
+        scraper_class (type): The scraper class.
+
+    Returns:
+        str: Its key in get_scraper.SCRAPERS, or None.
+    """
+    name = (scraper_class.__module__, scraper_class.__name__)
+    for site, entry in SCRAPERS.items():
+        if entry == name:
+            return site
+    return None
+
+
+def capture_fixtures(scraper, cache, fixture_dir, site=None):
+    """
+    Writes the pages a scraper would read from a page cache as fixtures,
+    starting at its URL and following get_next_url for as long as the next
+    page is cached too. Pages reached by clicking through are not found.
+
+    Args:
+        scraper (BaseScraper): The scraper, before it ran.
+        cache (HtmlCache): The cache a run filled, fresh or not.
+        fixture_dir (str): The fixture directory.
+        site (str, optional): The site key. Defaults to the scraper's.
+
+    Returns:
+        list: The fixture paths written, as <fixture_dir>/<site>/<hash>.html
+            with the hash of the page URL.
+    """
+    site = site or site_key(type(scraper))
+    directory = os.path.join(fixture_dir, site)
+    paths = []
+    url = scraper.url
+    seen = set()
+    while url and url not in seen:
+        seen.add(url)
+        entry = cache.load(url, "browser") or cache.load(url, "http")
+        if entry is None:
+            break
+        os.makedirs(directory, exist_ok=True)
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        path = os.path.join(directory, f"{name}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(entry.body)
+        paths.append(path)
+        scraper.url = url
+        with contextlib.redirect_stdout(sys.stderr):
+            url = scraper.process_html(entry.body)
+    return paths
+
+
+def capture_configured(cache_dir, fixture_dir):
+    """
+    Captures fixtures for every page configured for main.CALIBERS from the
+    page cache of an earlier run with SCRAPER_CACHE_DIR set, without
+    touching the network.
+
+    Args:
+        cache_dir (str): The run's SCRAPER_CACHE_DIR.
+        fixture_dir (str): The fixture directory.
+
+    Returns:
+        dict: The fixture paths written for each site key.
+    """
+    from main import CALIBERS, plan_scrapers
+
+    cache = HtmlCache(cache_dir)
+    captured = {}
+    for scraper, _ in plan_scrapers(CALIBERS):
+        site = site_key(type(scraper))
+        paths = capture_fixtures(scraper, cache, fixture_dir, site)
+        if paths:
+            captured.setdefault(site, []).extend(paths)
+        else:
+            print(f"No cached page for {site} - {scraper.start_url}", file=sys.stderr)
+    return captured
+
+
+def reset_caches():
+    """
+    Empties the title caches, so every iteration extracts its titles cold
+    like the first page of a run does.
+    """
+    with classifier.lock:
+        classifier.entries.clear()
+    get_calibers.cache_clear()
+
+
+def parse_fixture(scraper_class, path, html, parser_backend):
+    """
+    Runs a scraper's parse and extract path on one page.
+
+    Args:
+        scraper_class (type): The scraper class.
+        path (str): The fixture path, used as the page URL.
+        html (str): The page's HTML.
+        parser_backend (str): The make_soup backend, or None for the
+            scraper's own.
+
+    Returns:
+        tuple: The number of rows and structured data listings handed to
+            extraction, and the number of results kept.
+    """
+    scraper = scraper_class(f"file://{os.path.abspath(path)}")
+    if parser_backend:
+        scraper.parser_backend = parser_backend
+    scraper.process_html(html)
+    return scraper.stats.rows_found, len(scraper.results)
+
+
+def benchmark_site(site, paths, iterations, parser_backend=None, warm=False):
+    """
+    Times a scraper's parse path on its fixtures and measures the memory
+    it allocates.
+
+    Args:
+        site (str): The site key.
+        paths (list): The fixture paths.
+        iterations (int): How many times each page is parsed.
+        parser_backend (str, optional): The make_soup backend, or None for
+            the scraper's own.
+        warm (bool, optional): Whether to keep the title caches between
+            iterations.
+
+    Returns:
+        dict: The site's measurements.
+    """
+    scraper_class = get_scraper_class(site)
+    pages = []
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            pages.append((path, f.read()))
+
+    rows = results = 0
+    elapsed = 0.0
+    for _ in range(iterations):
+        if not warm:
+            reset_caches()
+        for path, html in pages:
+            start = time.perf_counter()
+            page_rows, page_results = parse_fixture(
+                scraper_class, path, html, parser_backend
+            )
+            elapsed += time.perf_counter() - start
+            rows += page_rows
+            results += page_results
+
+    # Allocations are measured on a separate pass, since tracing slows
+    # everything down. The soup's reference cycles outlive the parse until
+    # the garbage collector runs, so the snapshot difference counts nearly
+    # everything the parse allocated.
+    peak = allocated = blocks = 0
+    for path, html in pages:
+        reset_caches()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        parse_fixture(scraper_class, path, html, parser_backend)
+        after = tracemalloc.take_snapshot()
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        for stat in after.compare_to(before, "filename"):
+            if stat.size_diff > 0:
+                allocated += stat.size_diff
+                blocks += max(stat.count_diff, 0)
+
+    runs = iterations * len(pages)
+    return {
+        "scraper": scraper_class.__name__,
+        "backend": parser_backend or scraper_class.parser_backend,
+        "pages": len(pages),
+        "iterations": iterations,
+        "rows_per_page": rows / runs,
+        "results_per_page": results / runs,
+        "ms_per_page": elapsed * 1000 / runs,
+        "rows_per_sec": rows / elapsed if elapsed else 0.0,
+        "peak_kib_per_page": peak / 1024,
+        "allocated_kib_per_page": allocated / 1024 / len(pages),
+        "allocated_blocks_per_page": blocks / len(pages),
+    }
+
+
+def run_benchmark(
+    fixture_dir=DEFAULT_FIXTURE_DIR,
+    iterations=DEFAULT_ITERATIONS,
+    parser_backend=None,
+    sites=None,
+    warm=False,
+):
+    """
+    Benchmarks every scraper that has fixtures.
+
+    Args:
+        fixture_dir (str, optional): The fixture directory.
+        iterations (int, optional): How many times each page is parsed.
+        parser_backend (str, optional): The make_soup backend for every
+            scraper, or None for each scraper's own.
+        sites (list, optional): The site keys to run. Defaults to all.
+        warm (bool, optional): Whether to keep the title caches between
+            iterations.
+
+    Returns:
+        dict: The report, with the measurements of each site and the sites
+            skipped for having no fixtures.
+    """
+    report = {
+        "created_at": time.time(),
+        "python": platform.python_version(),
+        "fixture_dir": fixture_dir,
+        "iterations": iterations,
+        "backend": parser_backend,
+        "warm": warm,
+        "sites": {},
+        "skipped": [],
+    }
+    for site in sites or SCRAPERS:
+        paths = find_fixtures(fixture_dir, site)
+        if not paths:
+            report["skipped"].append(site)
+            continue
+        # Scrapers print their row errors; keep them out of a JSON report
+        # written to stdout
+        try:
+            with contextlib.redirect_stdout(sys.stderr):
+                report["sites"][site] = benchmark_site(
+                    site, paths, iterations, parser_backend, warm
+                )
+        except Exception as e:
+            print(f"Unexpected error: {e} - {site} during benchmark")
+            report["sites"][site] = {"error": str(e)}
+    return report
+
+
+def print_report(report, file=None):
+    """
+    Prints a report as a table, slowest site first.
+
+    Args:
+        report (dict): A report from run_benchmark.
+        file (object, optional): The stream to print to. Defaults to stdout.
+    """
+    print(
+        f"{'site':<30} {'ms/page':>9} {'rows/s':>10} {'rows':>6} {'peak KiB':>9}",
+        file=file,
+    )
+    sites = sorted(
+        report["sites"].items(),
+        key=lambda item: item[1].get("ms_per_page", float("inf")),
+        reverse=True,
+    )
+    for site, stats in sites:
+        if "error" in stats:
+            print(f"{site:<30} error: {stats['error']}", file=file)
+            continue
+        print(
+            f"{site:<30} {stats['ms_per_page']:>9.2f} {stats['rows_per_sec']:>10.0f}"
+            f" {stats['rows_per_page']:>6.0f} {stats['peak_kib_per_page']:>9.0f}",
+            file=file,
+        )
+    if report["skipped"]:
+        print(f"No fixtures for {len(report['skipped'])} sites", file=file)
+
+
+def main(argv=None):
+    """
+    Benchmarks the scrapers' parse paths on captured pages, without
+    touching the network.
+
+    Save a site's category pages as fixtures/<site>.html or
+    fixtures/<site>/<name>.html, where <site> is its key in
+    get_scraper.SCRAPERS, then run python -m bot.benchmark. To capture
+    them, run the bot once with SCRAPER_CACHE_DIR set, then run
+    python -m bot.benchmark --capture <SCRAPER_CACHE_DIR>, which writes the
+    cached pages of every configured URL to the fixture directory.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bot.benchmark",
+        description="Benchmark each scraper's parse path on saved pages.",
+    )
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURE_DIR)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument(
+        "--backend", help="html.parser, lxml, html5lib or selectolax for every site"
+    )
+    parser.add_argument("--site", action="append", help="Only this site key")
+    parser.add_argument(
+        "--warm", action="store_true", help="Keep title caches between iterations"
+    )
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument(
+        "--capture",
+        metavar="CACHE_DIR",
+        help="Write the configured pages cached in this directory as fixtures",
+    )
+    args = parser.parse_args(argv)
+
+    if args.capture:
+        captured = capture_configured(args.capture, args.fixtures)
+        pages = sum(len(paths) for paths in captured.values())
+        print(f"Captured {pages} pages of {len(captured)} sites to {args.fixtures}")
+        return
+
+    report = run_benchmark(
+        args.fixtures, args.iterations, args.backend, args.site, args.warm
+    )
+    # Without an output file the JSON goes to stdout and the table to stderr
+    if args.output:
+        print_report(report)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print_report(report, file=sys.stderr)
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
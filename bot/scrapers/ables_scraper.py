@@ -1,10 +1,8 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,11 @@ class AblesScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div#main-section"
+    parse_only = [("div", {"id": "products"})]
+    website = "Able's"
+    excluded_title_terms = ("223",)
+
     def __init__(self, url):
         """
         Initializes the AblesScraper with a URL.
@@ -25,23 +28,6 @@ class AblesScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div#main-section")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -61,20 +47,6 @@ class AblesScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -91,30 +63,31 @@ class AblesScraper(BaseScraper):
         result["title"] = (
             row.find("div", {"class": "product-name"}).find("a").text.strip()
         )
-        if "223" in result["title"]:
+        if not self.accepts_title(result["title"]):
             return
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         result["link"] = row.find("a", {"class": "product-image"}).get("href")
         image = row.find("img").get("src")
         if image == "/catalog/images/":
             return
         result["image"] = f"https://www.ableammo.com{image}"
-        result["website"] = "Able's"
+        result["website"] = self.website
 
         original_price = float(
             row.find("div", {"class": "product-price"}).text.strip("$")
         )
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(r"(\d+)\s*(rd|round)", result["title"].lower())
-        if match:
-            rounds_per_case = int(match.group(1))
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
@@ -1,10 +1,9 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
 from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +15,10 @@ class AeammoScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.item-container"
+    parse_only = [("div", {"class": "col-lg-10 col-md-9"})]
+    website = "AE Ammo"
+
     def __init__(self, url):
         """
         Initializes the AeammoScraper with a URL.
@@ -25,23 +28,6 @@ class AeammoScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.item-container")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -61,20 +47,6 @@ class AeammoScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -89,8 +61,9 @@ class AeammoScraper(BaseScraper):
         if row.find("div", {"class": "product-badge out-of-stock-badge"}):
             return
         result["title"] = row.find("div", {"class": "description"}).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
         manufacturer = (
             row.find("div", {"class": "grid-description"})
             .find("span", {"class": "small"})
@@ -98,11 +71,12 @@ class AeammoScraper(BaseScraper):
         )
         result["manufacturer"] = get_manufacturer(manufacturer)
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://www.aeammo.com{link}"
         result["image"] = row.find("img", {"class": "img-responsive"}).get("src")
-        result["website"] = "AE Ammo"
+        result["website"] = self.website
 
         price_text = row.find("div", {"class": "price"})
         if price_text.find("span", {"class": "text-success"}):
@@ -113,11 +87,10 @@ class AeammoScraper(BaseScraper):
             original_price = float(price_text.text.strip("$"))
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(r"(\d+)\s*(round|/)", result["title"].lower())
-        if match:
-            rounds_per_case = int(match.group(1))
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
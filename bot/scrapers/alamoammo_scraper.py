@@ -1,13 +1,14 @@
 import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
+MANUFACTURER_ROUND_COUNT = re.compile(r"(\d+)\s*(rounds M|rnds M)", re.IGNORECASE)
+
 
 class AlamoammoScraper(BaseScraper):
     """
@@ -16,6 +17,14 @@ class AlamoammoScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div#mainWrapper"
+    wait_selector_timeout = 10000
+    parse_only = [
+        ("table", {"class": "tabTable"}),
+        ("div", {"id": "productsListingListingBottomLinks"}),
+    ]
+    website = "Alamo Ammo"
+
     def __init__(self, url):
         """
         Initializes the AlamoammoScraper with a URL.
@@ -25,37 +34,23 @@ class AlamoammoScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
+    def get_next_url(self, soup):
         """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
+        Finds the URL of the next results page, if any.
+
+        Args:
+            soup (BeautifulSoup object): The parsed HTML of the page.
+
+        Returns:
+            str: The URL of the next page, or None on the last page.
         """
-        browser = self.browser
-        page = browser.new_page()
-        # Click "Next" button until it's no longer visible
-        while True:
-            try:
-                page.goto(self.url)
-                page.wait_for_selector("div#mainWrapper", timeout=10000)
-            except Exception as e:
-                print(f"Unexpected error: {e} - {self.url} during page.goto")
-                traceback.print_exc()
-                return
-            soup = BeautifulSoup(page.content(), "html.parser")
-            self.process_page(soup)
-            pagination = page.query_selector("a[title=' Next Page ']")
-            if pagination:
-                url = (
-                    soup.find("div", {"id": "productsListingListingBottomLinks"})
-                    .find("a", {"title": " Next Page "})
-                    .get("href")
-                )
-                if url:
-                    self.url = url
-                else:
-                    break
-            else:
-                break
+        if not soup.select_one("a[title=' Next Page ']"):
+            return None
+        return (
+            soup.find("div", {"id": "productsListingListingBottomLinks"})
+            .find("a", {"title": " Next Page "})
+            .get("href")
+        )
 
     def process_page(self, soup):
         """
@@ -76,20 +71,6 @@ class AlamoammoScraper(BaseScraper):
         for row in inner[1:]:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -105,35 +86,32 @@ class AlamoammoScraper(BaseScraper):
         result["title"] = (
             row.find("h3", {"class": "itemTitle"}).text.split("UPC")[0].strip()
         )
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         result["link"] = row.find("a").get("href")
         image = row.find("img").get("src")
         result["image"] = f"https://alamoammo.com/{image}"
-        result["website"] = "Alamo Ammo"
+        result["website"] = self.website
         # Find all td elements in the row
         all_tds = row.find_all("td")
         original_price = float(
             all_tds[3].text.strip().split(" ")[1].strip("$").replace("...", "")
         )
         result["original_price"] = f"{original_price:.2f}"
-        match = re.search(r"(\d+)\s*(rounds M|rnds M)", result["title"], re.IGNORECASE)
-        # Checks if title has a second "round" in it (e.g. 100 rounds 9mm FMJ 100rnds)
-        another_match = re.search(
-            r"(\d+)\s*(rnd|round)", result["title"], re.IGNORECASE
-        )
+        # Prefer the count before the manufacturer (e.g. 100 rounds 9mm FMJ 100rnds M)
+        match = MANUFACTURER_ROUND_COUNT.search(result["title"])
         if match:
             rounds_per_case = int(match.group(1))
-            cpr = original_price / rounds_per_case
-            result["cpr"] = f"{cpr:.2f}"
-            self.results.append(result)
-        elif another_match:
-            rounds_per_case = int(another_match.group(1))
+        else:
+            rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
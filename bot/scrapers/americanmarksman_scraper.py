@@ -1,10 +1,9 @@
 import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +15,10 @@ class AmericanmarksmanScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.container"
+    parse_only = [("div", {"class": "product-items product-items-1"})]
+    website = "American Marksman"
+
     def __init__(self, url):
         """
         Initializes the AmericanmarksmanScraper with a URL.
@@ -25,23 +28,6 @@ class AmericanmarksmanScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.container")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -61,20 +47,6 @@ class AmericanmarksmanScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -92,15 +64,17 @@ class AmericanmarksmanScraper(BaseScraper):
         ):
             return
         result["title"] = row.find("div", {"class": "name"}).find("a").text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://www.theamericanmarksman.com/{link}"
         result["image"] = row.find("img", {"class": "img-responsive"}).get("src")
-        result["website"] = "American Marksman"
+        result["website"] = self.website
 
         if row.find("span", {"class": "sale-price"}):
             original_price = float(
@@ -1,9 +1,8 @@
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,12 @@ class Ammo2Scraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "ol.products"
+    wait_selector_timeout = 10000
+    parse_only = [("div", {"class": "products wrapper grid products-grid"})]
+    website = "2Ammo"
+    excluded_title_terms = ("223",)
+
     def __init__(self, url):
         """
         Initializes the Ammo2Scraper with a URL.
@@ -24,23 +29,6 @@ class Ammo2Scraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("ol.products", timeout=10000)
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -68,20 +56,6 @@ class Ammo2Scraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -94,16 +68,18 @@ class Ammo2Scraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("a", {"class": "product-item-link"}).text.strip()
-        if "223" in result["title"]:
+        if not self.accepts_title(result["title"]):
             return
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         result["link"] = row.find("a", {"class": "product-item-link"}).get("href")
         result["image"] = row.find("img").get("src")
-        result["website"] = "2Ammo"
+        result["website"] = self.website
 
         original_price = float(
             row.find("div", {"class": "price-box price-final_price"})
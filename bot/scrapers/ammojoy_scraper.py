@@ -1,9 +1,9 @@
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
 from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,10 @@ class AmmojoyScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.mz-grid"
+    parse_only = [("div", {"class": "mz-grid"})]
+    website = "Ammo Joy"
+
     def __init__(self, url):
         """
         Initializes the AmmojoyScraper with a URL.
@@ -24,23 +28,6 @@ class AmmojoyScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-            page.wait_for_selector("div.mz-grid")
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -62,20 +49,6 @@ class AmmojoyScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -93,17 +66,19 @@ class AmmojoyScraper(BaseScraper):
         ):
             return
         result["title"] = row.find("h2", {"class": "productitem--title"}).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
         manufacturer = row.find("span", {"class": "productitem--vendor"}).text.strip()
         result["manufacturer"] = get_manufacturer(manufacturer)
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://www.ammojoy.com{link}"
         image = row.find("img").get("src")
         result["image"] = f"https:{image}"
-        result["website"] = "Ammo Joy"
+        result["website"] = self.website
 
         original_price = float(
             row.find("div", {"class": "price__current"})
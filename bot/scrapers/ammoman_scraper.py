@@ -1,9 +1,8 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,11 @@ class AmmomanScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "header.header"
+    parse_only = [("div", {"class": "category-products"})]
+    website = "Ammo Man"
+    excluded_title_terms = ("223",)
+
     def __init__(self, url):
         """
         Initializes the AmmomanScraper with a URL.
@@ -24,23 +28,6 @@ class AmmomanScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("header.header")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -77,20 +64,6 @@ class AmmomanScraper(BaseScraper):
         for row in all_li:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -103,13 +76,14 @@ class AmmomanScraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("a").get("title")
-        if "223" in result["title"].lower():
+        if not self.accepts_title(result["title"]):
             return
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
         result["link"] = row.find("a").get("href")
         result["image"] = row.find("img").get("src")
-        result["website"] = "Ammo Man"
+        result["website"] = self.website
         if row.find("p", {"class": "special-price"}):
             original_price = float(
                 row.find("div", {"class": "price-box"})
@@ -122,11 +96,10 @@ class AmmomanScraper(BaseScraper):
             original_price = float(row.find("span", {"class": "price"}).text.strip("$"))
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(r"(\d+)\s*(round)", result["title"].lower())
-        if match:
-            rounds_per_case = int(match.group(1))
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
@@ -1,10 +1,8 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,12 @@ class AmmosupplywarehouseScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    # The Next button is found by visibility, which needs styles
+    blocked_resource_types = frozenset(["media", "font"])
+
+    parse_only = [("ul", {"class": "product_list row grid"})]
+    website = "Ammo Supply Warehouse"
+
     def __init__(self, url):
         """
         Initializes the AmmosupplywarehouseScraper with a URL.
@@ -30,27 +34,79 @@ class AmmosupplywarehouseScraper(BaseScraper):
         Navigates to the URL, waits for the page to load, then processes
         the page content to extract data.
         """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.container")
-        # Click "Next" button until it's no longer visible
-        while True:
-            soup = BeautifulSoup(page.content(), "html.parser")
-            self.process_page(soup)
-            next_button_locator = page.locator(
-                'ul#productsListingListingBottomLinks >> a[aria-label="Go to Next Page"]'
-            )
-            if next_button_locator.is_visible():
-                next_button_locator.click()
-                page.wait_for_load_state("load")
-            else:
-                break
+        stats = self.stats
+        with self.open_page() as page:
+            stats.start_step(self.url, "browser")
+            try:
+                with stats.phase("goto"):
+                    page.goto(self.url)
+                with stats.phase("wait_selector"):
+                    page.wait_for_selector("div.container")
+            except Exception as e:
+                print(f"Unexpected error: {e} - {self.url} during page.goto")
+                traceback.print_exc()
+                stats.error("goto")
+                stats.end_step()
+                return
+            # Click "Next" button until it's no longer visible
+            while True:
+                with stats.phase("content"):
+                    html = page.content()
+                stats.read_html(html)
+                self.process_html(html)
+                stats.end_step()
+                next_button_locator = page.locator(
+                    "ul#productsListingListingBottomLinks >> "
+                    'a[aria-label="Go to Next Page"]'
+                )
+                with stats.phase("interact"):
+                    visible = next_button_locator.is_visible()
+                if not visible:
+                    break
+                stats.start_step(self.url, "browser")
+                with stats.phase("interact"):
+                    next_button_locator.click()
+                    page.wait_for_load_state("load")
+                self.url = stats.step["url"] = page.url
+
+    async def scrape_async(self):
+        """
+        Async counterpart of scrape.
+        """
+        stats = self.stats
+        async with self.open_page_async() as page:
+            stats.start_step(self.url, "browser")
+            try:
+                with stats.phase("goto"):
+                    await page.goto(self.url)
+                with stats.phase("wait_selector"):
+                    await page.wait_for_selector("div.container")
+            except Exception as e:
+                print(f"Unexpected error: {e} - {self.url} during page.goto")
+                traceback.print_exc()
+                stats.error("goto")
+                stats.end_step()
+                return
+            # Click "Next" button until it's no longer visible
+            while True:
+                with stats.phase("content"):
+                    html = await page.content()
+                stats.read_html(html)
+                await self.process_html_async(html)
+                stats.end_step()
+                next_button_locator = page.locator(
+                    "ul#productsListingListingBottomLinks >> "
+                    'a[aria-label="Go to Next Page"]'
+                )
+                with stats.phase("interact"):
+                    visible = await next_button_locator.is_visible()
+                if not visible:
+                    break
+                stats.start_step(self.url, "browser")
+                with stats.phase("interact"):
+                    await next_button_locator.click()
+                    await page.wait_for_load_state("load")
+                self.url = stats.step["url"] = page.url
 
     def process_page(self, soup):
         """
@@ -69,20 +125,6 @@ class AmmosupplywarehouseScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -95,17 +137,19 @@ class AmmosupplywarehouseScraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("a", {"class": "product-name name"}).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         result["link"] = row.find("a").get("href")
         image = row.find("img").get("src")
         if "no_picture" in image:
             return
         result["image"] = f"https://www.ammosupplywarehouse.com/{image}"
-        result["website"] = "Ammo Supply Warehouse"
+        result["website"] = self.website
 
         if row.find("span", {"class": "productSpecialPrice"}):
             original_price = float(
@@ -117,14 +161,10 @@ class AmmosupplywarehouseScraper(BaseScraper):
             )
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(r"(\d+[\d,]*)\s*(rd|rnd|/)", result["title"], re.IGNORECASE)
-        if match:
-            rounds_per_case_str = match.group(1).replace(",", "")
-            rounds_per_case = int(rounds_per_case_str)
-            if rounds_per_case == 0:
-                return
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
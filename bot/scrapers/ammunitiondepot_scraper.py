@@ -1,10 +1,8 @@
-import time
 import logging
 import traceback
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,15 @@ class AmmunitiondepotScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_until = "networkidle"
+    wait_selector = "ol.ss-item-container"
+    wait_selector_timeout = 10000
+    parse_only = [
+        ("div", {"class": "ss-targeted"}),
+        ("ul", {"class": "items pages-items"}),
+    ]
+    website = "Ammunition Depot"
+
     def __init__(self, url):
         """
         Initializes the AmmunitiondepotScraper with a URL.
@@ -25,37 +32,24 @@ class AmmunitiondepotScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
+    def get_next_url(self, soup):
         """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
+        Finds the URL of the next results page, if any.
+
+        Args:
+            soup (BeautifulSoup object): The parsed HTML of the page.
+
+        Returns:
+            str: The URL of the next page, or None on the last page.
         """
-        browser = self.browser
-        page = browser.new_page()
-        while True:
-            try:
-                page.goto(self.url, wait_until="networkidle")
-                page.wait_for_selector("ol.ss-item-container", timeout=10000)
-            except Exception as e:
-                print(f"Unexpected error: {e} - {self.url} during page.goto")
-                traceback.print_exc()
-                return
-            soup = BeautifulSoup(page.content(), "html.parser")
-            self.process_page(soup)
-            pagination = page.query_selector("li.item.pages-item-next")
-            if pagination:
-                url = (
-                    soup.find("ul", {"class": "items pages-items"})
-                    .find("li", {"class": "item pages-item-next ng-scope"})
-                    .find("a")
-                    .get("href")
-                )
-                if url:
-                    self.url = url
-                else:
-                    break
-            else:
-                break
+        if not soup.select_one("li.item.pages-item-next"):
+            return None
+        return (
+            soup.find("ul", {"class": "items pages-items"})
+            .find("li", {"class": "item pages-item-next ng-scope"})
+            .find("a")
+            .get("href")
+        )
 
     def process_page(self, soup):
         """
@@ -74,20 +68,6 @@ class AmmunitiondepotScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -102,16 +82,18 @@ class AmmunitiondepotScraper(BaseScraper):
         result["title"] = row.find(
             "a", {"class": "product-item-link ng-binding"}
         ).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a", {"class": "product-item-link ng-binding"}).get("href")
         result["link"] = f"https:{link}"
         image = row.find("img", {"class": "product-image-photo"})["src"]
         result["image"] = f"https:{image}"
-        result["website"] = "Ammunition Depot"
+        result["website"] = self.website
 
         if row.find("span", {"class": "ng-binding ss-sale-price"}):
             original_price = float(
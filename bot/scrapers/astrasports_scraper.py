@@ -1,10 +1,8 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,10 @@ class AstrasportsScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.container"
+    parse_only = [("div", {"class": "products"})]
+    website = "Astra Sports"
+
     def __init__(self, url):
         """
         Initializes the AstrasportsScraper with a URL.
@@ -25,23 +27,6 @@ class AstrasportsScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.container")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -61,20 +46,6 @@ class AstrasportsScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -90,18 +61,20 @@ class AstrasportsScraper(BaseScraper):
         if row.find("span", {"class": "out-of-stock product-label"}):
             return
         result["title"] = row.find("h3", {"class": "wd-entities-title"}).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
             # Capital Cartridge is the manufacturer for 2A Warehouse ammo
             if "2a warehouse" in result["title"].lower():
                 result["manufacturer"] = "Capital Cartridge"
             else:
+                self.drop("manufacturer")
                 return
         result["link"] = row.find("a").get("href")
         result["image"] = row.find("img").get("src")
-        result["website"] = "Astra Sports"
+        result["website"] = self.website
 
         if row.find("span", {"class": "price"}).find("ins"):
             original_price = float(
@@ -120,14 +93,10 @@ class AstrasportsScraper(BaseScraper):
             )
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(r"(\d+[\d,]*)\s*(round)", result["title"], re.IGNORECASE)
-        if match:
-            rounds_per_case_str = match.group(1).replace(",", "")
-            rounds_per_case = int(rounds_per_case_str)
-            if rounds_per_case == 0:
-                return
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
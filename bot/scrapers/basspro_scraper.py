@@ -1,9 +1,8 @@
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,12 @@ class BassproScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "img"
+    wait_selector_state = "attached"
+    parse_only = [("div", {"class": "styles_ResultsList__FA8dO"})]
+    website = "Bass Pro"
+    structured_data = True
+
     def __init__(self, url):
         """
         Initializes the BassproScraper with a URL.
@@ -24,23 +29,6 @@ class BassproScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-            page.wait_for_selector("img", state="attached")
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -61,20 +49,6 @@ class BassproScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -87,10 +61,12 @@ class BassproScraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("a").get("title")
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://www.basspro.com{link}"
@@ -101,7 +77,7 @@ class BassproScraper(BaseScraper):
         )
         if not result["image"]:
             return
-        result["website"] = "Bass Pro"
+        result["website"] = self.website
 
         original_price_text = row.find(
             "div", {"class": "styles_PriceContainer__TySzg"}
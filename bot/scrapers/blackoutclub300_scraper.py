@@ -1,10 +1,8 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,10 @@ class Blackoutclub300Scraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.container"
+    parse_only = [("div", {"class": "product-items product-items-4"})]
+    website = "300 Black Out Club"
+
     def __init__(self, url):
         """
         Initializes the Blackoutclub300Scraper with a URL.
@@ -25,23 +27,6 @@ class Blackoutclub300Scraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.container")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -61,20 +46,6 @@ class Blackoutclub300Scraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -87,16 +58,18 @@ class Blackoutclub300Scraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("div", {"class": "name"}).find("a").text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://www.300blackoutclub.com/{link}"
         img = row.find("img", {"class": "img-responsive"}).get("src")
         result["image"] = "".join(img).replace(" ", "%20")
-        result["website"] = "300 Black Out Club"
+        result["website"] = self.website
 
         if row.find("span", {"class": "sale-price"}):
             original_price = float(
@@ -108,11 +81,10 @@ class Blackoutclub300Scraper(BaseScraper):
             )
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(r"(\d+)\s*(count|round|rd)", result["title"].lower())
-        if match:
-            rounds_per_case = int(match.group(1))
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
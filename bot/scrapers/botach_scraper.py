@@ -1,10 +1,8 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,12 @@ class BotachScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    # Lazy loading on scroll needs the real page layout
+    blocked_resource_types = frozenset(["media", "font"])
+
+    parse_only = [("div", {"class": "kuGridView"})]
+    website = "Botach"
+
     def __init__(self, url):
         """
         Initializes the BotachScraper with a URL.
@@ -25,19 +29,14 @@ class BotachScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
+    def interact(self, page):
         """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
+        Scrolls to the bottom of the page so the lazily loaded listings
+        are rendered before the content is read.
+
+        Args:
+            page (playwright.sync_api.Page): The loaded page.
         """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
 
         # Define the scrolling function
         def scroll_page():
@@ -58,8 +57,34 @@ class BotachScraper(BaseScraper):
                 break
             last_position = new_position
             page.wait_for_timeout(800)
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
+
+    async def interact_async(self, page):
+        """
+        Async counterpart of interact.
+
+        Args:
+            page (playwright.async_api.Page): The loaded page.
+        """
+
+        # Define the scrolling function
+        async def scroll_page():
+            return await page.eval_on_selector(
+                "body",
+                """body => {
+                window.scrollBy(0, window.innerHeight);
+                return window.scrollY;
+            }""",
+            )
+
+        # Scroll incrementally, waiting for a bit between each scroll.
+        last_position = 0
+        while True:
+            new_position = await scroll_page()
+            if new_position == last_position:
+                # Stop scrolling when we reach the bottom of the page
+                break
+            last_position = new_position
+            await page.wait_for_timeout(800)
 
     def process_page(self, soup):
         """
@@ -78,20 +103,6 @@ class BotachScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -104,16 +115,18 @@ class BotachScraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("div", {"class": "kuName"}).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         result["link"] = row.find("a").get("href")
         result["image"] = row.find("img").get("src")
         if "place-holder" in result["image"]:
             return
-        result["website"] = "Botach"
+        result["website"] = self.website
 
         if row.find("div", {"class": "kuSalePrice kuSpecialPrice"}):
             original_price = float(
@@ -125,11 +138,10 @@ class BotachScraper(BaseScraper):
             )
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(r"(\d+)\s*(rd|-round)", result["title"], re.IGNORECASE)
-        if match:
-            rounds_per_case = int(match.group(1))
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
@@ -1,9 +1,8 @@
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,11 @@ class BulkmunitionsScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    fetch_mode = "http"
+    wait_selector = "div#page"
+    parse_only = [("div", {"class": "yit-wcan-container"})]
+    website = "Bulk Munitions"
+
     def __init__(self, url):
         """
         Initializes the BulkmunitionsScraper with a URL.
@@ -24,23 +28,6 @@ class BulkmunitionsScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div#page")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -62,20 +49,6 @@ class BulkmunitionsScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -92,14 +65,16 @@ class BulkmunitionsScraper(BaseScraper):
             .find("h2", {"class": "woocommerce-loop-product__title"})
             .text.strip()
         )
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         result["link"] = row.find("a").get("href")
         result["image"] = row.find("img").get("src")
-        result["website"] = "Bulk Munitions"
+        result["website"] = self.website
 
         price_text = row.find("span", {"class": "price"}).find_all("bdi")
         if len(price_text) == 2:
@@ -1,10 +1,8 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,13 @@ class ClarkarmoryScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "main#site-main"
+    parse_only = [
+        ("ul", {"class": "productgrid--items"}),
+        ("ul", {"class": "pagination--inner"}),
+    ]
+    website = "Clark Armory"
+
     def __init__(self, url):
         """
         Initializes the ClarkarmoryScraper with a URL.
@@ -25,38 +30,27 @@ class ClarkarmoryScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
+    def get_next_url(self, soup):
         """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
+        Finds the URL of the next results page, if any.
+
+        Args:
+            soup (BeautifulSoup object): The parsed HTML of the page.
+
+        Returns:
+            str: The URL of the next page, or None on the last page.
         """
-        browser = self.browser
-        page = browser.new_page()
-        # Click "Next" button until it's no longer visible
-        while True:
-            try:
-                page.goto(self.url)
-            except Exception as e:
-                print(f"Unexpected error: {e} - {self.url} during page.goto")
-                traceback.print_exc()
-                return
-            page.wait_for_selector("main#site-main")
-            soup = BeautifulSoup(page.content(), "html.parser")
-            self.process_page(soup)
-            pagination = page.query_selector("li.pagination--next")
-            if pagination:
-                url = (
-                    soup.find("ul", {"class": "pagination--inner"})
-                    .find("li", {"class": "pagination--next"})
-                    .find("a")
-                    .get("href")
-                )
-                if url:
-                    self.url = f"https://clarkarmory.com{url}"
-                else:
-                    break
-            else:
-                break
+        if not soup.select_one("li.pagination--next"):
+            return None
+        url = (
+            soup.find("ul", {"class": "pagination--inner"})
+            .find("li", {"class": "pagination--next"})
+            .find("a")
+            .get("href")
+        )
+        if url:
+            return f"https://clarkarmory.com{url}"
+        return None
 
     def process_page(self, soup):
         """
@@ -75,20 +69,6 @@ class ClarkarmoryScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -106,16 +86,18 @@ class ClarkarmoryScraper(BaseScraper):
         ):
             return
         result["title"] = row.find("h2", {"class": "productitem--title"}).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://clarkarmory.com{link}"
         image = row.find("img").get("src")
         result["image"] = f"https:{image}"
-        result["website"] = "Clark Armory"
+        result["website"] = self.website
 
         original_price = float(
             row.find("div", {"class": "price__current"})
@@ -125,16 +107,10 @@ class ClarkarmoryScraper(BaseScraper):
         )
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(
-            r"(\d+[\d,]*)\s*(round|rd|per)", result["title"], re.IGNORECASE
-        )
-        if match:
-            rounds_per_case_str = match.group(1).replace(",", "")
-            rounds_per_case = int(rounds_per_case_str)
-            if rounds_per_case == 0:
-                return
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
@@ -1,112 +1,24 @@
-import re
-import traceback
 import logging
-from bs4 import BeautifulSoup
 
-from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.spec_scraper import SpecScraper
 
 logger = logging.getLogger(__name__)
 
 
-class GrabagunScraper(BaseScraper):
+class GrabagunScraper(SpecScraper):
     """
     A scraper for the Grab A Gun website.
 
-    Inherits from BaseScraper.
+    Inherits from SpecScraper.
     """
 
-    def __init__(self, url):
-        """
-        Initializes the GrabagunScraper with a URL.
+    wait_selector = "div.page-wrapper"
+    parse_only = [("ol", {"class": "products list items product-items"})]
 
-        Args:
-            url (str): The URL to be scraped.
-        """
-        super().__init__(url)
-
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.page-wrapper")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
-    def process_page(self, soup):
-        """
-        Processes the page content to extract product listings.
-
-        Args:
-            soup (BeautifulSoup object): The parsed HTML of the page.
-        """
-        try:
-            inner = soup.find(
-                "ol", {"class": "products list items product-items"}
-            ).find_all("li")
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_page")
-            traceback.print_exc()
-            return
-
-        for row in inner:
-            self.process_row(row)
-
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
-    def extract_product_info(self, row):
-        """
-        Extracts product info from a product listing.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-
-        Returns:
-            dict: A dictionary containing the extracted product info.
-        """
-        result = {}
-        result["title"] = row.find("a", {"class": "product-item-link"}).text.strip()
-        if "223" in result["title"] or "C Products" in result["title"]:
-            return
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
-        if not result["manufacturer"]:
-            return
-        result["link"] = row.find("a", {"class": "product-item-link"}).get("href")
-        result["image"] = row.find("img").get("src")
-        result["website"] = "Grab A Gun"
-
-        original_price = float(row.find("span", {"class": "price"}).text.strip("$"))
-        result["original_price"] = f"{original_price:.2f}"
-        match = re.search(
-            r"(\d+)\s*(-round|rd|round| /)", result["title"], re.IGNORECASE
-        )
-        if match:
-            rounds_per_case = int(match.group(1))
-            cpr = original_price / rounds_per_case
-            result["cpr"] = f"{cpr:.2f}"
-            self.results.append(result)
-        else:
-            return
+    website = "Grab A Gun"
+    listing = ("ol", {"class": "products list items product-items"})
+    rows = ("li", None)
+    title = ("a", {"class": "product-item-link"})
+    excluded_title_terms = ("223", "c products")
+    link = ("a", {"class": "product-item-link"})
+    price = [[("span", {"class": "price"})]]
@@ -1,10 +1,8 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,15 @@ class GreentopScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.page-wrapper"
+    wait_selector_timeout = 10000
+    parse_only = [
+        ("div", {"class": "products wrapper grid products-grid"}),
+        ("p", {"class": "toolbar-amount"}),
+        ("ul", {"class": "items pages-items"}),
+    ]
+    website = "Green Top"
+
     def __init__(self, url):
         """
         Initializes the GreentopScraper with a URL.
@@ -25,38 +32,24 @@ class GreentopScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
+    def get_next_url(self, soup):
         """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
+        Finds the URL of the next results page, if any.
+
+        Args:
+            soup (BeautifulSoup object): The parsed HTML of the page.
+
+        Returns:
+            str: The URL of the next page, or None on the last page.
         """
-        browser = self.browser
-        page = browser.new_page()
-        # Click "Next" button until it's no longer visible
-        while True:
-            try:
-                page.goto(self.url)
-                page.wait_for_selector("div.page-wrapper", timeout=10000)
-            except Exception as e:
-                print(f"Unexpected error: {e} - {self.url} during page.goto")
-                traceback.print_exc()
-                return
-            soup = BeautifulSoup(page.content(), "html.parser")
-            self.process_page(soup)
-            pagination = page.query_selector("li.item.pages-item-next")
-            if pagination:
-                url = (
-                    soup.find("ul", {"class": "items pages-items"})
-                    .find("li", {"class": "item pages-item-next"})
-                    .find("a")
-                    .get("href")
-                )
-                if url:
-                    self.url = url
-                else:
-                    break
-            else:
-                break
+        if not soup.select_one("li.item.pages-item-next"):
+            return None
+        return (
+            soup.find("ul", {"class": "items pages-items"})
+            .find("li", {"class": "item pages-item-next"})
+            .find("a")
+            .get("href")
+        )
 
     def process_page(self, soup):
         """
@@ -86,20 +79,6 @@ class GreentopScraper(BaseScraper):
         for row in inner[:products]:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -118,16 +97,18 @@ class GreentopScraper(BaseScraper):
             )
         except AttributeError:
             return
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         result["link"] = row.find("a", {"class": "product-item-link primary-info"}).get(
             "href"
         )
         result["image"] = row.find("img", {"class": "product-image-photo"}).get("src")
-        result["website"] = "Green Top"
+        result["website"] = self.website
 
         original_price = float(
             row.find("div", {"class": "secondary-info"})
@@ -137,13 +118,10 @@ class GreentopScraper(BaseScraper):
         )
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(
-            r"(\d+)\s*(rd|bx|/box|per|round|-box)", result["title"], re.IGNORECASE
-        )
-        if match:
-            rounds_per_case = int(match.group(1))
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
@@ -1,119 +1,26 @@
-import re
-import traceback
 import logging
-from bs4 import BeautifulSoup
 
-from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.spec_scraper import SpecScraper
 
 logger = logging.getLogger(__name__)
 
 
-class GunrunusaScraper(BaseScraper):
+class GunrunusaScraper(SpecScraper):
     """
     A scraper for the Gun Run USA website.
 
-    Inherits from BaseScraper.
+    Inherits from SpecScraper.
     """
 
-    def __init__(self, url):
-        """
-        Initializes the GunrunusaScraper with a URL.
-
-        Args:
-            url (str): The URL to be scraped.
-        """
-        super().__init__(url)
-
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div#view")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
-    def process_page(self, soup):
-        """
-        Processes the page content to extract product listings.
-
-        Args:
-            soup (BeautifulSoup object): The parsed HTML of the page.
-        """
-        try:
-            inner = soup.find(
-                "ul", {"class": "products columns-3 tablet-columns-3 mobile-columns-2"}
-            ).find_all("li")
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_page")
-            traceback.print_exc()
-            return
-
-        for row in inner:
-            self.process_row(row)
-
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
-    def extract_product_info(self, row):
-        """
-        Extracts product info from a product listing.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-
-        Returns:
-            dict: A dictionary containing the extracted product info.
-        """
-        result = {}
-        if row.find("span", {"class": "woostify-out-of-stock-label position-left"}):
-            return
-        result["title"] = row.find(
-            "h2", {"class": "woocommerce-loop-product__title"}
-        ).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
-        if not result["manufacturer"]:
-            return
-        result["link"] = row.find("a").get("href")
-        result["image"] = row.find("img").get("data-src")
-        result["website"] = "Gun Run USA"
-
-        price_text = row.find(
-            "span", {"class": "woocommerce-Price-amount amount"}
-        ).text.strip("$")
-        original_price = float(price_text)
-        result["original_price"] = f"{original_price:.2f}"
-
-        match = re.search(r"(\d+[\d,]*)\s*(round|rd)", result["title"], re.IGNORECASE)
-        if match:
-            rounds_per_case_str = match.group(1).replace(",", "")
-            rounds_per_case = int(rounds_per_case_str)
-            if rounds_per_case == 0:
-                return
-            cpr = original_price / rounds_per_case
-            result["cpr"] = f"{cpr:.2f}"
-            self.results.append(result)
-        else:
-            return
+    wait_selector = "div#view"
+    parse_only = [
+        ("ul", {"class": "products columns-3 tablet-columns-3 mobile-columns-2"}),
+    ]
+
+    website = "Gun Run USA"
+    listing = ("ul", {"class": "products columns-3 tablet-columns-3 mobile-columns-2"})
+    rows = ("li", None)
+    sold_out = ("span", {"class": "woostify-out-of-stock-label position-left"})
+    title = ("h2", {"class": "woocommerce-loop-product__title"})
+    image_attr = "data-src"
+    price = [[("span", {"class": "woocommerce-Price-amount amount"})]]
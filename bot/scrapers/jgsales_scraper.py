@@ -1,117 +1,40 @@
-import re
-import traceback
 import logging
-from bs4 import BeautifulSoup
 
-from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.spec_scraper import SpecScraper
 
 logger = logging.getLogger(__name__)
 
 
-class JgsalesScraper(BaseScraper):
+class JgsalesScraper(SpecScraper):
     """
     A scraper for the J&G Sales website.
 
-    Inherits from BaseScraper.
+    Inherits from SpecScraper.
     """
 
-    def __init__(self, url):
-        """
-        Initializes the JgsalesScraper with a URL.
+    fetch_mode = "http"
+    wait_selector = "div.page-wrapper"
+    parse_only = [("ul", {"class": "products"})]
 
-        Args:
-            url (str): The URL to be scraped.
-        """
-        super().__init__(url)
-
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.page-wrapper")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
+    website = "J&G Sales"
+    listing = ("ul", {"class": "products"})
+    rows = ("li", None)
+    title = ("h3", {"class": "woocommerce-loop-product__title"})
+    image = [("div", {"class": "product-image"}), ("img", None)]
+    image_attr = "data-oi"
+    price = [
+        [("span", {"class": "price"}), ("ins", None), ("bdi", None)],
+        [("span", {"class": "price"}), ("bdi", None)],
+    ]
 
-    def process_page(self, soup):
+    def accepts_title(self, title):
         """
-        Processes the page content to extract product listings.
+        Skips .223 listings, except the ones also chambered in 5.56.
 
         Args:
-            soup (BeautifulSoup object): The parsed HTML of the page.
-        """
-        try:
-            inner = soup.find("ul", {"class": "products"}).find_all("li")
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_page")
-            traceback.print_exc()
-            return
-
-        for row in inner:
-            self.process_row(row)
-
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
-    def extract_product_info(self, row):
-        """
-        Extracts product info from a product listing.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
+            title (str): The listing title.
 
         Returns:
-            dict: A dictionary containing the extracted product info.
+            bool: Whether the listing is kept.
         """
-        result = {}
-        result["title"] = row.find(
-            "h3", {"class": "woocommerce-loop-product__title"}
-        ).text.strip()
-        if "223" in result["title"] and "5.56" not in result["title"]:
-            return
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
-        if not result["manufacturer"]:
-            return
-        result["link"] = row.find("a").get("href")
-        result["image"] = (
-            row.find("div", {"class": "product-image"}).find("img").get("data-oi")
-        )
-        result["website"] = "J&G Sales"
-
-        price_text = row.find("span", {"class": "price"}).find_all("bdi")
-        if len(price_text) == 1:
-            original_price = float(price_text[0].text.strip("$"))
-        elif len(price_text) == 2:
-            original_price = float(price_text[1].text.strip("$"))
-        result["original_price"] = f"{original_price:.2f}"
-
-        match = re.search(r"(\d+)\s*(rd)", result["title"].lower())
-        if match:
-            rounds_per_case = int(match.group(1))
-            cpr = original_price / rounds_per_case
-            result["cpr"] = f"{cpr:.2f}"
-            self.results.append(result)
-        else:
-            return
+        return "223" not in title or "5.56" in title
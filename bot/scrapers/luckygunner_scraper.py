@@ -1,9 +1,8 @@
 import logging
 import traceback
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,10 @@ class LuckygunnerScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.full-width-wrapper"
+    parse_only = [("ol", {"class": "products-list"})]
+    website = "Lucky Gunner"
+
     def __init__(self, url):
         """
         Initializes the LuckygunnerScraper with a URL.
@@ -24,23 +27,6 @@ class LuckygunnerScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.full-width-wrapper")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -60,20 +46,6 @@ class LuckygunnerScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -88,14 +60,16 @@ class LuckygunnerScraper(BaseScraper):
         result["title"] = (
             row.find("h3", {"class": "product-name"}).find("a").text.strip()
         )
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         result["link"] = row.find("a", {"class": "product-image"}).get("href")
         result["image"] = row.find("a", {"class": "product-image"}).find("img")["src"]
-        result["website"] = "Lucky Gunner"
+        result["website"] = self.website
 
         price_box_count = len(row.find("div", {"class": "price-box"}).find_all("span"))
         if price_box_count == 1:
@@ -1,9 +1,8 @@
 import logging
 import traceback
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,10 @@ class MackspwScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div#main-container"
+    parse_only = [("div", {"class": "facets-facet-browse-items"})]
+    website = "Mack's Prairie Wings"
+
     def __init__(self, url):
         """
         Initializes the MackspwScraper with a URL.
@@ -24,23 +27,6 @@ class MackspwScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div#main-container")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -79,19 +65,6 @@ class MackspwScraper(BaseScraper):
         for row in all_div:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -108,16 +81,18 @@ class MackspwScraper(BaseScraper):
         result["title"] = row.find(
             "a", {"class": "facets-item-cell-grid-title"}
         ).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a", {"class": "facets-item-cell-grid-title"}).get("href")
         result["link"] = f"https://www.mackspw.com{link}"
         img = row.find("img", {"class": "facets-item-cell-grid-image"}).get("src")
         result["image"] = "".join(img).replace(" ", "%20")
-        result["website"] = "Mack's Prairie Wings"
+        result["website"] = self.website
         original_price = float(
             row.find("span", {"class": "product-views-price-lead"}).text.strip(" $")
         )
@@ -1,10 +1,8 @@
-import time
 import logging
 import traceback
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,11 @@ class NatchezScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div#root"
+    settle_delay = 5000
+    parse_only = [("div", {"class": "sc-fmdNqN hyACbC"})]
+    website = "Natchez Shooting & Outdoors"
+
     def __init__(self, url):
         """
         Initializes the NatchezScraper with a URL.
@@ -25,24 +28,6 @@ class NatchezScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div#root")
-        time.sleep(5)
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -60,20 +45,6 @@ class NatchezScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -88,15 +59,17 @@ class NatchezScraper(BaseScraper):
         result["title"] = row.find(
             "p", {"class": "sc-dWBRfb sc-jHcXXw iWqacH jXsVSz"}
         ).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://www.natchezss.com{link}"
         result["image"] = row.find("img").get("src")
-        result["website"] = "Natchez Shooting & Outdoors"
+        result["website"] = self.website
 
         price_box = row.find("div", {"class": "sc-fXgAZx ZjOLI"}).find_all("span")
         if len(price_box) == 1:
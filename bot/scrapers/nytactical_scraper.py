@@ -1,10 +1,9 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
 from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +15,12 @@ class NytacticalScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    # The Next button is found by visibility, which needs styles
+    blocked_resource_types = frozenset(["media", "font"])
+
+    parse_only = [("div", {"class": "col-lg-10"})]
+    website = "2NY Tactical"
+
     def __init__(self, url):
         """
         Initializes the NytacticalScraper with a URL.
@@ -30,24 +35,69 @@ class NytacticalScraper(BaseScraper):
         Navigates to the URL, waits for the page to load, then processes
         the page content to extract data.
         """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        # Click "Next" button until it's no longer visible
-        while True:
-            soup = BeautifulSoup(page.content(), "html.parser")
-            self.process_page(soup)
-            next_button_locator = page.locator('ul.pagination >> text="Next ›"')
-            if next_button_locator.is_visible():
-                next_button_locator.click()
-                page.wait_for_load_state("load")
-            else:
-                break
+        stats = self.stats
+        with self.open_page() as page:
+            stats.start_step(self.url, "browser")
+            try:
+                with stats.phase("goto"):
+                    page.goto(self.url)
+            except Exception as e:
+                print(f"Unexpected error: {e} - {self.url} during page.goto")
+                traceback.print_exc()
+                stats.error("goto")
+                stats.end_step()
+                return
+            # Click "Next" button until it's no longer visible
+            while True:
+                with stats.phase("content"):
+                    html = page.content()
+                stats.read_html(html)
+                self.process_html(html)
+                stats.end_step()
+                next_button_locator = page.locator('ul.pagination >> text="Next ›"')
+                with stats.phase("interact"):
+                    visible = next_button_locator.is_visible()
+                if not visible:
+                    break
+                stats.start_step(self.url, "browser")
+                with stats.phase("interact"):
+                    next_button_locator.click()
+                    page.wait_for_load_state("load")
+                self.url = stats.step["url"] = page.url
+
+    async def scrape_async(self):
+        """
+        Async counterpart of scrape.
+        """
+        stats = self.stats
+        async with self.open_page_async() as page:
+            stats.start_step(self.url, "browser")
+            try:
+                with stats.phase("goto"):
+                    await page.goto(self.url)
+            except Exception as e:
+                print(f"Unexpected error: {e} - {self.url} during page.goto")
+                traceback.print_exc()
+                stats.error("goto")
+                stats.end_step()
+                return
+            # Click "Next" button until it's no longer visible
+            while True:
+                with stats.phase("content"):
+                    html = await page.content()
+                stats.read_html(html)
+                await self.process_html_async(html)
+                stats.end_step()
+                next_button_locator = page.locator('ul.pagination >> text="Next ›"')
+                with stats.phase("interact"):
+                    visible = await next_button_locator.is_visible()
+                if not visible:
+                    break
+                stats.start_step(self.url, "browser")
+                with stats.phase("interact"):
+                    await next_button_locator.click()
+                    await page.wait_for_load_state("load")
+                self.url = stats.step["url"] = page.url
 
     def process_page(self, soup):
         """
@@ -71,20 +121,6 @@ class NytacticalScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -97,12 +133,14 @@ class NytacticalScraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("div", {"class": "description"}).text.strip()
+        title_class = classify_title(result["title"])
         # Check if the title contains a round count
-        match = re.search(r"(\d+)\s*(rd|round|pk|-pk|-pack|/)", result["title"].lower())
-        if not match:
+        rounds_per_case = title_class.round_count
+        if not rounds_per_case:
+            self.drop("round_count")
             return
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
         manufacturer = (
             row.find("div", {"class": "grid-description"})
             .find("span", {"class": "small"})
@@ -110,11 +148,12 @@ class NytacticalScraper(BaseScraper):
         )
         result["manufacturer"] = get_manufacturer(manufacturer)
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://www.2nytactical.com{link}"
         result["image"] = row.find("img", {"class": "img-responsive"})["src"]
-        result["website"] = "2NY Tactical"
+        result["website"] = self.website
 
         if row.find("div", {"class": "price"}).find("span", {"class": "text-success"}):
             original_price = float(
@@ -126,7 +165,6 @@ class NytacticalScraper(BaseScraper):
             original_price = float(row.find("div", {"class": "price"}).text.strip("$"))
         result["original_price"] = f"{original_price:.2f}"
 
-        rounds_per_case = int(match.group(1))
         cpr = original_price / rounds_per_case
         result["cpr"] = f"{cpr:.2f}"
         self.results.append(result)
@@ -1,9 +1,8 @@
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,21 @@ class OpticsplanetScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div#list-page-main"
+    parse_only = [
+        (
+            "div",
+            {
+                "class": (
+                    "grid-c__main products qa-grid-c__main op-plugin "
+                    "op-widget-initialized"
+                )
+            },
+        ),
+    ]
+    website = "Optics Planet"
+    excluded_title_terms = ("223",)
+
     def __init__(self, url):
         """
         Initializes the OpticsplanetScraper with a URL.
@@ -24,23 +38,6 @@ class OpticsplanetScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div#list-page-main")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -66,20 +63,6 @@ class OpticsplanetScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -92,16 +75,18 @@ class OpticsplanetScraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("span", {"class": "grid__text"}).text.strip()
-        if "223" in result["title"]:
+        if not self.accepts_title(result["title"]):
             return
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         result["link"] = row.find("a").get("href")
         result["image"] = row.find("img").get("src")
-        result["website"] = "Optics Planet"
+        result["website"] = self.website
 
         original_price = float(
             row.find("span", {"class": "variant-price-dollars"}).text.strip().strip("$")
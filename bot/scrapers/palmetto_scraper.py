@@ -1,119 +1,32 @@
-import re
-import time
 import logging
-import traceback
-from bs4 import BeautifulSoup
 
-from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.spec_scraper import SpecScraper
 
 logger = logging.getLogger(__name__)
 
 
-class PalmettoScraper(BaseScraper):
+class PalmettoScraper(SpecScraper):
     """
     A scraper for the Palmetto State Armory website.
 
-    Inherits from BaseScraper.
+    Inherits from SpecScraper.
     """
 
-    def __init__(self, url):
-        """
-        Initializes the PalmettoScraper with a URL.
-
-        Args:
-            url (str): The URL to be scraped.
-        """
-        super().__init__(url)
-
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url, wait_until="networkidle")
-            page.wait_for_selector("ol.products")
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
-    def process_page(self, soup):
-        """
-        Processes the page content to extract product listings.
-
-        Args:
-            soup (BeautifulSoup object): The parsed HTML of the page.
-        """
-        try:
-            inner = soup.find(
-                "ol", {"class": "products list items product-items"}
-            ).find_all("li")
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_page")
-            traceback.print_exc()
-            return
-
-        for row in inner:
-            self.process_row(row)
-
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
-    def extract_product_info(self, row):
-        """
-        Extracts product info from a product listing.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-
-        Returns:
-            dict: A dictionary containing the extracted product info.
-        """
-        result = {}
-        if row.find("span", {"class": "items-count"}):
-            return
-        result["title"] = row.find("a", {"class": "product-item-link"}).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
-        if not result["manufacturer"]:
-            return
-        result["link"] = row.find("a", {"class": "product-item-link"}).get("href")
-        result["image"] = row.find("img", {"class": "product-image-photo"})["src"]
-        result["website"] = "Palmetto State Armory"
-
-        original_price = float(
-            row.find("span", {"class": "price-wrapper final-price"})
-            .find("span", {"class": "price"})
-            .text.strip()
-            .strip("$")
-        )
-        result["original_price"] = f"{original_price:.2f}"
-        match = re.search(r"(\d+[\d,]*)\s*(rds|rd b)", result["title"], re.IGNORECASE)
-        if match:
-            rounds_per_case_str = match.group(1).replace(",", "")
-            rounds_per_case = int(rounds_per_case_str)
-            if rounds_per_case == 0:
-                return
-            cpr = original_price / rounds_per_case
-            result["cpr"] = f"{cpr:.2f}"
-            self.results.append(result)
-        else:
-            return
+    wait_until = "networkidle"
+    wait_selector = "ol.products"
+    parse_only = [("ol", {"class": "products list items product-items"})]
+
+    website = "Palmetto State Armory"
+    listing = ("ol", {"class": "products list items product-items"})
+    rows = ("li", None)
+    # The item count row at the end of the grid is not a product
+    sold_out = ("span", {"class": "items-count"})
+    title = ("a", {"class": "product-item-link"})
+    link = ("a", {"class": "product-item-link"})
+    image = ("img", {"class": "product-image-photo"})
+    price = [
+        [
+            ("span", {"class": "price-wrapper final-price"}),
+            ("span", {"class": "price"}),
+        ],
+    ]
@@ -1,127 +1,29 @@
-import re
-import traceback
 import logging
-from bs4 import BeautifulSoup
 
-from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.spec_scraper import SpecScraper
 
 logger = logging.getLogger(__name__)
 
 
-class RivertownmunitionsScraper(BaseScraper):
+class RivertownmunitionsScraper(SpecScraper):
     """
     A scraper for the River Town Munitions website.
 
-    Inherits from BaseScraper.
+    Inherits from SpecScraper.
     """
 
-    def __init__(self, url):
-        """
-        Initializes the RivertownmunitionsScraper with a URL.
-
-        Args:
-            url (str): The URL to be scraped.
-        """
-        super().__init__(url)
-
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div#content")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
-    def process_page(self, soup):
-        """
-        Processes the page content to extract product listings.
-
-        Args:
-            soup (BeautifulSoup object): The parsed HTML of the page.
-        """
-        try:
-            inner = soup.find(
-                "ul", {"class": "products elementor-grid columns-3"}
-            ).find_all(
-                "li",
-                {"class": "ast-grid-common-col"},
-            )
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_page")
-            traceback.print_exc()
-            return
-
-        for row in inner:
-            self.process_row(row)
-
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
-    def extract_product_info(self, row):
-        """
-        Extracts product info from a product listing.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-
-        Returns:
-            dict: A dictionary containing the extracted product info.
-        """
-        result = {}
-        if row.find("span", {"class": "ast-shop-product-out-of-stock"}):
-            return
-        result["title"] = row.find(
-            "h2", {"class": "woocommerce-loop-product__title"}
-        ).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
-        if not result["manufacturer"]:
-            return
-        result["link"] = row.find("a").get("href")
-        result["image"] = row.find(
-            "img",
-            {"class": "attachment-woocommerce_thumbnail"},
-        ).get("data-lazy-src")
-        result["website"] = "River Town Munitions"
-
-        price_text = row.find("span", {"class": "price"}).find_all("bdi")
-        if len(price_text) == 1:
-            original_price = float(price_text[0].text.strip("$"))
-        elif len(price_text) == 2:
-            original_price = float(price_text[1].text.strip("$"))
-        result["original_price"] = f"{original_price:.2f}"
-
-        match = re.search(
-            r"(\d+)\s*((rd box\))|(rd case\))|(rd brick\))|round)",
-            result["title"],
-            re.IGNORECASE,
-        )
-        if match:
-            rounds_per_case = int(match.group(1))
-            cpr = original_price / rounds_per_case
-            result["cpr"] = f"{cpr:.2f}"
-            self.results.append(result)
-        else:
-            return
+    fetch_mode = "http"
+    wait_selector = "div#content"
+    parse_only = [("ul", {"class": "products elementor-grid columns-3"})]
+
+    website = "River Town Munitions"
+    listing = ("ul", {"class": "products elementor-grid columns-3"})
+    rows = ("li", {"class": "ast-grid-common-col"})
+    sold_out = ("span", {"class": "ast-shop-product-out-of-stock"})
+    title = ("h2", {"class": "woocommerce-loop-product__title"})
+    image = ("img", {"class": "attachment-woocommerce_thumbnail"})
+    image_attr = "data-lazy-src"
+    price = [
+        [("span", {"class": "price"}), ("ins", None), ("bdi", None)],
+        [("span", {"class": "price"}), ("bdi", None)],
+    ]
@@ -1,9 +1,8 @@
 import logging
 import traceback
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,12 @@ class SgammoScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    fetch_mode = "http"
+    wait_selector = "div#main-wrapper"
+    parse_only = [("table", {"class": "category-products sticky-enabled sticky-table"})]
+    website = "SG Ammo"
+    excluded_title_terms = ("223",)
+
     def __init__(self, url):
         """
         Initializes the SgammoScraper with a URL.
@@ -24,23 +29,6 @@ class SgammoScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div#main-wrapper")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -77,20 +65,6 @@ class SgammoScraper(BaseScraper):
             for row in odd_or_even:
                 self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -105,19 +79,21 @@ class SgammoScraper(BaseScraper):
         if row.find("td", {"class": "cell-qty"}).text.strip() == "0":
             return
         result["title"] = row.find("h2").text.strip()
-        if "223" in result["title"].lower():
+        if not self.accepts_title(result["title"]):
             return
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://www.sgammo.com{link}"
         result["image"] = row.find(
             "img", {"class": "imagecache imagecache-product_list"}
         ).get("src")
-        result["website"] = "SG Ammo"
+        result["website"] = self.website
 
         price_cell = row.find("td", {"class": "price-cell"}).find_all("span")
         original_price = float(price_cell[0].text.strip("$"))
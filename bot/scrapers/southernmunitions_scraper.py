@@ -1,10 +1,8 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
-from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +14,14 @@ class SouthernmunitionsScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "ul.products"
+    wait_selector_timeout = 10000
+    parse_only = [
+        ("ul", {"class": "products columns-3"}),
+        ("ul", {"class": "page-numbers"}),
+    ]
+    website = "Southern Munitions"
+
     def __init__(self, url):
         """
         Initializes the SouthernmunitionsScraper with a URL.
@@ -25,37 +31,26 @@ class SouthernmunitionsScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
+    def get_next_url(self, soup):
         """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
+        Finds the URL of the next results page, if any.
+
+        Args:
+            soup (BeautifulSoup object): The parsed HTML of the page.
+
+        Returns:
+            str: The URL of the next page, or None on the last page.
         """
-        browser = self.browser
-        page = browser.new_page()
-        # Click "Next" button until it's no longer visible
-        while True:
-            try:
-                page.goto(self.url)
-                page.wait_for_selector("ul.products", timeout=10000)
-            except Exception as e:
-                print(f"Unexpected error: {e} - {self.url} during page.goto")
-                traceback.print_exc()
-                return
-            soup = BeautifulSoup(page.content(), "html.parser")
-            self.process_page(soup)
-            pagination = page.query_selector("a.next.page-numbers")
-            if pagination:
-                url = (
-                    soup.find("ul", {"class": "page-numbers"})
-                    .find("a", {"class": "next page-numbers"})
-                    .get("href")
-                )
-                if url:
-                    self.url = f"https://southernmunitions.com{url}"
-                else:
-                    break
-            else:
-                break
+        if not soup.select_one("a.next.page-numbers"):
+            return None
+        url = (
+            soup.find("ul", {"class": "page-numbers"})
+            .find("a", {"class": "next page-numbers"})
+            .get("href")
+        )
+        if url:
+            return f"https://southernmunitions.com{url}"
+        return None
 
     def process_page(self, soup):
         """
@@ -79,20 +74,6 @@ class SouthernmunitionsScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -107,16 +88,18 @@ class SouthernmunitionsScraper(BaseScraper):
         result["title"] = row.find(
             "h2", {"class": "woocommerce-loop-product__title"}
         ).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
-        result["manufacturer"] = get_manufacturer(result["title"])
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
+        result["manufacturer"] = title_class.manufacturer
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         result["link"] = row.find("a").get("href")
         result["image"] = row.find("img").get("src")
         if "placeholder" in result["image"]:
             return
-        result["website"] = "Southern Munitions"
+        result["website"] = self.website
 
         prices = row.find("span", {"class": "price"}).find_all(
             "span", {"class": "woocommerce-Price-amount amount"}
@@ -129,15 +112,10 @@ class SouthernmunitionsScraper(BaseScraper):
             return
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(
-            r"(\d+[\d,]*)\s*(rd|round|rnd)",
-            result["title"].replace(",", ""),
-            re.IGNORECASE,
-        )
-        if match:
-            rounds_per_case = int(match.group(1))
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
@@ -1,10 +1,9 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
 from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +15,11 @@ class SportsmanfulfillmentScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.productBlockContainer"
+    wait_selector_timeout = 10000
+    parse_only = [("div", {"class": "productBlockContainer columns-4"})]
+    website = "Sportsman Fulfillment"
+
     def __init__(self, url):
         """
         Initializes the SportsmanfulfillmentScraper with a URL.
@@ -25,23 +29,6 @@ class SportsmanfulfillmentScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-            page.wait_for_selector("div.productBlockContainer", timeout=10000)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -61,20 +48,6 @@ class SportsmanfulfillmentScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -87,16 +60,18 @@ class SportsmanfulfillmentScraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("h3", {"class": "prod-name"}).text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
         manufacturer = row.find("p", {"class": "prod-brand"}).text.strip()
         result["manufacturer"] = get_manufacturer(manufacturer.capitalize())
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://www.sportsmanfulfillment.com{link}"
         result["image"] = row.find("img", {"class": "card-image"}).get("src")
-        result["website"] = "Sportsman Fulfillment"
+        result["website"] = self.website
 
         if row.find("span", {"class": "price price--withoutTax price--sale-price"}):
             price_text = row.find(
@@ -112,14 +87,10 @@ class SportsmanfulfillmentScraper(BaseScraper):
             original_price = float(price_text)
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(r"(\d+[\d,]*)\s*(round)", result["title"], re.IGNORECASE)
-        if match:
-            rounds_per_case_str = match.group(1).replace(",", "")
-            rounds_per_case = int(rounds_per_case_str)
-            if rounds_per_case == 0:
-                return
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = original_price / rounds_per_case
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
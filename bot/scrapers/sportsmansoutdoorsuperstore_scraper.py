@@ -1,8 +1,8 @@
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,10 @@ class SportsmansoutdoorsuperstoreScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.container-fluid"
+    parse_only = [("div", {"class": "row padding-v-10"})]
+    website = "Sportsmans Outdoor Superstore"
+
     def __init__(self, url):
         """
         Initializes the SportsmansoutdoorsuperstoreScraper with a URL.
@@ -23,23 +27,6 @@ class SportsmansoutdoorsuperstoreScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.container-fluid")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -60,20 +47,6 @@ class SportsmansoutdoorsuperstoreScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -94,12 +67,13 @@ class SportsmansoutdoorsuperstoreScraper(BaseScraper):
             result["title"] = (
                 row.find("div", {"class": "prd-info"}).find("h2").text.strip()
             )
-            result["steel_casing"] = "steel" in result["title"].lower()
-            result["remanufactured"] = "reman" in result["title"].lower()
+            title_class = classify_title(result["title"])
+            result["steel_casing"] = title_class.steel_casing
+            result["remanufactured"] = title_class.remanufactured
             result["link"] = row.find("a").get("href")
             image = row.find("img").get("src")
             result["image"] = f"https://www.sportsmansoutdoorsuperstore.com{image}"
-            result["website"] = "Sportsmans Outdoor Superstore"
+            result["website"] = self.website
 
             original_price = float(
                 row.find("ul", {"class": "list-unstyled"})
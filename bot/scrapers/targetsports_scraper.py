@@ -1,10 +1,9 @@
-import time
 import logging
 import traceback
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
 from bot.base.get_manufacturer import get_manufacturer
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +15,14 @@ class TargetsportsScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.product-listing-sort"
+
+    # The filter controls are found by visibility, which needs styles
+    blocked_resource_types = frozenset(["media", "font"])
+
+    parse_only = [("div", {"class": "ResultsArea"})]
+    website = "Target Sports USA"
+
     def __init__(self, url):
         """
         Initializes the TargetsportsScraper with a URL.
@@ -25,20 +32,13 @@ class TargetsportsScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
+    def interact(self, page):
         """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
+        Filters to in-stock items and shows all results on one page.
+
+        Args:
+            page (playwright.sync_api.Page): The loaded page.
         """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.product-listing-sort")
         # Click "In Stock Only" button if it's visible
         in_stock_only_button_locator = page.locator("input#stockFilter")
         if in_stock_only_button_locator.is_visible():
@@ -47,10 +47,24 @@ class TargetsportsScraper(BaseScraper):
         per_page_button_locator = page.locator("select.PageSizePicker")
         if per_page_button_locator.is_visible():
             per_page_button_locator.select_option(value="All")
-            time.sleep(2)
+            page.wait_for_timeout(2000)
 
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
+    async def interact_async(self, page):
+        """
+        Async counterpart of interact.
+
+        Args:
+            page (playwright.async_api.Page): The loaded page.
+        """
+        # Click "In Stock Only" button if it's visible
+        in_stock_only_button_locator = page.locator("input#stockFilter")
+        if await in_stock_only_button_locator.is_visible():
+            await in_stock_only_button_locator.click()
+        # Click "All" button if it's visible
+        per_page_button_locator = page.locator("select.PageSizePicker")
+        if await per_page_button_locator.is_visible():
+            await per_page_button_locator.select_option(value="All")
+            await page.wait_for_timeout(2000)
 
     def process_page(self, soup):
         """
@@ -75,20 +89,6 @@ class TargetsportsScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -101,16 +101,18 @@ class TargetsportsScraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("h2").text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
         manufacturer = row.find("h2").find("strong").text.strip()
         result["manufacturer"] = get_manufacturer(manufacturer)
         if not result["manufacturer"]:
+            self.drop("manufacturer")
             return
         link = row.find("a").get("href")
         result["link"] = f"https://www.targetsportsusa.com{link}"
         result["image"] = row.find("img", {"class": "product-image"}).get("src")
-        result["website"] = "Target Sports USA"
+        result["website"] = self.website
 
         prices = list(
             filter(
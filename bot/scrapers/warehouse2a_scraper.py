@@ -1,9 +1,8 @@
-import re
 import traceback
 import logging
-from bs4 import BeautifulSoup
 
 from bot.base.base_scraper import BaseScraper
+from bot.base.title_classifier import classify_title
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,10 @@ class Warehouse2aScraper(BaseScraper):
     Inherits from BaseScraper.
     """
 
+    wait_selector = "div.body"
+    parse_only = [("ul", {"class": "productGrid--maxCol3"})]
+    website = "2A Warehouse"
+
     def __init__(self, url):
         """
         Initializes the Warehouse2aScraper with a URL.
@@ -24,23 +27,6 @@ class Warehouse2aScraper(BaseScraper):
         """
         super().__init__(url)
 
-    def scrape(self):
-        """
-        Navigates to the URL, waits for the page to load, then processes
-        the page content to extract data.
-        """
-        browser = self.browser
-        page = browser.new_page()
-        try:
-            page.goto(self.url)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during page.goto")
-            traceback.print_exc()
-            return
-        page.wait_for_selector("div.body")
-        soup = BeautifulSoup(page.content(), "html.parser")
-        self.process_page(soup)
-
     def process_page(self, soup):
         """
         Processes the page content to extract product listings.
@@ -62,20 +48,6 @@ class Warehouse2aScraper(BaseScraper):
         for row in inner:
             self.process_row(row)
 
-    def process_row(self, row):
-        """
-        Processes a single product listing to extract product info.
-
-        Args:
-            row (bs4.element.Tag): The HTML element representing a product listing.
-        """
-        try:
-            self.extract_product_info(row)
-        except Exception as e:
-            print(f"Unexpected error: {e} - {self.url} during process_row")
-            traceback.print_exc()
-            return
-
     def extract_product_info(self, row):
         """
         Extracts product info from a product listing.
@@ -88,13 +60,14 @@ class Warehouse2aScraper(BaseScraper):
         """
         result = {}
         result["title"] = row.find("h4", {"class": "card-title"}).find("a").text.strip()
-        result["steel_casing"] = "steel" in result["title"].lower()
-        result["remanufactured"] = "reman" in result["title"].lower()
+        title_class = classify_title(result["title"])
+        result["steel_casing"] = title_class.steel_casing
+        result["remanufactured"] = title_class.remanufactured
         result["link"] = row.find("h4", {"class": "card-title"}).find("a").get("href")
         result["image"] = row.find("span", {"class": "card-image-wrapper"}).find(
             "img", {"class": "card-image"}
         )["data-src"]
-        result["website"] = "2A Warehouse"
+        result["website"] = self.website
 
         original_price = float(
             row.find(
@@ -103,13 +76,10 @@ class Warehouse2aScraper(BaseScraper):
         )
         result["original_price"] = f"{original_price:.2f}"
 
-        match = re.search(
-            r"(\d+[\d,]*)\s*(rd|round)", result["title"].replace(",", ""), re.IGNORECASE
-        )
-        if match:
-            rounds_per_case = int(match.group(1))
+        rounds_per_case = title_class.round_count
+        if rounds_per_case:
             cpr = float(original_price / rounds_per_case)
             result["cpr"] = f"{cpr:.2f}"
             self.results.append(result)
         else:
-            return
+            self.drop("round_count")
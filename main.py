@@ -1,8 +1,25 @@
+import argparse
+import asyncio
+import functools
 import pprint
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from decouple import config
 
 from bot.base.get_scraper import get_scraper
 from bot.base.base_scraper import ScraperBot
+from bot.base.browser_session import (
+    AsyncBrowserProfiles,
+    AsyncBrowserSession,
+    BrowserProfiles,
+    BrowserSession,
+)
+from bot.base.deal_store import DealStore
+from bot.base.get_caliber import get_calibers
+from bot.base.html_cache import HtmlCache
+from bot.base.metrics import Metrics
+from bot.base.profiling import DEFAULT_TOP, ScrapeProfiler
+from bot.base.row_store import RowStore
+from bot.base.title_classifier import classifier
 
 
 CALIBERS = [
@@ -15,15 +32,104 @@ CALIBERS = [
     "7.62x39mm",
 ]
 
+# Drive the scrapers concurrently on playwright's async API
+SCRAPER_ASYNC = config("SCRAPER_ASYNC", default=False, cast=bool)
+SCRAPER_CONCURRENCY = config("SCRAPER_CONCURRENCY", default=8, cast=int)
+# Parse pages in this many processes while async fetching continues
+SCRAPER_PARSE_WORKERS = config("SCRAPER_PARSE_WORKERS", default=0, cast=int)
+# Split the scrapers across this many processes, one browser each
+SCRAPER_WORKERS = config("SCRAPER_WORKERS", default=1, cast=int)
+# Run Chromium on persistent profiles here, keeping cookies and its disk
+# cache between runs
+SCRAPER_PROFILE_DIR = config("SCRAPER_PROFILE_DIR", default="")
+# Abort image, font, stylesheet, media and tracker requests. Off by default
+# on persistent profiles, since routed pages bypass Chromium's disk cache.
+SCRAPER_BLOCK_REQUESTS = config(
+    "SCRAPER_BLOCK_REQUESTS", default=not SCRAPER_PROFILE_DIR, cast=bool
+)
+# html.parser, lxml, html5lib or selectolax
+SCRAPER_PARSER = config("SCRAPER_PARSER", default=None)
+# Keep fetched pages in this directory and reuse them within the TTL
+SCRAPER_CACHE_DIR = config("SCRAPER_CACHE_DIR", default="")
+SCRAPER_CACHE_TTL = config("SCRAPER_CACHE_TTL", default=3600, cast=int)
+# Remember extracted rows here and skip rows whose HTML did not change
+SCRAPER_ROW_STORE_DIR = config("SCRAPER_ROW_STORE_DIR", default="")
+# Keep the deals and their price history in this SQLite database
+SCRAPER_DB_PATH = config("SCRAPER_DB_PATH", default="")
+# Keep classified titles in this file between runs
+SCRAPER_TITLE_CACHE_PATH = config("SCRAPER_TITLE_CACHE_PATH", default="")
+# "record" each site's browser traffic to a HAR in SCRAPER_HAR_DIR, or
+# "replay" it from there without the network
+SCRAPER_HAR_MODE = config("SCRAPER_HAR_MODE", default="")
+SCRAPER_HAR_DIR = config("SCRAPER_HAR_DIR", default="hars")
+# Write the time each site spent in each phase, with its page sizes and
+# row counts, to this JSON file after every run
+SCRAPER_REPORT_PATH = config("SCRAPER_REPORT_PATH", default="")
+# Export Prometheus metrics per site to this file after every run, and
+# serve them at http://127.0.0.1:<port>/metrics while the bot runs
+SCRAPER_METRICS_PATH = config("SCRAPER_METRICS_PATH", default="")
+SCRAPER_METRICS_PORT = config("SCRAPER_METRICS_PORT", default=0, cast=int)
 
-def run_scraper_for_caliber(caliber):
+
+def get_cache():
+    """
+    Opens the page cache configured by SCRAPER_CACHE_DIR.
+
+    :return: An HtmlCache, or None if caching is off.
+    """
+    if not SCRAPER_CACHE_DIR:
+        return None
+    return HtmlCache(SCRAPER_CACHE_DIR, ttl=SCRAPER_CACHE_TTL)
+
+
+@functools.lru_cache(maxsize=None)
+def get_metrics():
+    """
+    Sets up the metrics configured by SCRAPER_METRICS_PATH and
+    SCRAPER_METRICS_PORT, once per process, so counters keep growing
+    across runs.
+
+    :return: The Metrics, or None if metrics are off.
+    """
+    if not SCRAPER_METRICS_PATH and not SCRAPER_METRICS_PORT:
+        return None
+    metrics = Metrics(SCRAPER_METRICS_PATH or None)
+    if SCRAPER_METRICS_PORT:
+        metrics.serve(SCRAPER_METRICS_PORT)
+    return metrics
+
+
+def get_row_store():
+    """
+    Opens the row store configured by SCRAPER_ROW_STORE_DIR.
+
+    :return: A RowStore, or None if rows are not remembered.
+    """
+    if not SCRAPER_ROW_STORE_DIR:
+        return None
+    return RowStore(SCRAPER_ROW_STORE_DIR)
+
+
+def save_deals(caliber, data):
+    """
+    Stores the scraped deals in the database configured by SCRAPER_DB_PATH.
+
+    :param caliber: The caliber the deals were scraped for.
+    :param data: The list of scraped deals.
     """
-    Runs the scraper for a specific caliber.
+    if not SCRAPER_DB_PATH:
+        return
+    with DealStore(SCRAPER_DB_PATH) as store:
+        changed = store.save(caliber, data)
+    print(f"Stored {len(data)} deals for {caliber}, {changed} new or changed")
 
-    This function fetches the URL configurations for the given caliber,
-    initializes the scraper objects, and scrapes the data for ammo deals.
+
+def get_urls_for_caliber(caliber):
+    """
+    Reads the URLs configured for a specific caliber.
 
     :param caliber: The caliber for which to scrape ammo deals.
+    :return: A dictionary of the URL of each website.
     """
     # scraper = SportsmanfulfillmentScraper(
     #     "https://www.sportsmanfulfillment.com/shooting/ammo/rifle-ammo/#/filter:custom_caliber:7.62x39mm"
@@ -35,30 +141,249 @@ def run_scraper_for_caliber(caliber):
 
     # Parsing the URLs from the environment variable
     urls_list = config(url_key, "").split(",")
-    urls_dict = dict(item.split(";") for item in urls_list)
-    # Initializing the scraper objects
-    scrapers = []
-    for website, url in urls_dict.items():
+    return dict(item.split(";") for item in urls_list)
+
+
+def normalize_url(url):
+    """
+    Normalizes a URL so the same page configured twice compares equal.
+
+    The scheme and host are lowercased, a trailing slash is dropped and the
+    query parameters are sorted. The fragment is kept, since some sites
+    filter their listings by it.
+
+    :param url: The configured URL.
+    :return: The normalized URL.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/") or "/",
+            query,
+            parts.fragment,
+        )
+    )
+
+
+def plan_scrapers(calibers):
+    """
+    Builds one scraper per distinct page configured for the calibers.
+
+    Retailers often configure the same category page, like "rifle ammo",
+    for several calibers. It is scraped once and its listings are routed
+    to the calibers by route_results.
+
+    :param calibers: The calibers to scrape.
+    :return: A list of (scraper, calibers) tuples, where calibers lists the
+        calibers the scraper's page was configured for.
+    """
+    pages = {}
+    for caliber in calibers:
+        for website, url in get_urls_for_caliber(caliber).items():
+            key = (website.lower(), normalize_url(url))
+            pages.setdefault(key, (website, url, []))[2].append(caliber)
+    plan = []
+    for website, url, page_calibers in pages.values():
         scraper = get_scraper(website, url)
         if scraper:
-            scrapers.append(scraper)
+            plan.append((scraper, page_calibers))
         else:
             print(f"No scraper found for {website} - {url}")
-    # Initializing the ScraperBot with the scraper objects
-    bot = ScraperBot(scrapers=scrapers)
+    configured = sum(len(page_calibers) for _, _, page_calibers in pages.values())
+    print(f"Scraping {len(pages)} pages for {configured} caliber URLs")
+    return plan
+
+
+def route_results(plan, calibers):
+    """
+    Sorts the results of planned scrapers by caliber.
+
+    Results of a page configured for one caliber all go to it. Results of
+    a page shared by several go to each of those calibers their title
+    names, and are dropped if it names none of them.
+
+    :param plan: The (scraper, calibers) tuples from plan_scrapers, after
+        the scrapers ran.
+    :param calibers: The calibers to scrape.
+    :return: A dictionary of the deals of each caliber.
+    """
+    data = {caliber: [] for caliber in calibers}
+    for scraper, page_calibers in plan:
+        if len(page_calibers) == 1:
+            data[page_calibers[0]].extend(scraper.results)
+            continue
+        for result in scraper.results:
+            named = get_calibers(result["title"])
+            for caliber in page_calibers:
+                if caliber in named:
+                    data[caliber].append(result)
+    return data
+
+
+def report_results(data):
+    """
+    Prints and stores the deals of each caliber.
+
+    :param data: A dictionary of the deals of each caliber.
+    """
+    for caliber, deals in data.items():
+        pprint.pprint(deals)
+        print(f"Found {len(deals)} deals for {caliber}")
+        save_deals(caliber, deals)
+
+
+def make_bot(plan, session=None, profiles=None, profiler=None):
+    """
+    Builds the ScraperBot running the planned scrapers.
+
+    :param plan: The (scraper, calibers) tuples from plan_scrapers.
+    :param session: An optional started browser session to run on.
+    :param profiles: Optional browser profiles to run on instead.
+    :param profiler: An optional ScrapeProfiler to profile each scraper with.
+    :return: The ScraperBot.
+    """
+    return ScraperBot(
+        scrapers=[scraper for scraper, _ in plan],
+        concurrency=SCRAPER_CONCURRENCY,
+        session=session,
+        block_requests=SCRAPER_BLOCK_REQUESTS,
+        parser_backend=SCRAPER_PARSER,
+        cache=get_cache(),
+        row_store=get_row_store(),
+        profiles=profiles,
+        har_dir=SCRAPER_HAR_DIR,
+        har_mode=SCRAPER_HAR_MODE or None,
+        report_path=SCRAPER_REPORT_PATH or None,
+        metrics=get_metrics(),
+        profiler=profiler,
+    )
+
+
+def run_scrapers(calibers, session=None, profiles=None, profiler=None):
+    """
+    Runs the scrapers for several calibers.
+
+    This function fetches the URL configurations for the calibers, scrapes
+    each distinct page once, and reports the ammo deals of each caliber.
+
+    :param calibers: The calibers for which to scrape ammo deals.
+    :param session: An optional started BrowserSession to run on.
+    :param profiles: Optional BrowserProfiles to run on instead.
+    :param profiler: An optional ScrapeProfiler. Profiled scrapers run one
+        after another in this process.
+    """
+    plan = plan_scrapers(calibers)
+    bot = make_bot(plan, session, profiles, profiler)
     # Running the scrapers and printing the scraped data
-    data = bot.run()
-    pprint.pprint(data)
-    print(f"Found {len(data)} deals for {caliber}")
+    if SCRAPER_WORKERS > 1 and profiler is None:
+        bot.run_sharded(
+            SCRAPER_WORKERS,
+            use_async=SCRAPER_ASYNC,
+            profile_dir=SCRAPER_PROFILE_DIR or None,
+        )
+    else:
+        bot.run()
+    report_results(route_results(plan, calibers))
+
 
+async def run_scrapers_async(calibers, session=None, profiles=None):
+    """
+    Async counterpart of run_scrapers.
 
-def main():
+    :param calibers: The calibers for which to scrape ammo deals.
+    :param session: An optional started AsyncBrowserSession to run on.
+    :param profiles: Optional AsyncBrowserProfiles to run on instead.
+    """
+    plan = plan_scrapers(calibers)
+    bot = make_bot(plan, session, profiles)
+    if SCRAPER_PARSE_WORKERS:
+        await bot.run_pipelined(parse_workers=SCRAPER_PARSE_WORKERS)
+    else:
+        await bot.run_async()
+    report_results(route_results(plan, calibers))
+
+
+async def main_async():
+    """
+    Runs every caliber in the CALIBERS list on one async browser session,
+    or on the persistent profiles in SCRAPER_PROFILE_DIR.
+    """
+    if SCRAPER_PROFILE_DIR:
+        async with AsyncBrowserProfiles(SCRAPER_PROFILE_DIR) as profiles:
+            await run_scrapers_async(CALIBERS, profiles=profiles)
+        return
+    async with AsyncBrowserSession() as session:
+        await run_scrapers_async(CALIBERS, session)
+
+
+def main_profiled(profile_dir, top=DEFAULT_TOP):
+    """
+    Runs every caliber with each scraper's scrape profiled by cProfile,
+    one scraper after another on one browser, so each profile only holds
+    its own scraper's work. SCRAPER_ASYNC and SCRAPER_WORKERS are ignored.
+
+    :param profile_dir: The directory to write a .prof file per scraper
+        and summary.txt to.
+    :param top: The number of functions the summary lists.
+    """
+    profiler = ScrapeProfiler(profile_dir)
+    if SCRAPER_PROFILE_DIR:
+        with BrowserProfiles(SCRAPER_PROFILE_DIR) as profiles:
+            run_scrapers(CALIBERS, profiles=profiles, profiler=profiler)
+    else:
+        with BrowserSession() as session:
+            run_scrapers(CALIBERS, session, profiler=profiler)
+    print(profiler.write_summary(top))
+    print(f"Wrote {len(profiler.paths)} profiles to {profile_dir}")
+
+
+def main(profile_dir=None, profile_top=DEFAULT_TOP):
     """
     Main function to run the scraper for each caliber in the CALIBERS list.
+
+    Every caliber is scraped in one run, so a page configured for several
+    calibers is loaded once. Chromium is launched once, or once per
+    profile group with SCRAPER_PROFILE_DIR. Sharded runs launch a browser
+    per worker instead.
+
+    :param profile_dir: When set, profile each scraper into this directory
+        with main_profiled.
+    :param profile_top: The number of functions the profile summary lists.
     """
-    for caliber in CALIBERS:
-        run_scraper_for_caliber(caliber)
+    if SCRAPER_TITLE_CACHE_PATH:
+        classifier.load(SCRAPER_TITLE_CACHE_PATH)
+    if profile_dir:
+        main_profiled(profile_dir, profile_top)
+    elif SCRAPER_WORKERS > 1:
+        run_scrapers(CALIBERS)
+    elif SCRAPER_ASYNC:
+        asyncio.run(main_async())
+    elif SCRAPER_PROFILE_DIR:
+        with BrowserProfiles(SCRAPER_PROFILE_DIR) as profiles:
+            run_scrapers(CALIBERS, profiles=profiles)
+    else:
+        with BrowserSession() as session:
+            run_scrapers(CALIBERS, session)
+    if SCRAPER_TITLE_CACHE_PATH:
+        classifier.save(SCRAPER_TITLE_CACHE_PATH)
+    print(f"Title cache: {classifier.stats()}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Scrape ammo deals.")
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Profile each scraper with cProfile, writing the profiles here",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=DEFAULT_TOP,
+        help="How many functions the profile summary lists",
+    )
+    args = parser.parse_args()
+    main(args.profile, args.profile_top)
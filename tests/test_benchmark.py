@@ -0,0 +1,52 @@
+import os
+
+from bot.base.base_scraper import BaseScraper
+from bot.base.html_cache import HtmlCache
+from bot.benchmark import capture_fixtures, run_benchmark, site_key
+from bot.scrapers.basspro_scraper import BassproScraper
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class PagedScraper(BaseScraper):
+    def process_page(self, soup):
+        pass
+
+    def get_next_url(self, soup):
+        link = soup.find("a")
+        return f"https://shop.example{link.get('href')}" if link else None
+
+
+def test_capture_follows_the_cached_pages(tmp_path):
+    cache = HtmlCache(str(tmp_path / "cache"))
+    cache.store("https://shop.example/1", "browser", '<a href="/2">')
+    cache.store("https://shop.example/2", "http", "<p>Last page</p>")
+
+    paths = capture_fixtures(
+        PagedScraper("https://shop.example/1"),
+        cache,
+        str(tmp_path / "fixtures"),
+        site="paged",
+    )
+
+    assert len(paths) == 2
+    assert [os.path.dirname(path) for path in paths] == [
+        str(tmp_path / "fixtures" / "paged")
+    ] * 2
+    with open(paths[1], encoding="utf-8") as f:
+        assert f.read() == "<p>Last page</p>"
+
+
+def test_captured_fixtures_are_benchmarked(tmp_path):
+    url = "https://www.basspro.com/shop/en/handgun-ammo"
+    with open(os.path.join(FIXTURE_DIR, "basspro.html"), encoding="utf-8") as f:
+        html = f.read()
+    cache = HtmlCache(str(tmp_path / "cache"))
+    cache.store(url, "browser", html)
+
+    assert site_key(BassproScraper) == "basspro"
+    capture_fixtures(BassproScraper(url), cache, str(tmp_path / "fixtures"))
+    report = run_benchmark(str(tmp_path / "fixtures"), iterations=1, sites=["basspro"])
+
+    assert report["sites"]["basspro"]["pages"] == 1
+    assert report["sites"]["basspro"]["results_per_page"] == 2
@@ -0,0 +1,144 @@
+import os
+
+import pytest
+
+import bot.base.browser_session as browser_session
+from bot.base.base_scraper import BaseScraper, ScraperBot
+from bot.base.browser_session import BrowserProfiles
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.url = "about:blank"
+        self.closed = False
+
+    def goto(self, url, wait_until=None):
+        self.url = url
+        return None
+
+    def content(self):
+        return self.context.pages_html[self.url]
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, user_data_dir, pages_html):
+        self.user_data_dir = user_data_dir
+        self.pages_html = pages_html
+        self.closed = False
+
+    def new_page(self):
+        return FakePage(self)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self, pages_html):
+        self.pages_html = pages_html
+        self.contexts = []
+
+    def launch_persistent_context(self, user_data_dir, **kwargs):
+        context = FakeContext(user_data_dir, self.pages_html)
+        self.contexts.append(context)
+        return context
+
+
+class FakePlaywright:
+    def __init__(self, pages_html):
+        self.chromium = FakeChromium(pages_html)
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+class FakeSyncPlaywright:
+    """
+    Stands in for sync_playwright, failing like it does when started a
+    second time in the same thread.
+    """
+
+    def __init__(self, pages_html):
+        self.pages_html = pages_html
+        self.started = []
+
+    def __call__(self):
+        return self
+
+    def start(self):
+        if self.started:
+            raise RuntimeError(
+                "It looks like you are using Playwright Sync API inside the "
+                "asyncio loop."
+            )
+        self.started.append(FakePlaywright(self.pages_html))
+        return self.started[0]
+
+
+class TitleScraper(BaseScraper):
+    def process_page(self, soup):
+        for row in soup.find_all("li"):
+            self.process_row(row)
+
+    def extract_product_info(self, row):
+        self.results.append({"title": row.text})
+
+
+class FirstGroupScraper(TitleScraper):
+    profile_group = "first"
+
+
+class SecondGroupScraper(TitleScraper):
+    profile_group = "second"
+
+
+def test_run_starts_playwright_once_for_two_profile_groups(tmp_path, monkeypatch):
+    pages_html = {
+        "https://first.example/ammo": "<ul><li>First 9mm</li></ul>",
+        "https://second.example/ammo": "<ul><li>Second 9mm</li></ul>",
+    }
+    fake = FakeSyncPlaywright(pages_html)
+    monkeypatch.setattr(browser_session, "sync_playwright", fake)
+    scrapers = [
+        FirstGroupScraper("https://first.example/ammo"),
+        SecondGroupScraper("https://second.example/ammo"),
+    ]
+
+    with BrowserProfiles(str(tmp_path)) as profiles:
+        results = ScraperBot(
+            scrapers=scrapers, profiles=profiles, block_requests=False
+        ).run()
+
+    assert [result["title"] for result in results] == ["First 9mm", "Second 9mm"]
+    assert len(fake.started) == 1
+    playwright = fake.started[0]
+    assert [context.user_data_dir for context in playwright.chromium.contexts] == [
+        os.path.join(str(tmp_path), "first"),
+        os.path.join(str(tmp_path), "second"),
+    ]
+    assert all(context.closed for context in playwright.chromium.contexts)
+    assert playwright.stopped
+
+
+def test_har_mode_with_profiles_is_rejected_before_the_run(tmp_path):
+    scrapers = [FirstGroupScraper("https://first.example/ammo")]
+
+    with pytest.raises(ValueError):
+        ScraperBot(
+            scrapers=scrapers,
+            profiles=BrowserProfiles(str(tmp_path)),
+            har_dir=str(tmp_path / "hars"),
+            har_mode="replay",
+        )
+    with pytest.raises(ValueError):
+        ScraperBot(
+            scrapers=scrapers, har_dir=str(tmp_path / "hars"), har_mode="replay"
+        ).run_sharded(2, profile_dir=str(tmp_path))
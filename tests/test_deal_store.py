@@ -0,0 +1,69 @@
+import sqlite3
+
+from bot.base.deal_store import DealStore
+
+
+def deal(link, cpr):
+    return {
+        "link": link,
+        "title": "Federal 5.56 NATO / .223 Rem 55gr FMJ - 20 Rounds",
+        "manufacturer": "Federal",
+        "website": "Test Ammo",
+        "original_price": f"{cpr * 20:.2f}",
+        "cpr": f"{cpr:.2f}",
+    }
+
+
+def test_a_listing_saved_for_two_calibers_is_kept_under_both(tmp_path):
+    with DealStore(str(tmp_path / "deals.db")) as store:
+        assert store.save("556", [deal("https://a.example/1", 0.45)], 1.0) == 1
+        assert store.save("223", [deal("https://a.example/1", 0.45)], 1.0) == 0
+
+        assert [row["link"] for row in store.latest(caliber="556")] == [
+            "https://a.example/1"
+        ]
+        assert [row["link"] for row in store.latest(caliber="223")] == [
+            "https://a.example/1"
+        ]
+        assert store.latest(caliber="9mm") == []
+        assert len(store.history("https://a.example/1")) == 1
+
+
+def test_a_database_with_one_caliber_per_listing_is_migrated(tmp_path):
+    path = str(tmp_path / "deals.db")
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        """
+        CREATE TABLE listings (
+            link TEXT PRIMARY KEY,
+            caliber TEXT NOT NULL,
+            title TEXT,
+            manufacturer TEXT,
+            website TEXT,
+            image TEXT,
+            steel_casing INTEGER,
+            remanufactured INTEGER,
+            original_price REAL,
+            cpr REAL,
+            first_seen REAL NOT NULL,
+            last_seen REAL NOT NULL,
+            last_changed REAL NOT NULL
+        );
+        CREATE INDEX listings_caliber ON listings (caliber);
+        INSERT INTO listings VALUES (
+            'https://a.example/1', '556', 'Federal', 'Federal', 'Test Ammo',
+            NULL, 0, 0, 9.0, 0.45, 1.0, 1.0, 1.0
+        );
+        """
+    )
+    connection.close()
+
+    with DealStore(path) as store:
+        store.save("223", [deal("https://a.example/1", 0.45)], 2.0)
+
+        assert [row["link"] for row in store.latest(caliber="556")] == [
+            "https://a.example/1"
+        ]
+        assert [row["link"] for row in store.latest(caliber="223")] == [
+            "https://a.example/1"
+        ]
@@ -0,0 +1,51 @@
+import bot.base.http_fetcher as http_fetcher
+from bot.base.base_scraper import BaseScraper
+from bot.base.html_cache import HtmlCache
+
+
+class NotModifiedSession:
+    """
+    Answers every request with 304, like a server whose HTML shell did
+    not change.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, **kwargs):
+        self.requests.append(url)
+        return NotModified()
+
+
+class NotModified:
+    status_code = 304
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def test_stale_rendered_page_is_not_revalidated(tmp_path, monkeypatch):
+    session = NotModifiedSession()
+    monkeypatch.setattr(http_fetcher, "get_session", lambda: session)
+    cache = HtmlCache(str(tmp_path), ttl=60)
+    scraper = BaseScraper("https://shop.example/ammo")
+    scraper.cache = cache
+    # The document response of a rendered page carries the shell's ETag
+    cache.store(
+        scraper.url,
+        "browser",
+        "<ul><li>Federal 9mm - 50 Rounds</li></ul>",
+        etag='"shell"',
+    )
+
+    assert scraper.cached_html() == "<ul><li>Federal 9mm - 50 Rounds</li></ul>"
+
+    entry = cache.load(scraper.url, "browser")
+    entry.fetched_at -= 120
+    cache.write_meta(entry)
+
+    assert scraper.cached_html() is None
+    assert session.requests == []
@@ -0,0 +1,25 @@
+import requests
+
+from bot.base.http_fetcher import response_html
+
+
+def make_response(body, content_type):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers["Content-Type"] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def test_response_html_detects_utf8_without_charset():
+    title = "<h2>Sellier & Bellot 9mm 115gr FMJ – 50 Rounds, 1.150 ft/s°</h2>"
+    response = make_response(title.encode("utf-8") * 20, "text/html")
+
+    assert response_html(response) == title * 20
+
+
+def test_response_html_keeps_the_declared_charset():
+    response = make_response("Café".encode("latin-1"), "text/html; charset=ISO-8859-1")
+
+    assert response_html(response) == "Café"
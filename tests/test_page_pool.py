@@ -0,0 +1,79 @@
+import asyncio
+
+from bot.base.page_pool import AsyncPagePool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    async def goto(self, url):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+
+def open_pages(*contexts):
+    return sum(not page.closed for context in contexts for page in context.pages)
+
+
+def test_pools_sharing_a_cap_close_each_others_idle_pages():
+    async def run():
+        semaphore = asyncio.Semaphore(2)
+        pools = []
+        first, second = FakeContext(), FakeContext()
+        first_pool = AsyncPagePool(first, max_pages=2, semaphore=semaphore, pools=pools)
+        second_pool = AsyncPagePool(
+            second, max_pages=2, semaphore=semaphore, pools=pools
+        )
+
+        async with first_pool.page(), first_pool.page():
+            pass
+        assert len(first_pool.idle) == 2
+
+        async with second_pool.page(), second_pool.page():
+            assert open_pages(first, second) == 2
+        assert first_pool.idle == []
+
+        async with first_pool.page() as page:
+            assert page.context is first
+            assert open_pages(first, second) == 2
+
+    asyncio.run(run())
+
+
+def test_reserved_slots_count_against_the_cap():
+    async def run():
+        semaphore = asyncio.Semaphore(2)
+        pools = []
+        first, second = FakeContext(), FakeContext()
+        first_pool = AsyncPagePool(first, max_pages=2, semaphore=semaphore, pools=pools)
+        second_pool = AsyncPagePool(
+            second, max_pages=2, semaphore=semaphore, pools=pools
+        )
+
+        async with first_pool.page():
+            pass
+        async with first_pool.page(), second_pool.reserved():
+            assert semaphore.locked()
+            assert first_pool.total_open_pages() == 2
+        async with second_pool.reserved(), second_pool.reserved():
+            assert first_pool.idle == []
+        assert first_pool.total_open_pages() == 0
+
+    asyncio.run(run())
@@ -0,0 +1,52 @@
+from bot.base.base_scraper import BaseScraper
+from bot.base.row_store import RowStore
+
+HTML = (
+    "<ul>"
+    "<li>Federal 9mm Luger 115gr FMJ - 50 Rounds</li>"
+    "<li>Range Bag</li>"
+    "<li>Winchester 9mm Luger 115gr FMJ</li>"
+    "</ul>"
+)
+
+
+class ListScraper(BaseScraper):
+    extracted = 0
+
+    def process_page(self, soup):
+        for row in soup.find_all("li"):
+            self.process_row(row)
+
+    def extract_product_info(self, row):
+        ListScraper.extracted += 1
+        title = row.text
+        if "Federal" in title:
+            self.results.append({"title": title})
+        elif "Winchester" in title:
+            self.drop("round_count")
+        else:
+            self.drop("manufacturer")
+
+
+def scrape(row_store):
+    scraper = ListScraper("https://shop.example/9mm")
+    scraper.row_store = row_store
+    scraper.load_rows()
+    scraper.process_html(HTML)
+    scraper.save_rows()
+    return scraper
+
+
+def test_reused_rows_count_their_drops_again(tmp_path):
+    row_store = RowStore(str(tmp_path))
+    first = scrape(row_store)
+    extracted = ListScraper.extracted
+
+    second = scrape(row_store)
+
+    assert ListScraper.extracted == extracted
+    assert second.results == first.results
+    assert second.stats.drops == first.stats.drops == {
+        "manufacturer": 1,
+        "round_count": 1,
+    }
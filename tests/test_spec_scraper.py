@@ -0,0 +1,106 @@
+import logging
+
+from bs4 import BeautifulSoup
+
+from bot.scrapers.ammo4patriots_scraper import Ammo4patriotsScraper
+from bot.scrapers.canoeclubusa_scraper import CanoeclubusaScraper
+from bot.scrapers.tacticalshit_scraper import TacticalshitScraper
+
+
+def card(title, brand, price, image="/images/box.jpg", stock=""):
+    return (
+        '<li class="product">'
+        f'<a href="/products/{price}"><img data-src="{image}"></a>'
+        f'<span class="stock-message">{stock}</span>'
+        f'<h4 class="card-title">{title}</h4>'
+        f'<p class="card-text brand-name">{brand}</p>'
+        f'<span class="price price--withoutTax">${price}</span>'
+        "</li>"
+    )
+
+
+def product_grid(*cards):
+    return (
+        f'<html><body><ul class="productGrid">{"".join(cards)}</ul>'
+        '<ul class="pagination-list"><li class="pagination-item pagination-item--next">'
+        '<a href="/ammo/?page=2">Next</a></li></ul></body></html>'
+    )
+
+
+def test_brand_and_sold_out_text():
+    scraper = Ammo4patriotsScraper("https://ammo4patriots.com/ammo/")
+
+    scraper.process_html(
+        product_grid(
+            card("9mm 115gr FMJ - 50 Rounds", "Federal", "20.00", stock="In stock"),
+            card("9mm 124gr FMJ - 50 Rounds", "CCI", "22.00", stock="Out of Stock"),
+            card("9mm 147gr FMJ - 50 Rounds", "Nobody", "24.00"),
+        )
+    )
+
+    assert [
+        (result["manufacturer"], result["original_price"], result["cpr"])
+        for result in scraper.results
+    ] == [("Federal", "20.00", "0.40")]
+    assert scraper.stats.drops == {"manufacturer": 1}
+
+
+def test_next_link_follows_pagination():
+    scraper = Ammo4patriotsScraper("https://ammo4patriots.com/ammo/")
+    soup = BeautifulSoup(product_grid(), "html.parser")
+
+    assert scraper.get_next_url(soup) == "/ammo/?page=2"
+
+
+def test_placeholder_image_skips_row():
+    scraper = CanoeclubusaScraper("https://canoeclubusa.com/ammo/")
+
+    scraper.process_html(
+        product_grid(
+            card("9mm 115gr FMJ - 50 Rounds", "Federal", "20.00"),
+            card(
+                "9mm 124gr FMJ - 50 Rounds",
+                "Federal",
+                "22.00",
+                image="/stencil/ProductDefault.gif",
+            ),
+        )
+    )
+
+    assert [result["title"] for result in scraper.results] == [
+        "9mm 115gr FMJ - 50 Rounds"
+    ]
+
+
+def test_sale_price_comes_first():
+    scraper = TacticalshitScraper("https://tacticalshit.com/ammo")
+    row = (
+        '<li class="item"><div class="product-top"></div>'
+        '<a class="product-item-link" href="/federal-9mm">'
+        "Federal 9mm 115gr FMJ - 50 Rounds</a>"
+        '<img src="/images/federal.jpg">'
+        '<span class="special-price"><span class="price">$18.00</span></span>'
+        '<span class="old-price"><span class="price">$20.00</span></span>'
+        "</li>"
+    )
+
+    scraper.process_html(
+        '<div class="products wrapper grid products-grid">'
+        f'<ol class="products list items product-items row row-col-lg-3">{row}</ol>'
+        "</div>"
+    )
+
+    assert [
+        (result["manufacturer"], result["original_price"], result["cpr"])
+        for result in scraper.results
+    ] == [("Federal", "18.00", "0.36")]
+
+
+def test_missing_listing_is_logged(caplog):
+    scraper = CanoeclubusaScraper("https://canoeclubusa.com/ammo/")
+
+    with caplog.at_level(logging.WARNING, logger="bot.base.spec_scraper"):
+        scraper.process_html("<html><body></body></html>")
+
+    assert scraper.results == []
+    assert "No listing found on https://canoeclubusa.com/ammo/" in caplog.text
@@ -0,0 +1,149 @@
+import json
+import os
+
+from bot.scrapers.basspro_scraper import BassproScraper
+from bot.scrapers.cabelas_scraper import CabelasScraper
+from bot.scrapers.meadammo_scraper import MeadammoScraper
+from bot.scrapers.sgammo_scraper import SgammoScraper
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def read_fixture(site):
+    with open(os.path.join(FIXTURE_DIR, f"{site}.html"), encoding="utf-8") as f:
+        return f.read()
+
+
+def json_ld_page(*titles):
+    products = [
+        {
+            "@type": "Product",
+            "name": title,
+            "url": f"/products/{index}",
+            "image": f"/images/{index}.jpg",
+            "offers": {
+                "@type": "Offer",
+                "price": "20.00",
+                "availability": "https://schema.org/InStock",
+            },
+        }
+        for index, title in enumerate(titles)
+    ]
+    payload = {"@context": "https://schema.org", "@graph": products}
+    return (
+        '<html><head><script type="application/ld+json">'
+        f"{json.dumps(payload)}</script></head><body></body></html>"
+    )
+
+
+def no_soup(html):
+    raise AssertionError("the page was parsed into soup")
+
+
+def test_basspro_reads_next_data(monkeypatch):
+    scraper = BassproScraper("https://www.basspro.com/shop/en/handgun-ammo")
+    monkeypatch.setattr(scraper, "make_soup", no_soup)
+
+    assert scraper.process_html(read_fixture("basspro")) is None
+
+    assert scraper.results == [
+        {
+            "title": (
+                "Federal American Eagle 9mm Luger 115 Grain FMJ Handgun Ammo"
+                " - 50 Rounds"
+            ),
+            "steel_casing": False,
+            "remanufactured": False,
+            "manufacturer": "Federal",
+            "link": (
+                "https://www.basspro.com/p/federal-american-eagle-9mm-luger"
+                "-handgun-ammo"
+            ),
+            "image": "https://basspro.scene7.com/is/image/BassPro/3367_main",
+            "website": "Bass Pro",
+            "original_price": "18.99",
+            "cpr": "0.38",
+        },
+        {
+            "title": "Hornady Critical Defense .380 ACP 90 Grain FTX - 25 Rounds",
+            "steel_casing": False,
+            "remanufactured": False,
+            "manufacturer": "Hornady",
+            "link": "https://www.basspro.com/p/hornady-critical-defense-380-acp",
+            "image": "https://basspro.scene7.com/is/image/BassPro/6021_main",
+            "website": "Bass Pro",
+            "original_price": "29.99",
+            "cpr": "1.20",
+        },
+    ]
+    assert scraper.stats.rows_found == 3
+    assert scraper.stats.drops == {"manufacturer": 1}
+
+
+def test_cabelas_reads_next_data(monkeypatch):
+    scraper = CabelasScraper("https://www.cabelas.com/shop/en/rifle-ammo")
+    monkeypatch.setattr(scraper, "make_soup", no_soup)
+
+    assert scraper.process_html(read_fixture("cabelas")) is None
+
+    assert [
+        (
+            result["manufacturer"],
+            result["steel_casing"],
+            result["link"],
+            result["website"],
+            result["original_price"],
+            result["cpr"],
+        )
+        for result in scraper.results
+    ] == [
+        (
+            "CCI",
+            False,
+            "https://www.cabelas.com/p/cci-blazer-brass-9mm-luger-1000-rounds",
+            "Cabela's",
+            "1099.99",
+            "1.10",
+        ),
+        (
+            "Wolf",
+            True,
+            "https://www.cabelas.com/p/wolf-polyformance-7-62x39mm-20-rounds",
+            "Cabela's",
+            "8.99",
+            "0.45",
+        ),
+    ]
+    assert scraper.stats.rows_found == 3
+    assert scraper.stats.drops == {"manufacturer": 1}
+
+
+def test_structured_listings_use_spec_title_hooks(monkeypatch):
+    monkeypatch.setattr(MeadammoScraper, "structured_data", True)
+    scraper = MeadammoScraper("https://meadammo.com/shop/")
+
+    scraper.process_html(
+        json_ld_page("9mm 115gr FMJ - 50 Rounds", "223 Rem 55gr FMJ - 50 Rounds")
+    )
+
+    assert [
+        (result["title"], result["manufacturer"], result["website"])
+        for result in scraper.results
+    ] == [("9mm 115gr FMJ - 50 Rounds", "Mead Ammo", "Mead Ammo")]
+
+
+def test_structured_listings_skip_sgammo_223(monkeypatch):
+    monkeypatch.setattr(SgammoScraper, "structured_data", True)
+    scraper = SgammoScraper("https://www.sgammo.com/catalog/pistol-ammo")
+
+    scraper.process_html(
+        json_ld_page(
+            "Federal 9mm 115gr FMJ - 50 Rounds",
+            "Federal .223 Rem 55gr FMJ - 20 Rounds",
+        )
+    )
+
+    assert [(result["title"], result["website"]) for result in scraper.results] == [
+        ("Federal 9mm 115gr FMJ - 50 Rounds", "SG Ammo")
+    ]
@@ -0,0 +1,37 @@
+import json
+
+from bot.base.title_classifier import TitleClass, TitleClassifier
+
+TITLE = "Federal American Eagle 9mm Luger 115 Grain FMJ - 50 Rounds"
+
+
+def test_saved_classifications_are_loaded(tmp_path):
+    path = str(tmp_path / "titles.json")
+    saved = TitleClassifier()
+    saved.classify(TITLE)
+    saved.save(path)
+
+    loaded = TitleClassifier()
+    loaded.load(path)
+
+    assert loaded.classify(TITLE) == TitleClass("Federal", False, False, 50)
+    assert loaded.stats()["hits"] == 1
+
+
+def test_classifications_of_other_code_are_discarded(tmp_path):
+    path = tmp_path / "titles.json"
+    stale = [TITLE, "", 0, ["Winchester", False, False, 20]]
+    path.write_text(json.dumps({"version": "outdated", "entries": [stale]}))
+
+    classifier = TitleClassifier()
+    classifier.load(str(path))
+
+    assert classifier.classify(TITLE) == TitleClass("Federal", False, False, 50)
+    assert classifier.stats()["hits"] == 0
+
+    # Files from before the cache had a version are discarded too
+    path.write_text(json.dumps([stale]))
+    classifier = TitleClassifier()
+    classifier.load(str(path))
+
+    assert classifier.stats()["size"] == 0